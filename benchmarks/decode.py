@@ -0,0 +1,138 @@
+"""Compare the upstream response decoders.
+
+Checks that the pydantic and msgspec decoders produce the same JSON output
+for every response model, then times parsing and decoding of
+ListAllVideosResponse payloads. The lazy decoder returns unread parts as
+received, so it is only timed.
+
+Usage: uv run python benchmarks/decode.py [ITEMS ...]
+"""
+
+import json
+import sys
+import time
+
+from serde import video
+
+from restate_youtube import (
+    ListAllChannelsResponse,
+    ListAllPlaylistItemsResponse,
+    ListAllPlaylistsResponse,
+    ListAllVideosResponse,
+    ListChannelsResponse,
+    ListPlaylistItemsResponse,
+    ListPlaylistsResponse,
+    ListVideosResponse,
+)
+from restate_youtube.decode import Decoder, LazyDecoder, MsgspecDecoder, encode_json
+
+CHANNEL = {
+    "kind": "youtube#channel",
+    "id": "UC" + "x" * 22,
+    "snippet": {
+        "title": "Channel",
+        "description": "About",
+        "customUrl": "@channel",
+        "publishedAt": "2010-01-01T00:00:00.5Z",
+        "thumbnails": {"default": {"url": "https://yt3.ggpht.com/a"}},
+        "country": "US",
+    },
+    "contentDetails": {"relatedPlaylists": {"likes": "", "uploads": "UU" + "x" * 22}},
+    "statistics": {
+        "viewCount": "123456",
+        "subscriberCount": "1000",
+        "hiddenSubscriberCount": False,
+        "videoCount": "42",
+    },
+    "status": {"privacyStatus": "public", "longUploadsStatus": "allowed"},
+    "localizations": {"en": {"title": "Channel", "description": "About"}},
+}
+
+PLAYLIST = {
+    "kind": "youtube#playlist",
+    "id": "PL" + "x" * 32,
+    "snippet": {
+        "publishedAt": "2020-01-01T00:00:00Z",
+        "channelId": "UC" + "x" * 22,
+        "title": "Playlist",
+        "description": "",
+    },
+    "status": {"privacyStatus": "public", "podcastStatus": "disabled"},
+    "contentDetails": {"itemCount": 12},
+}
+
+PLAYLIST_ITEM = {
+    "kind": "youtube#playlistItem",
+    "id": "UE" + "x" * 32,
+    "snippet": {
+        "publishedAt": "2024-01-01T00:00:00Z",
+        "title": "Video",
+        "playlistId": "PL" + "x" * 32,
+        "position": 3,
+        "resourceId": {"kind": "youtube#video", "videoId": "00000000001"},
+    },
+    "contentDetails": {
+        "videoId": "00000000001",
+        "videoPublishedAt": "2023-12-31T00:00:00Z",
+    },
+    "status": {"privacyStatus": "unlisted"},
+}
+
+SAMPLES = [
+    (ListAllVideosResponse, {"items": [video(i) for i in range(3)]}),
+    (ListVideosResponse, {"items": [video(1)], "nextPageToken": "CAEQAA"}),
+    (ListAllChannelsResponse, {"items": [CHANNEL]}),
+    (ListChannelsResponse, {"items": [CHANNEL], "pageInfo": {"totalResults": 1}}),
+    (ListAllPlaylistsResponse, {"items": [PLAYLIST]}),
+    (ListPlaylistsResponse, {"items": [PLAYLIST], "etag": "e"}),
+    (ListAllPlaylistItemsResponse, {"items": [PLAYLIST_ITEM]}),
+    (ListPlaylistItemsResponse, {"items": [PLAYLIST_ITEM]}),
+]
+
+
+def check_parity(decoders: dict[str, Decoder]):
+    for model, data in SAMPLES:
+        outputs = {
+            name: encode_json(decoder.validate(model, data))
+            for name, decoder in decoders.items()
+        }
+        expected = outputs.pop("pydantic")
+
+        for name, output in outputs.items():
+            if json.loads(output) != json.loads(expected):
+                raise SystemExit(f"{name} output differs for {model.__name__}")
+
+    print(f"Output parity: {len(SAMPLES)} models OK")
+
+
+def main(sizes: list[int]):
+    decoders = {"pydantic": Decoder(), "msgspec": MsgspecDecoder()}
+
+    check_parity(decoders)
+
+    decoders["lazy"] = LazyDecoder()
+
+    print(f"{'items':>7} {'decoder':<10} {'parse ms':>10} {'validate ms':>12}")
+
+    for size in sizes:
+        content = json.dumps({"items": [video(i) for i in range(size)]}).encode()
+        rounds = max(1, 2000 // size)
+
+        for name, decoder in decoders.items():
+            start = time.perf_counter()
+            for _ in range(rounds):
+                data = decoder.loads(content)
+            parse = (time.perf_counter() - start) / rounds
+
+            start = time.perf_counter()
+            for _ in range(rounds):
+                decoder.validate(ListAllVideosResponse, data)
+            validate = (time.perf_counter() - start) / rounds
+
+            print(
+                f"{size:>7} {name:<10} {parse * 1000:>10.2f} {validate * 1000:>12.2f}"
+            )
+
+
+if __name__ == "__main__":
+    main([int(arg) for arg in sys.argv[1:]] or [50, 1_000, 10_000])
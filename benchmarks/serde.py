@@ -0,0 +1,105 @@
+"""Compare journal payload size and encode/decode time of the Restate serdes.
+
+Usage: uv run python benchmarks/serde.py [ITEMS ...]
+"""
+
+import sys
+import time
+
+from restate.serde import PydanticJsonSerde, Serde
+
+from restate_youtube import ListAllVideosResponse
+from restate_youtube.serde import ModelSerde
+
+
+def video(i: int) -> dict:
+    thumbnail = {"url": f"https://i.ytimg.com/vi/{i:011d}/default.jpg", "width": 120}
+
+    return {
+        "kind": "youtube#video",
+        "etag": f"etag-{i:020d}",
+        "id": f"{i:011d}",
+        "snippet": {
+            "publishedAt": "2024-05-01T12:00:00Z",
+            "channelId": "UC" + "x" * 22,
+            "title": f"Video {i}",
+            "description": "Lorem ipsum dolor sit amet. " * 20,
+            "thumbnails": {"default": thumbnail, "medium": thumbnail},
+            "channelTitle": "Channel",
+            "tags": ["music", "live", "official"],
+            "categoryId": "10",
+            "liveBroadcastContent": "none",
+            "localized": {"title": f"Video {i}", "description": "Lorem ipsum"},
+        },
+        "contentDetails": {
+            "duration": "PT4M13S",
+            "dimension": "2d",
+            "definition": "hd",
+            "caption": "false",
+            "licensedContent": True,
+            "projection": "rectangular",
+        },
+        "status": {
+            "uploadStatus": "processed",
+            "privacyStatus": "public",
+            "license": "youtube",
+            "embeddable": True,
+            "publicStatsViewable": True,
+            "madeForKids": False,
+        },
+        "statistics": {
+            "viewCount": str(i * 1000),
+            "likeCount": str(i * 10),
+            "favoriteCount": "0",
+            "commentCount": str(i),
+        },
+    }
+
+
+def bench(serde: Serde, response: ListAllVideosResponse, rounds: int):
+    buf = serde.serialize(response)
+
+    start = time.perf_counter()
+    for _ in range(rounds):
+        serde.serialize(response)
+    encode = (time.perf_counter() - start) / rounds
+
+    start = time.perf_counter()
+    for _ in range(rounds):
+        serde.deserialize(buf)
+    decode = (time.perf_counter() - start) / rounds
+
+    return len(buf), encode, decode
+
+
+def main(sizes: list[int]):
+    serdes: dict[str, Serde] = {
+        "pydantic": PydanticJsonSerde(ListAllVideosResponse),
+        "compact": ModelSerde(ListAllVideosResponse, exclude_none=True),
+        "compact+zstd": ModelSerde(
+            ListAllVideosResponse,
+            exclude_none=True,
+            compression_threshold=0,
+        ),
+    }
+
+    print(
+        f"{'items':>7} {'serde':<14} {'bytes':>12} {'encode ms':>10} {'decode ms':>10}"
+    )
+
+    for size in sizes:
+        response = ListAllVideosResponse.model_validate(
+            {"items": [video(i) for i in range(size)]}
+        )
+        rounds = max(1, 2000 // size)
+
+        for name, serde in serdes.items():
+            size_bytes, encode, decode = bench(serde, response, rounds)
+            print(
+                f"{size:>7} {name:<14} {size_bytes:>12,} "
+                f"{encode * 1000:>10.2f} {decode * 1000:>10.2f}"
+            )
+
+
+if __name__ == "__main__":
+    main([int(arg) for arg in sys.argv[1:]] or [50, 1_000, 10_000])
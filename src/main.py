@@ -1,12 +1,51 @@
 import logging
+from collections.abc import Callable
+from functools import partial
+from typing import Literal
 
+import boto3
 import restate
 import structlog
 from googleapiclient.discovery import build
+from googleapiclient.http import build_http
+from opentelemetry import metrics, trace
+from opentelemetry.exporter.otlp.proto.http.metric_exporter import OTLPMetricExporter
+from opentelemetry.exporter.otlp.proto.http.trace_exporter import OTLPSpanExporter
+from opentelemetry.exporter.prometheus import PrometheusMetricReader
+from opentelemetry.sdk.metrics import MeterProvider
+from opentelemetry.sdk.metrics.export import PeriodicExportingMetricReader
+from opentelemetry.sdk.resources import Resource
+from opentelemetry.sdk.trace import TracerProvider
+from opentelemetry.sdk.trace.export import BatchSpanProcessor
+from prometheus_client import start_http_server
 from pydantic import Field
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
-from .restate_youtube import Executor, create_service
+from .restate_youtube import (
+    CircuitBreaker,
+    Decoder,
+    Executor,
+    FairScheduler,
+    Hedger,
+    LazyDecoder,
+    LocalOffloader,
+    ModelSerde,
+    MsgspecDecoder,
+    Observer,
+    Observers,
+    ProfilingObserver,
+    Recorder,
+    ResolutionCache,
+    S3Offloader,
+    SQLiteResolutionStore,
+    SQLiteResponseCache,
+    TenantPolicy,
+    create_live_poller,
+    create_playlist_differ,
+    create_prefetcher,
+    create_service,
+)
+from .restate_youtube.telemetry import TelemetryObserver
 
 
 class Settings(BaseSettings):
@@ -18,21 +57,197 @@ class Settings(BaseSettings):
 
     identity_keys: list[str] = Field(alias="restate_identity_keys", default=[])
 
+    max_concurrency: int = 8
+
+    # Fair scheduling policies by tenant
+    # (e.g. TENANT_POLICIES='{"crawler": {"weight": 0.5, "maxConcurrency": 2}}')
+    tenant_policies: dict[str, TenantPolicy] = {}
+    default_tenant_policy: TenantPolicy | None = None
+
+    # Fail upstream calls fast while the API is degraded
+    circuit_breaker_enabled: bool = True
+    circuit_failure_rate_threshold: float = 0.5
+    circuit_slow_call_duration: float = 10.0
+    circuit_open_duration: float = 30.0
+
+    # Duplicate single-page calls slower than this percentile of recent calls
+    hedging_enabled: bool = False
+    hedge_percentile: float = 95
+    # Hedges per call at most
+    hedge_budget: float = 0.05
+
+    # Decoder of upstream responses (see README)
+    decoder: Literal["pydantic", "msgspec", "lazy"] = "pydantic"
+
+    # zstd-compress journal entries of at least this many bytes
+    journal_compression_threshold: int | None = None
+
+    recording_path: str | None = None
+
+    telemetry_enabled: bool = False
+    metrics_port: int = 9464
+    otlp_enabled: bool = False
+
+    profile_dir: str | None = None
+    profile_sample_rate: float = 0.01
+    profile_threshold: float = 10.0
+
+    # Credentials are read from the standard AWS_* variables
+    offload_bucket: str | None = None
+    offload_endpoint_url: str | None = None
+    offload_prefix: str = ""
+    offload_threshold: int = 4 * 1024 * 1024
+    offload_dir: str | None = None
+
+    # Persist handle/username resolutions in an SQLite database
+    resolution_cache_path: str | None = None
+
+    # Cache upstream responses in an SQLite database shared by the workers
+    response_cache_path: str | None = None
+    response_cache_max_size: int = 256 * 1024 * 1024
+    # Seconds per resource (e.g. RESPONSE_CACHE_TTLS='{"videos": 60}')
+    response_cache_ttls: dict[str, float] | None = None
+
 
 settings = Settings()  # pyright: ignore[reportCallIssue]
 
 # logging.basicConfig(level=logging.INFO)
 structlog.stdlib.recreate_defaults(log_level=logging.INFO)
 
+observers: list[Observer] = []
+
+if settings.recording_path:
+    observers.append(Recorder.open(settings.recording_path))
+
+if settings.telemetry_enabled:
+    resource = Resource.create({"service.name": settings.service_name})
+    metric_readers = [PrometheusMetricReader()]
+    tracer_provider = TracerProvider(resource=resource)
+
+    # OTLP exporters are configured through the standard OTEL_EXPORTER_OTLP_* variables
+    if settings.otlp_enabled:
+        metric_readers.append(PeriodicExportingMetricReader(OTLPMetricExporter()))
+        tracer_provider.add_span_processor(BatchSpanProcessor(OTLPSpanExporter()))
+
+    trace.set_tracer_provider(tracer_provider)
+    metrics.set_meter_provider(
+        MeterProvider(resource=resource, metric_readers=metric_readers)
+    )
+    start_http_server(settings.metrics_port)
+
+    observers.append(TelemetryObserver(tenants=settings.tenant_policies))
+
+if settings.profile_dir:
+    observers.append(
+        ProfilingObserver(
+            settings.profile_dir,
+            sample_rate=settings.profile_sample_rate,
+            threshold=settings.profile_threshold,
+            logger=structlog.get_logger("profiling"),
+        )
+    )
+
+offloader = None
+if settings.offload_bucket:
+    offloader = S3Offloader(
+        boto3.client("s3", endpoint_url=settings.offload_endpoint_url),
+        settings.offload_bucket,
+        prefix=settings.offload_prefix,
+        threshold=settings.offload_threshold,
+    )
+elif settings.offload_dir:
+    offloader = LocalOffloader(
+        settings.offload_dir,
+        threshold=settings.offload_threshold,
+    )
+
+resolution_store = None
+if settings.resolution_cache_path:
+    resolution_store = SQLiteResolutionStore(settings.resolution_cache_path)
+
+response_cache = None
+if settings.response_cache_path:
+    response_cache = SQLiteResponseCache(
+        settings.response_cache_path,
+        max_size=settings.response_cache_max_size,
+        ttls=settings.response_cache_ttls,
+    )
+
+decoders: dict[str, Callable[[], Decoder]] = {
+    "pydantic": Decoder,
+    "msgspec": MsgspecDecoder,
+    "lazy": LazyDecoder,
+}
 
 executor = Executor(
     build("youtube", "v3", developerKey=settings.google_api_key),
     logger=structlog.get_logger("elevenlabs"),
+    observer=Observers(*observers),
+    http_factory=build_http,
+    offloader=offloader,
+    decoder=decoders[settings.decoder](),
+    resolution_cache=ResolutionCache(resolution_store),
+    response_cache=response_cache,
+    scheduler=FairScheduler(
+        settings.max_concurrency,
+        policies=settings.tenant_policies,
+        default_policy=settings.default_tenant_policy,
+    ),
+    circuit_breaker=(
+        CircuitBreaker(
+            failure_rate_threshold=settings.circuit_failure_rate_threshold,
+            slow_call_duration=settings.circuit_slow_call_duration,
+            open_duration=settings.circuit_open_duration,
+        )
+        if settings.circuit_breaker_enabled
+        else None
+    ),
+    hedger=(
+        Hedger(percentile=settings.hedge_percentile, budget=settings.hedge_budget)
+        if settings.hedging_enabled
+        else None
+    ),
+)
+
+journal_serde_factory = partial(
+    ModelSerde,
+    exclude_none=True,
+    compression_threshold=settings.journal_compression_threshold,
 )
 
 service = create_service(
     executor,
     service_name=settings.service_name,
+    # Handles the Structs of the msgspec decoder as well
+    serde_factory=ModelSerde,
+    journal_serde_factory=journal_serde_factory,
 )
 
-app = restate.app(services=[service], identity_keys=settings.identity_keys)
+services = [
+    service,
+    create_live_poller(
+        executor,
+        object_name=f"{settings.service_name}LivePoller",
+        serde_factory=ModelSerde,
+        journal_serde_factory=journal_serde_factory,
+    ),
+    create_playlist_differ(
+        executor,
+        object_name=f"{settings.service_name}PlaylistDiffer",
+        serde_factory=ModelSerde,
+        journal_serde_factory=journal_serde_factory,
+    ),
+]
+
+# Prefetching refreshes queries into the response cache
+if response_cache is not None:
+    services.append(
+        create_prefetcher(
+            executor,
+            object_name=f"{settings.service_name}Prefetcher",
+            serde_factory=ModelSerde,
+            journal_serde_factory=journal_serde_factory,
+        )
+    )
+
+app = restate.app(services=services, identity_keys=settings.identity_keys)
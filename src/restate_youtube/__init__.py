@@ -1,11 +1,63 @@
+from .breaker import CircuitBreaker, CircuitOpenError, CircuitState
+from .cache import ResponseCache, SQLiteResponseCache
+from .decode import Decoder, LazyDecoder, MsgspecDecoder, encode_json
 from .executor import (
     Executor,
+    NotConfiguredError,
+    NotFoundError,
+)
+from .hedge import Hedger
+from .model import ExportFormat, OffloadManifest
+from .model_analytics import (
+    AggregateChannelVideosRequest,
+    AggregateChannelVideosResponse,
+    MetricSummary,
+    Period,
+    PeriodBucket,
+)
+from .model_batch import (
+    BatchEntry,
+    BatchError,
+    BatchOperation,
+    BatchRequest,
+    BatchResponse,
+    BatchResult,
 )
 from .model_channels import (
+    ChannelResolution,
     ListAllChannelsRequest,
     ListAllChannelsResponse,
     ListChannelsRequest,
     ListChannelsResponse,
+    ResolveChannelsRequest,
+    ResolveChannelsResponse,
+)
+from .model_charts import ChartRanking, ListChartsRequest, ListChartsResponse
+from .model_comment_threads import (
+    ListAllCommentThreadsByVideoRequest,
+    ListAllCommentThreadsByVideoResponse,
+    ListAllCommentThreadsRequest,
+    ListAllCommentThreadsResponse,
+    ListCommentThreadsRequest,
+    ListCommentThreadsResponse,
+    VideoCommentThreads,
+)
+from .model_live import (
+    LiveTracker,
+    LiveVideoSample,
+    PollLiveVideosRequest,
+    PollLiveVideosResponse,
+    TrackedVideo,
+    TrackLiveVideosRequest,
+    UntrackLiveVideosRequest,
+    ViewerSeries,
+)
+from .model_playlist_diff import (
+    DiffPlaylistRequest,
+    DiffPlaylistResponse,
+    PlaylistDiff,
+    PlaylistIndex,
+    PlaylistItemChange,
 )
 from .model_playlist_item import (
     ListAllPlaylistItemsRequest,
@@ -19,18 +71,64 @@ from .model_playlists import (
     ListPlaylistsRequest,
     ListPlaylistsResponse,
 )
+from .model_prefetch import (
+    PrefetchQuery,
+    PrefetchRequest,
+    PrefetchResponse,
+    PrefetchResult,
+)
 from .model_videos import (
     ListAllVideosRequest,
     ListAllVideosResponse,
     ListVideosRequest,
     ListVideosResponse,
 )
-from .restate import create_service, register_service
+from .observer import Invocation, Observer, Observers, UpstreamCall
+from .offload import LocalOffloader, Offloader, S3Offloader, Upload
+from .profiling import ProfilingObserver
+from .recording import Recorder, Recording, ReplayClient, ReplayReport, replay
+from .resolve import ResolutionCache, ResolutionStore, SQLiteResolutionStore
+from .restate import (
+    SerdeFactory,
+    create_live_poller,
+    create_playlist_differ,
+    create_prefetcher,
+    create_service,
+    register_service,
+)
+from .scheduler import FairScheduler, TenantPolicy
+from .seen import SeenIds
+from .serde import ModelSerde
 
 __all__ = [
+    "AggregateChannelVideosRequest",
+    "AggregateChannelVideosResponse",
+    "BatchEntry",
+    "BatchError",
+    "BatchOperation",
+    "BatchRequest",
+    "BatchResponse",
+    "BatchResult",
+    "ChannelResolution",
+    "ChartRanking",
+    "CircuitBreaker",
+    "CircuitOpenError",
+    "CircuitState",
+    "Decoder",
+    "DiffPlaylistRequest",
+    "DiffPlaylistResponse",
     "Executor",
+    "ExportFormat",
+    "FairScheduler",
+    "Hedger",
+    "Invocation",
+    "LazyDecoder",
     "ListAllChannelsRequest",
     "ListAllChannelsResponse",
+    "ListAllCommentThreadsByVideoRequest",
+    "ListAllCommentThreadsByVideoResponse",
+    "ListAllCommentThreadsRequest",
+    "ListAllCommentThreadsResponse",
     "ListAllPlaylistItemsRequest",
     "ListAllPlaylistItemsResponse",
     "ListAllPlaylistsRequest",
@@ -39,12 +137,67 @@ __all__ = [
     "ListAllVideosResponse",
     "ListChannelsRequest",
     "ListChannelsResponse",
+    "ListChartsRequest",
+    "ListChartsResponse",
+    "ListCommentThreadsRequest",
+    "ListCommentThreadsResponse",
     "ListPlaylistItemsRequest",
     "ListPlaylistItemsResponse",
     "ListPlaylistsRequest",
     "ListPlaylistsResponse",
     "ListVideosRequest",
     "ListVideosResponse",
+    "LiveTracker",
+    "LiveVideoSample",
+    "LocalOffloader",
+    "MetricSummary",
+    "ModelSerde",
+    "MsgspecDecoder",
+    "NotConfiguredError",
+    "NotFoundError",
+    "Observer",
+    "Observers",
+    "OffloadManifest",
+    "Offloader",
+    "Period",
+    "PeriodBucket",
+    "PlaylistDiff",
+    "PlaylistIndex",
+    "PlaylistItemChange",
+    "PollLiveVideosRequest",
+    "PollLiveVideosResponse",
+    "PrefetchQuery",
+    "PrefetchRequest",
+    "PrefetchResponse",
+    "PrefetchResult",
+    "ProfilingObserver",
+    "Recorder",
+    "Recording",
+    "ReplayClient",
+    "ReplayReport",
+    "ResolutionCache",
+    "ResolutionStore",
+    "ResolveChannelsRequest",
+    "ResolveChannelsResponse",
+    "ResponseCache",
+    "S3Offloader",
+    "SQLiteResolutionStore",
+    "SQLiteResponseCache",
+    "SeenIds",
+    "SerdeFactory",
+    "TenantPolicy",
+    "TrackLiveVideosRequest",
+    "TrackedVideo",
+    "UntrackLiveVideosRequest",
+    "Upload",
+    "UpstreamCall",
+    "VideoCommentThreads",
+    "ViewerSeries",
+    "create_live_poller",
+    "create_playlist_differ",
+    "create_prefetcher",
     "create_service",
+    "encode_json",
     "register_service",
+    "replay",
 ]
@@ -0,0 +1,147 @@
+from datetime import UTC, datetime
+from typing import Any
+
+import numpy as np
+
+from .model_analytics import (
+    AggregateChannelVideosRequest,
+    AggregateChannelVideosResponse,
+    MetricSummary,
+    Period,
+    PeriodBucket,
+)
+from .model_videos import duration_seconds
+
+# numpy datetime64 unit each period is truncated to
+_PERIOD_UNITS = {
+    Period.DAY: "D",
+    Period.MONTH: "M",
+    Period.YEAR: "Y",
+}
+
+# 1970-01-01 was a Thursday: shift by 3 days to start weeks on Monday
+_WEEK_OFFSET = np.timedelta64(3, "D")
+
+
+class VideoArrays:
+    """Statistics of videos as columns, parsed from raw API items.
+
+    Counts that a video doesn't report (e.g. hidden likes) are NaN.
+    """
+
+    def __init__(self, items: list[dict[str, Any]]):
+        size = len(items)
+
+        self.views = np.full(size, np.nan)
+        self.likes = np.full(size, np.nan)
+        self.comments = np.full(size, np.nan)
+        self.duration_seconds = np.full(size, np.nan)
+        published = []
+
+        for i, item in enumerate(items):
+            statistics = item.get("statistics", {})
+            if "viewCount" in statistics:
+                self.views[i] = int(statistics["viewCount"])
+            if "likeCount" in statistics:
+                self.likes[i] = int(statistics["likeCount"])
+            if "commentCount" in statistics:
+                self.comments[i] = int(statistics["commentCount"])
+
+            duration = item.get("contentDetails", {}).get("duration")
+            seconds = duration_seconds(duration) if duration else None
+            if seconds is not None:
+                self.duration_seconds[i] = seconds
+
+            # Drop the zone designator: timestamps are always UTC
+            published.append(item.get("snippet", {}).get("publishedAt", "NaT")[:19])
+
+        self.published_at = np.array(published, dtype="datetime64[s]")
+
+
+def summarize(values: np.ndarray, percentiles: list[float]) -> MetricSummary:
+    """Summarize the distribution of a metric, ignoring NaN values."""
+    reported = values[~np.isnan(values)]
+    if not reported.size:
+        return MetricSummary(total=0, count=0)
+
+    return MetricSummary(
+        total=int(reported.sum()),
+        count=int(reported.size),
+        mean=float(reported.mean()),
+        percentiles={
+            f"p{q:g}": float(v)
+            for q, v in zip(percentiles, np.percentile(reported, percentiles))
+        },
+    )
+
+
+def histogram(videos: VideoArrays, period: Period) -> list[PeriodBucket]:
+    """Group videos by the period they were published in."""
+    valid = ~np.isnat(videos.published_at)
+    published = videos.published_at[valid]
+
+    if period == Period.WEEK:
+        days = published.astype("datetime64[D]") + _WEEK_OFFSET
+        starts = days.astype("datetime64[W]").astype("datetime64[D]") - _WEEK_OFFSET
+    else:
+        starts = published.astype(f"datetime64[{_PERIOD_UNITS[period]}]")
+
+    keys, index = np.unique(starts, return_inverse=True)
+
+    def sums(values: np.ndarray) -> np.ndarray:
+        return np.bincount(
+            index,
+            weights=np.nan_to_num(values[valid]),
+            minlength=len(keys),
+        )
+
+    counts = np.bincount(index, minlength=len(keys))
+    views = sums(videos.views)
+    likes = sums(videos.likes)
+    comments = sums(videos.comments)
+    durations = sums(videos.duration_seconds)
+
+    return [
+        PeriodBucket(
+            start=datetime.fromtimestamp(
+                int(key.astype("datetime64[s]").astype(np.int64)),
+                tz=UTC,
+            ),
+            videos=int(counts[i]),
+            views=int(views[i]),
+            likes=int(likes[i]),
+            comments=int(comments[i]),
+            duration_seconds=int(durations[i]),
+        )
+        for i, key in enumerate(keys)
+    ]
+
+
+def aggregate(
+    request: AggregateChannelVideosRequest,
+    items: list[dict[str, Any]],
+) -> AggregateChannelVideosResponse:
+    """Aggregate the statistics of raw video items."""
+    videos = VideoArrays(items)
+
+    interactions = videos.likes + videos.comments
+    reported = ~np.isnan(interactions) & (videos.views > 0)
+    total_views = videos.views[reported].sum()
+
+    return AggregateChannelVideosResponse(
+        channel_id=request.channel_id,
+        video_count=len(videos.views),
+        views=summarize(videos.views, request.percentiles),
+        likes=summarize(videos.likes, request.percentiles),
+        comments=summarize(videos.comments, request.percentiles),
+        duration_seconds=summarize(videos.duration_seconds, request.percentiles),
+        engagement_rate=(
+            float(interactions[reported].sum() / total_views) if total_views else None
+        ),
+        median_engagement_rate=(
+            float(np.median(interactions[reported] / videos.views[reported]))
+            if reported.any()
+            else None
+        ),
+        periods=histogram(videos, request.period),
+    )
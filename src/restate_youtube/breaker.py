@@ -0,0 +1,197 @@
+import math
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from enum import Enum
+
+from googleapiclient.errors import HttpError
+
+
+class CircuitState(str, Enum):
+    """State of the circuit breaker of a resource."""
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "halfOpen"
+
+
+class CircuitOpenError(Exception):
+    """Raised instead of calling a resource whose circuit is open.
+
+    The error is retryable: the resource is probed again after
+    ``retry_after`` seconds.
+    """
+
+    def __init__(self, resource: str, retry_after: float):
+        super().__init__(
+            f"Circuit of {resource} is open: retry after {math.ceil(retry_after)}s"
+        )
+        self.resource = resource
+        self.retry_after = retry_after
+
+
+def is_failure(error: BaseException | None) -> bool:
+    """Return whether an upstream call error indicates a degraded API.
+
+    Client errors (e.g. not found, quota exceeded) are answers of a healthy
+    API; server errors, throttling and network errors are not.
+    """
+    if error is None:
+        return False
+
+    if isinstance(error, HttpError):
+        return error.resp.status >= 500 or error.resp.status == 429
+
+    return isinstance(error, Exception)
+
+
+@dataclass
+class _Circuit:
+    state: CircuitState = CircuitState.CLOSED
+    # (time, failed, slow) of the calls in the window
+    outcomes: deque[tuple[float, bool, bool]] = field(default_factory=deque)
+    opened_at: float = 0.0
+    probes: int = 0
+    probe_successes: int = 0
+
+
+class CircuitBreaker:
+    """Fails calls to a resource fast while its error rate or latency is high.
+
+    The circuit of each resource opens when, over the calls of the last
+    ``window`` seconds (at least ``min_calls``), the rate of failures or of
+    calls slower than ``slow_call_duration`` reaches its threshold. Calls are
+    rejected with :class:`CircuitOpenError` for ``open_duration`` seconds,
+    then ``half_open_calls`` probes are let through: the circuit closes if
+    they all succeed, and opens again otherwise.
+    """
+
+    def __init__(
+        self,
+        failure_rate_threshold: float = 0.5,
+        slow_call_duration: float = 10.0,
+        slow_call_rate_threshold: float = 0.8,
+        window: float = 60.0,
+        min_calls: int = 10,
+        open_duration: float = 30.0,
+        half_open_calls: int = 3,
+    ):
+        self.failure_rate_threshold = failure_rate_threshold
+        self.slow_call_duration = slow_call_duration
+        self.slow_call_rate_threshold = slow_call_rate_threshold
+        self.window = window
+        self.min_calls = min_calls
+        self.open_duration = open_duration
+        self.half_open_calls = half_open_calls
+
+        self._lock = threading.Lock()
+        self._circuits: dict[str, _Circuit] = {}
+
+    def state(self, resource: str) -> CircuitState:
+        with self._lock:
+            return self._circuit(resource).state
+
+    def allow(self, resource: str) -> CircuitState | None:
+        """Admit a call to ``resource`` or raise :class:`CircuitOpenError`.
+
+        Returns the new state of the circuit if it changed.
+        """
+        with self._lock:
+            circuit = self._circuit(resource)
+            changed = None
+
+            if circuit.state == CircuitState.OPEN:
+                retry_after = circuit.opened_at + self.open_duration - time.monotonic()
+                if retry_after > 0:
+                    raise CircuitOpenError(resource, retry_after)
+
+                circuit.state = changed = CircuitState.HALF_OPEN
+                circuit.probes = circuit.probe_successes = 0
+
+            if circuit.state == CircuitState.HALF_OPEN:
+                if circuit.probes >= self.half_open_calls:
+                    # Probes are in flight: their outcome decides
+                    raise CircuitOpenError(resource, self.open_duration)
+
+                circuit.probes += 1
+
+            return changed
+
+    def cancel(self, resource: str):
+        """Forget a call admitted by :meth:`allow` that was aborted.
+
+        Aborted calls (e.g. by their deadline) say nothing about the health
+        of the API: they are not recorded, and free their probe slot.
+        """
+        with self._lock:
+            circuit = self._circuit(resource)
+            if circuit.state == CircuitState.HALF_OPEN and circuit.probes > 0:
+                circuit.probes -= 1
+
+    def record(
+        self,
+        resource: str,
+        duration: float,
+        error: BaseException | None = None,
+    ) -> CircuitState | None:
+        """Record the outcome of a call admitted by :meth:`allow`.
+
+        Returns the new state of the circuit if it changed.
+        """
+        failed = is_failure(error)
+        slow = duration >= self.slow_call_duration
+
+        with self._lock:
+            circuit = self._circuit(resource)
+            now = time.monotonic()
+
+            if circuit.state == CircuitState.HALF_OPEN:
+                if failed or slow:
+                    return self._open(circuit, now)
+
+                circuit.probe_successes += 1
+                if circuit.probe_successes < self.half_open_calls:
+                    return None
+
+                circuit.state = CircuitState.CLOSED
+                circuit.outcomes.clear()
+
+                return circuit.state
+
+            if circuit.state == CircuitState.OPEN:
+                # Admitted before the circuit opened
+                return None
+
+            outcomes = circuit.outcomes
+            outcomes.append((now, failed, slow))
+            while outcomes and outcomes[0][0] < now - self.window:
+                outcomes.popleft()
+
+            if len(outcomes) < self.min_calls:
+                return None
+
+            calls = len(outcomes)
+            failure_rate = sum(1 for _, f, _ in outcomes if f) / calls
+            slow_call_rate = sum(1 for _, _, s in outcomes if s) / calls
+            if (
+                failure_rate >= self.failure_rate_threshold
+                or slow_call_rate >= self.slow_call_rate_threshold
+            ):
+                return self._open(circuit, now)
+
+            return None
+
+    def _circuit(self, resource: str) -> _Circuit:
+        circuit = self._circuits.get(resource)
+        if circuit is None:
+            circuit = self._circuits[resource] = _Circuit()
+
+        return circuit
+
+    def _open(self, circuit: _Circuit, now: float) -> CircuitState:
+        circuit.state = CircuitState.OPEN
+        circuit.opened_at = now
+        circuit.outcomes.clear()
+
+        return circuit.state
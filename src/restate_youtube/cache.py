@@ -0,0 +1,190 @@
+import hashlib
+import json
+import logging
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any
+
+_logger = logging.getLogger(__name__)
+
+# Default lifetime of cached responses per resource, in seconds
+DEFAULT_TTLS = {
+    "channels": 3600,
+    "playlists": 900,
+    "playlistItems": 300,
+    "videos": 300,
+}
+
+
+def request_key(resource: str, params: dict[str, Any]) -> str:
+    """Return the fingerprint of an upstream request.
+
+    Parameters are order-independent, and so are the parts of a ``part``
+    parameter; IDs are left alone, as they determine the item order.
+    """
+    normalized = dict(params)
+    if isinstance(normalized.get("part"), str):
+        normalized["part"] = ",".join(sorted(normalized["part"].split(",")))
+
+    payload = json.dumps([resource, normalized], sort_keys=True, default=str)
+
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+class ResponseCache:
+    """Caches raw upstream response bodies, keyed by request fingerprint.
+
+    Caching is best-effort: implementations log their errors and treat them
+    as misses or skipped stores, so they never fail a call.
+    """
+
+    def get(self, resource: str, key: str) -> bytes | None:
+        raise NotImplementedError
+
+    def set(self, resource: str, key: str, content: bytes):
+        raise NotImplementedError
+
+    def hits(self, resource: str, key: str) -> int:
+        """Return how often a response was read since it was stored."""
+        return 0
+
+
+class SQLiteResponseCache(ResponseCache):
+    """Caches responses in an SQLite database that survives restarts.
+
+    The database is opened in WAL mode, so all worker processes on a host
+    share it. Responses expire after the TTL of their resource (resources
+    with no TTL are not cached), and once the cached bodies exceed
+    ``max_size`` bytes, the entries closest to expiry are evicted first.
+
+    Reads don't write: hits are counted in memory and added to the database
+    every ``hit_flush_interval`` seconds, so hit counts are approximate.
+    """
+
+    # Check the size bound every this many writes instead of on each one
+    eviction_interval = 64
+
+    # Seconds between writes of the hits counted in memory
+    hit_flush_interval = 5.0
+
+    def __init__(
+        self,
+        path: str | Path,
+        max_size: int = 256 * 1024 * 1024,
+        ttls: dict[str, float] | None = None,
+    ):
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+
+        self.max_size = max_size
+        self.ttls = DEFAULT_TTLS if ttls is None else ttls
+
+        self._lock = threading.Lock()
+        self._writes = 0
+        self._hits: dict[str, int] = {}
+        self._hits_flushed_at = time.monotonic()
+        self._db = sqlite3.connect(path, check_same_thread=False, timeout=10)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("PRAGMA synchronous=NORMAL")
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS responses"
+            " (key TEXT PRIMARY KEY, resource TEXT NOT NULL, content BLOB NOT NULL,"
+            " size INTEGER NOT NULL, expires_at REAL NOT NULL,"
+            " hits INTEGER NOT NULL DEFAULT 0)"
+        )
+        self._db.execute(
+            "CREATE INDEX IF NOT EXISTS responses_expires_at ON responses (expires_at)"
+        )
+        self._db.commit()
+
+    def get(self, resource: str, key: str) -> bytes | None:
+        with self._lock:
+            try:
+                row = self._db.execute(
+                    "SELECT content FROM responses WHERE key = ? AND expires_at > ?",
+                    (key, time.time()),
+                ).fetchone()
+            except sqlite3.Error:
+                _logger.warning("Reading the response cache failed", exc_info=True)
+                return None
+
+            if row is None:
+                return None
+
+            self._hits[key] = self._hits.get(key, 0) + 1
+            if time.monotonic() - self._hits_flushed_at >= self.hit_flush_interval:
+                self._flush_hits()
+
+        return row[0]
+
+    def set(self, resource: str, key: str, content: bytes):
+        ttl = self.ttls.get(resource)
+        if not ttl:
+            return
+
+        with self._lock:
+            # Hits of the replaced response
+            self._hits.pop(key, None)
+
+            try:
+                with self._db:
+                    self._db.execute(
+                        "INSERT OR REPLACE INTO responses"
+                        " (key, resource, content, size, expires_at)"
+                        " VALUES (?, ?, ?, ?, ?)",
+                        (key, resource, content, len(content), time.time() + ttl),
+                    )
+
+                    self._writes += 1
+                    if self._writes % self.eviction_interval == 0:
+                        self._evict()
+            except sqlite3.Error:
+                _logger.warning("Writing the response cache failed", exc_info=True)
+
+    def hits(self, resource: str, key: str) -> int:
+        with self._lock:
+            try:
+                row = self._db.execute(
+                    "SELECT hits FROM responses WHERE key = ?", (key,)
+                ).fetchone()
+            except sqlite3.Error:
+                _logger.warning("Reading the response cache failed", exc_info=True)
+                row = None
+
+            return (row[0] if row else 0) + self._hits.get(key, 0)
+
+    def _flush_hits(self):
+        hits, self._hits = self._hits, {}
+        self._hits_flushed_at = time.monotonic()
+
+        try:
+            with self._db:
+                self._db.executemany(
+                    "UPDATE responses SET hits = hits + ? WHERE key = ?",
+                    [(count, key) for key, count in hits.items()],
+                )
+        except sqlite3.Error:
+            # Hit counts are approximate anyway
+            _logger.warning("Counting response cache hits failed", exc_info=True)
+
+    def _evict(self):
+        self._db.execute("DELETE FROM responses WHERE expires_at <= ?", (time.time(),))
+
+        (size,) = self._db.execute(
+            "SELECT COALESCE(SUM(size), 0) FROM responses"
+        ).fetchone()
+        if size <= self.max_size:
+            return
+
+        # Delete the entries closest to expiry until the rest fits
+        self._db.execute(
+            "DELETE FROM responses WHERE key IN ("
+            " SELECT key FROM ("
+            "  SELECT key, SUM(size) OVER (ORDER BY expires_at DESC) AS kept"
+            "  FROM responses"
+            " ) WHERE kept > ?"
+            ")",
+            (self.max_size,),
+        )
@@ -0,0 +1,119 @@
+import contextvars
+import socket
+import threading
+import time
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from typing import Any, ParamSpec, TypeVar
+
+P = ParamSpec("P")
+T = TypeVar("T")
+
+# Timeout of calls in flight once their invocation is cancelled
+_CANCELLED_TIMEOUT = 0.001
+
+
+class DeadlineExceeded(Exception):
+    """Raised when the deadline of an invocation passed before it was done."""
+
+
+class Cancelled(Exception):
+    """Raised when an invocation was cancelled, e.g. its caller went away."""
+
+
+class CancelScope:
+    """Deadline and cancellation signal of the invocations run in it.
+
+    Executor invocations check the scope before each upstream call, bound
+    socket timeouts by the time remaining until the deadline, and abort the
+    calls in flight when the scope is cancelled.
+    """
+
+    def __init__(self, deadline: float | None = None):
+        """
+        Args:
+            deadline: Unix time invocations must be done by.
+        """
+        self.deadline = deadline
+
+        self._lock = threading.Lock()
+        self._cancelled = threading.Event()
+        self._in_flight: set[Any] = set()
+
+    @property
+    def cancelled(self) -> bool:
+        return self._cancelled.is_set()
+
+    def remaining(self) -> float | None:
+        """Return the seconds left until the deadline, if any."""
+        if self.deadline is None:
+            return None
+
+        return self.deadline - time.time()
+
+    def cancel(self):
+        """Stop the invocations of the scope, aborting their calls in flight."""
+        with self._lock:
+            self._cancelled.set()
+            in_flight = list(self._in_flight)
+
+        for http in in_flight:
+            set_timeout(http, _CANCELLED_TIMEOUT, shutdown=True)
+
+    def check(self):
+        """Raise if the scope was cancelled."""
+        if self.cancelled:
+            raise Cancelled("Invocation was cancelled")
+
+    @contextmanager
+    def track(self, http: Any) -> Iterator[None]:
+        """Abort the calls of ``http`` if the scope is cancelled meanwhile."""
+        with self._lock:
+            self.check()
+            self._in_flight.add(http)
+
+        try:
+            yield
+        finally:
+            with self._lock:
+                self._in_flight.discard(http)
+
+    def run(self, fn: Callable[P, T], *args: P.args, **kwargs: P.kwargs) -> T:
+        """Call ``fn`` in the scope."""
+        token = _current.set(self)
+        try:
+            return fn(*args, **kwargs)
+        finally:
+            _current.reset(token)
+
+
+_current: contextvars.ContextVar[CancelScope | None] = contextvars.ContextVar(
+    "cancel_scope", default=None
+)
+
+
+def current_scope() -> CancelScope | None:
+    """Return the scope the caller runs in, if any."""
+    return _current.get()
+
+
+def set_timeout(http: Any, timeout: float | None, shutdown: bool = False):
+    """Set the socket timeout of an ``httplib2.Http`` and its open connections.
+
+    ``shutdown`` also unblocks the calls waiting for a response.
+    """
+    http.timeout = timeout
+
+    for conn in list(getattr(http, "connections", {}).values()):
+        conn.timeout = timeout
+
+        sock = getattr(conn, "sock", None)
+        if sock is None:
+            continue
+
+        try:
+            sock.settimeout(timeout)
+            if shutdown:
+                sock.shutdown(socket.SHUT_RDWR)
+        except OSError:
+            pass
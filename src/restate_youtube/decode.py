@@ -0,0 +1,159 @@
+import functools
+import json
+import operator
+import types
+import typing
+from typing import Any, ClassVar, TypeVar
+
+from pydantic import BaseModel
+
+from .model import LazyModel
+from .model_channels import Channel, LazyChannel
+from .model_videos import LazyVideo, Video
+
+M = TypeVar("M", bound=BaseModel)
+
+
+class Decoder:
+    """Turns parsed YouTube Data API responses into response models.
+
+    The default implementation validates with pydantic.
+    """
+
+    def loads(self, content: bytes) -> Any:
+        """Parse a raw response body."""
+        return json.loads(content)
+
+    def validate(self, model: type[M], data: Any) -> M:
+        return model.model_validate(data)
+
+
+class LazyDecoder(Decoder):
+    """Validates the parts of videos and channels on first access.
+
+    Callers reading only some of the requested parts skip validating the
+    others, and parts that are never read are returned as received.
+    """
+
+    lazy_models: ClassVar[dict[type[BaseModel], type[LazyModel]]] = {
+        Video: LazyVideo,
+        Channel: LazyChannel,
+    }
+
+    def validate(self, model: type[M], data: Any) -> M:
+        lazy_model = self.lazy_models.get(model)
+        if lazy_model is not None:
+            return typing.cast(M, lazy_model.lazy_validate(data))
+
+        items = model.model_fields.get("items")
+        if items is None:
+            return model.model_validate(data)
+
+        (item_model,) = typing.get_args(items.annotation)
+        lazy_model = self.lazy_models.get(_strip_annotated(item_model))
+        if lazy_model is None:
+            return model.model_validate(data)
+
+        return model.model_validate(
+            {**data, "items": [lazy_model.lazy_validate(i) for i in data["items"]]}
+        )
+
+
+class MsgspecDecoder(Decoder):
+    """Decodes responses into msgspec Structs mirroring the response models.
+
+    Structs are generated from the pydantic models (field names, aliases,
+    types, defaults and properties), so both stay in sync. They have the
+    attributes of the models they mirror and serialize to the same JSON, but
+    skip pydantic validation, which dominates CPU time on large listings.
+
+    Serdes must encode Structs with :func:`encode_json` (e.g. ``ModelSerde``).
+    Requires msgspec.
+    """
+
+    def __init__(self):
+        import msgspec
+
+        self._msgspec = msgspec
+        self._structs: dict[type[BaseModel], Any] = {}
+
+    def loads(self, content: bytes) -> Any:
+        return self._msgspec.json.decode(content)
+
+    def validate(self, model: type[M], data: Any) -> M:
+        # Accept numeric strings (e.g. channel statistics) like pydantic does
+        return self._msgspec.convert(data, self.struct(model), strict=False)
+
+    def struct(self, model: type[BaseModel]) -> Any:
+        """Return the Struct type mirroring ``model``."""
+        struct = self._structs.get(model)
+        if struct is not None:
+            return struct
+
+        fields: list[Any] = []
+        for name, info in model.model_fields.items():
+            annotation = self._annotation(info.annotation)
+
+            if info.is_required():
+                fields.append((name, annotation))
+            elif info.default_factory is not None:
+                factory = info.default_factory
+                fields.append(
+                    (name, annotation, self._msgspec.field(default_factory=factory))
+                )
+            else:
+                fields.append((name, annotation, info.default))
+
+        struct = self._structs[model] = self._msgspec.defstruct(
+            model.__name__,
+            fields,
+            kw_only=True,
+            rename={
+                name: info.alias or name for name, info in model.model_fields.items()
+            },
+            module=__name__,
+            # Computed properties (e.g. duration_seconds) read the same fields
+            namespace={
+                name: attr
+                for cls in reversed(model.__mro__)
+                if issubclass(cls, BaseModel) and cls is not BaseModel
+                for name, attr in vars(cls).items()
+                if isinstance(attr, property)
+            },
+        )
+
+        return struct
+
+    def _annotation(self, annotation: Any) -> Any:
+        annotation = _strip_annotated(annotation)
+        if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+            return self.struct(annotation)
+
+        origin = typing.get_origin(annotation)
+        args = typing.get_args(annotation)
+
+        if origin in (typing.Union, types.UnionType):
+            return functools.reduce(operator.or_, map(self._annotation, args))
+        if origin is list:
+            return list[self._annotation(args[0])]
+        if origin is dict:
+            return dict[args[0], self._annotation(args[1])]
+
+        return annotation
+
+
+def _strip_annotated(annotation: Any) -> Any:
+    if typing.get_origin(annotation) is typing.Annotated:
+        return typing.get_args(annotation)[0]
+
+    return annotation
+
+
+def encode_json(obj: Any) -> bytes:
+    """Encode a response model or a Struct produced by :class:`MsgspecDecoder`."""
+    if isinstance(obj, BaseModel):
+        return obj.model_dump_json().encode()
+
+    import msgspec
+
+    return msgspec.json.encode(obj)
@@ -1,12 +1,73 @@
+import contextvars
+import dataclasses
+import json
 import logging
-from typing import List
+import threading
+import time
+from collections import deque
+from collections.abc import Callable, Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import contextmanager
+from typing import Any, TypeVar
 
+from googleapiclient.errors import HttpError
+from pydantic import BaseModel
+
+from .breaker import CircuitBreaker, CircuitOpenError, CircuitState
+from .cache import ResponseCache, request_key
+from .deadline import (
+    Cancelled,
+    DeadlineExceeded,
+    current_scope,
+    set_timeout,
+)
+from .decode import Decoder, encode_json
+from .export import Exporter, open_exporter
+from .hedge import Hedger
+from .model import ExportFormat, ListAllRequestMixin, published_at
+from .model_analytics import (
+    AggregateChannelVideosRequest,
+    AggregateChannelVideosResponse,
+)
+from .model_batch import (
+    BATCH_OPERATIONS,
+    BatchEntry,
+    BatchError,
+    BatchRequest,
+    BatchResponse,
+    BatchResult,
+)
 from .model_channels import (
     Channel,
+    ChannelResolution,
     ListAllChannelsRequest,
     ListAllChannelsResponse,
     ListChannelsRequest,
     ListChannelsResponse,
+    ResolveChannelsRequest,
+    ResolveChannelsResponse,
+)
+from .model_charts import ChartRanking, ListChartsRequest, ListChartsResponse
+from .model_comment_threads import (
+    CommentThread,
+    ListAllCommentThreadsByVideoRequest,
+    ListAllCommentThreadsByVideoResponse,
+    ListAllCommentThreadsRequest,
+    ListAllCommentThreadsResponse,
+    ListCommentThreadsRequest,
+    ListCommentThreadsResponse,
+    VideoCommentThreads,
+)
+from .model_live import (
+    BATCH_SIZE,
+    LiveVideoSample,
+    PollLiveVideosRequest,
+    PollLiveVideosResponse,
+)
+from .model_playlist_diff import (
+    PAGE_SIZE,
+    DiffPlaylistRequest,
+    DiffPlaylistResponse,
 )
 from .model_playlist_item import (
     ListAllPlaylistItemsRequest,
@@ -22,6 +83,12 @@ from .model_playlists import (
     ListPlaylistsResponse,
     Playlist,
 )
+from .model_prefetch import (
+    PrefetchQuery,
+    PrefetchRequest,
+    PrefetchResponse,
+    PrefetchResult,
+)
 from .model_videos import (
     ListAllVideosRequest,
     ListAllVideosResponse,
@@ -29,169 +96,1225 @@ from .model_videos import (
     ListVideosResponse,
     Video,
 )
+from .observer import Invocation, Observer, UpstreamCall
+from .offload import Offloader
+from .playlist_diff import PlaylistDiffer
+from .resolve import ResolutionCache, handle_key, resolution, username_key
+from .scheduler import DEFAULT_TENANT, FairScheduler
 
 _logger = logging.getLogger(__name__)
 
+R = TypeVar("R", bound=BaseModel)
+L = TypeVar("L", ListAllChannelsRequest, ListAllVideosRequest)
+
+# Cache hits of the entries refreshed by the current prefetch, by cache key
+_refreshing: contextvars.ContextVar[dict[str, int] | None] = contextvars.ContextVar(
+    "refreshing", default=None
+)
+
+# Tenant of the current invocation, inherited by the invocations it starts
+_tenant: contextvars.ContextVar[str] = contextvars.ContextVar(
+    "tenant", default=DEFAULT_TENANT
+)
+
+
+class NotFoundError(ValueError):
+    """Raised when a resource a request names does not exist."""
+
+
+class NotConfiguredError(ValueError):
+    """Raised when a request needs a feature the executor was not set up with."""
+
 
 class Executor:
     def __init__(
         self,
         youtube,
         logger: logging.Logger = _logger,
+        observer: Observer | None = None,
+        max_concurrency: int = 8,
+        http_factory: Callable[[], Any] | None = None,
+        offloader: Offloader | None = None,
+        decoder: Decoder | None = None,
+        resolution_cache: ResolutionCache | None = None,
+        response_cache: ResponseCache | None = None,
+        scheduler: FairScheduler | None = None,
+        circuit_breaker: CircuitBreaker | None = None,
+        hedger: Hedger | None = None,
     ):
+        """
+        Args:
+            youtube: YouTube Data API client (``googleapiclient.discovery.build``).
+            logger: Logger for executor messages.
+            observer: Observer notified of invocations and upstream calls.
+            max_concurrency: Maximum number of concurrent upstream calls
+                (unless ``scheduler`` is set).
+            http_factory: Creates an HTTP client per worker thread. The client
+                built into ``youtube`` is used when not set; it must then be
+                safe to share between threads.
+            offloader: Stores listAll* results that are too large to return
+                inline, and exports. Results are always returned inline when
+                not set.
+            decoder: Decodes upstream responses into response models
+                (pydantic validation by default, or ``MsgspecDecoder``).
+            resolution_cache: Caches the channels handles and usernames
+                resolve to (in process only by default).
+            response_cache: Caches upstream responses (e.g.
+                ``SQLiteResponseCache``). Responses are not cached when not set.
+            scheduler: Shares concurrency slots and quota between tenants
+                (equally by default).
+            circuit_breaker: Fails calls to degraded resources fast with
+                ``CircuitOpenError``. Calls always go upstream when not set.
+            hedger: Duplicates slow single-page calls (``list*`` handlers).
+                Calls are never hedged when not set.
+        """
         self.youtube = youtube
         self.logger = logger
+        self.observer = observer or Observer()
+        self.max_concurrency = max_concurrency
+        self.http_factory = http_factory
+        self.offloader = offloader
+        self.decoder = decoder or Decoder()
+        self.resolution_cache = resolution_cache or ResolutionCache()
+        self.response_cache = response_cache
 
-    def list_channels(self, request: ListChannelsRequest) -> ListChannelsResponse:
-        apiRequest = self.youtube.channels().list(
-            **request.model_dump(
-                exclude_none=True,
-                context={"comma_separated": True},
+        self.scheduler = scheduler or FairScheduler(max_concurrency)
+        self.circuit_breaker = circuit_breaker
+        self.hedger = hedger
+        self._local = threading.local()
+
+    def _http(self) -> Any:
+        if self.http_factory is None:
+            return None
+
+        http = getattr(self._local, "http", None)
+        if http is None:
+            http = self._local.http = self.http_factory()
+            self._local.timeout = getattr(http, "timeout", None)
+
+        return http
+
+    @contextmanager
+    def _bounded(self, invocation: Invocation, http: Any) -> Iterator[None]:
+        """Bound the calls of ``http`` by the deadline and scope of an invocation."""
+        if http is None:
+            yield
+            return
+
+        timeout = self._local.timeout
+        if invocation.deadline is not None:
+            remaining = max(0.0, invocation.deadline - time.time())
+            timeout = remaining if timeout is None else min(timeout, remaining)
+
+        set_timeout(http, timeout)
+
+        scope = current_scope()
+        if scope is None:
+            yield
+            return
+
+        with scope.track(http):
+            yield
+
+    @contextmanager
+    def _invocation(self, name: str, request: Any) -> Iterator[Invocation]:
+        tenant = (
+            getattr(request, "tenant", None)
+            or getattr(request, "on_behalf_of_content_owner", None)
+            or _tenant.get()
+        )
+
+        # The deadline of the caller; the deadline of listAll* requests is a
+        # paging budget, which always allows a page
+        scope = current_scope()
+
+        invocation = Invocation(
+            name=name,
+            request=request,
+            tenant=tenant,
+            deadline=scope.deadline if scope is not None else None,
+            started_at=time.time(),
+        )
+        start = time.perf_counter()
+        token = _tenant.set(tenant)
+
+        with self.observer.invocation(invocation):
+            try:
+                yield invocation
+            except BaseException as e:
+                invocation.error = e
+                raise
+            finally:
+                _tenant.reset(token)
+                invocation.duration = time.perf_counter() - start
+
+                if getattr(request, "debug", False):
+                    self.logger.info(
+                        "Invocation profile: %s",
+                        json.dumps(invocation.profile()),
+                    )
+
+    def _execute(
+        self,
+        invocation: Invocation,
+        resource: str,
+        hedged: bool = False,
+        **params: Any,
+    ) -> dict[str, Any]:
+        return self._call(invocation, resource, hedged, **params)[0]
+
+    def _call(
+        self,
+        invocation: Invocation,
+        resource: str,
+        hedged: bool = False,
+        **params: Any,
+    ) -> tuple[dict[str, Any], UpstreamCall]:
+        """Execute an upstream call and return the response with its record.
+
+        ``hedged`` calls are duplicated when slow, if the executor hedges.
+        """
+        invocation.pages += 1
+        call = UpstreamCall(
+            resource=resource,
+            params={k: v for k, v in params.items() if v is not None},
+            page=invocation.pages,
+            started_at=time.time(),
+        )
+
+        cache_key = None
+        if self.response_cache is not None:
+            cache_key = request_key(resource, call.params)
+
+            # Prefetches replace the cached response instead of reading it
+            refreshing = _refreshing.get()
+            if refreshing is not None:
+                refreshing[cache_key] = self.response_cache.hits(resource, cache_key)
+            else:
+                content = self.response_cache.get(resource, cache_key)
+                if content is not None:
+                    return self._cached_call(invocation, call, content), call
+
+        if hedged and self.hedger is not None:
+            race = _HedgeRace(invocation)
+
+            def attempt(hedge: bool) -> tuple[dict[str, Any], UpstreamCall]:
+                attempt_call = dataclasses.replace(call, hedge=True) if hedge else call
+
+                return self._upstream_call(invocation, attempt_call, cache_key, race)
+
+            try:
+                response, winner = self.hedger.run(resource, attempt)
+            except BaseException:
+                # The error of the primary attempt is raised
+                race.decide(call)
+                raise
+
+            race.decide(winner)
+
+            return response, winner
+
+        return self._upstream_call(invocation, call, cache_key)
+
+    def _upstream_call(
+        self,
+        invocation: Invocation,
+        call: UpstreamCall,
+        cache_key: str | None = None,
+        race: "_HedgeRace | None" = None,
+    ) -> tuple[dict[str, Any], UpstreamCall]:
+        self._check_deadline(invocation)
+
+        # Fail fast instead of queueing for a degraded resource
+        breaker = self.circuit_breaker
+        if breaker is not None:
+            try:
+                self._circuit_changed(call.resource, breaker.allow(call.resource))
+            except CircuitOpenError:
+                self.observer.call_rejected(invocation, call)
+                raise
+
+        # Calls aborted by their own deadline or cancellation don't say
+        # anything about the health of the API
+        aborted = False
+
+        wait_start = time.perf_counter()
+        try:
+            self.scheduler.acquire(invocation.tenant, call.quota_cost, current_scope())
+        except BaseException:
+            if breaker is not None:
+                breaker.cancel(call.resource)
+            if race is None:
+                invocation.add_wait(time.perf_counter() - wait_start)
+            raise
+
+        call.wait_time = time.perf_counter() - wait_start
+
+        try:
+            self._check_deadline(invocation)
+
+            return self._execute_call(invocation, call, cache_key, race), call
+        except (DeadlineExceeded, Cancelled):
+            aborted = True
+            raise
+        except HttpError:
+            raise
+        except Exception as e:
+            scope = current_scope()
+            if scope is not None and scope.cancelled:
+                aborted = True
+                raise Cancelled("Invocation was cancelled") from e
+
+            if invocation.expired():
+                aborted = True
+                raise DeadlineExceeded("Deadline passed during upstream call") from e
+
+            raise
+        finally:
+            self.scheduler.release(invocation.tenant)
+
+            if breaker is not None and aborted:
+                breaker.cancel(call.resource)
+            elif breaker is not None:
+                self._circuit_changed(
+                    call.resource,
+                    breaker.record(call.resource, call.duration, call.error),
+                )
+
+    def _check_deadline(self, invocation: Invocation):
+        scope = current_scope()
+        if scope is not None:
+            scope.check()
+
+        if invocation.expired():
+            raise DeadlineExceeded("Deadline passed")
+
+    def _circuit_changed(self, resource: str, state: CircuitState | None):
+        if state is None:
+            return
+
+        self.logger.warning("Circuit of %s is %s", resource, state.value)
+        self.observer.circuit_changed(resource, state)
+
+    def _cached_call(
+        self,
+        invocation: Invocation,
+        call: UpstreamCall,
+        content: bytes,
+    ) -> Any:
+        start = time.perf_counter()
+        response = self.decoder.loads(content)
+
+        call.cached = True
+        call.status = 200
+        call.response_bytes = len(content)
+        call.item_count = len(response.get("items", []))
+        call.parse_time = call.duration = time.perf_counter() - start
+
+        invocation.add_call(call)
+
+        return response
+
+    def _execute_call(
+        self,
+        invocation: Invocation,
+        call: UpstreamCall,
+        cache_key: str | None = None,
+        race: "_HedgeRace | None" = None,
+    ) -> Any:
+        start = time.perf_counter()
+
+        with self.observer.upstream_call(invocation, call):
+            try:
+                apiRequest = getattr(self.youtube, call.resource)().list(**call.params)
+                postproc = getattr(apiRequest, "postproc", None)
+
+                # googleapiclient parses the body in postproc: hook it to split
+                # network time from JSON decoding
+                if postproc is not None:
+
+                    def timed_postproc(resp: Any, content: bytes) -> Any:
+                        call.network_time = time.perf_counter() - start
+                        call.status = resp.status
+                        call.response_bytes = len(content)
+
+                        parse_start = time.perf_counter()
+                        try:
+                            if resp.status < 300 and content:
+                                response = self.decoder.loads(content)
+
+                                cache = self.response_cache
+                                if cache is not None and cache_key is not None:
+                                    cache.set(call.resource, cache_key, content)
+
+                                return response
+
+                            return postproc(resp, content)
+                        finally:
+                            call.parse_time = time.perf_counter() - parse_start
+
+                    apiRequest.postproc = timed_postproc
+
+                http = self._http()
+                with self._bounded(invocation, http):
+                    response = call.response = apiRequest.execute(http=http)
+                call.item_count = len(response.get("items", []))
+            except BaseException as e:
+                call.error = e
+                call.status = getattr(getattr(e, "resp", None), "status", None)
+                raise
+            finally:
+                call.duration = time.perf_counter() - start
+                if not call.network_time:
+                    call.network_time = call.duration - call.parse_time
+
+                if race is not None:
+                    race.finished(call)
+                else:
+                    invocation.add_call(call)
+
+        # Observers are done with the page: don't keep it alive with the invocation
+        call.response = None
+
+        return response
+
+    @contextmanager
+    def _validation(self, invocation: Invocation) -> Iterator[None]:
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            invocation.validation_time += time.perf_counter() - start
+
+    def _list_all(
+        self,
+        invocation: Invocation,
+        request: ListAllRequestMixin,
+        resource: str,
+        item_model: type[BaseModel],
+        response_model: type[R],
+        paged: bool = True,
+        max_page_size: int = 50,
+        offload: bool = True,
+    ) -> R:
+        collected = 0
+        received = 0
+        pages = 0
+        exporter: Exporter | None = None
+        next_page_token = request.resume_page_token
+        seen = request.seen_ids()
+
+        # Pages are validated (and exported) in order on a worker while the
+        # next page is fetched
+        validated: list[Any] = []
+        pipeline: ThreadPoolExecutor | None = None
+        pending: deque[Future[None]] = deque()
+
+        def process(page: list[dict[str, Any]], exporter: Exporter | None):
+            with self._validation(invocation):
+                validated.extend(self.decoder.validate(item_model, i) for i in page)
+
+                # Stream items to storage instead of keeping them in memory
+                if exporter is not None:
+                    exporter.write(validated)
+                    validated.clear()
+
+        if request.export is not None:
+            exporter = self._exporter(invocation, request.export, item_model)
+
+        try:
+            while True:
+                # Stop fetching pages as soon as processing one failed
+                while pending and pending[0].done():
+                    pending.popleft().result()
+
+                if request.remaining(collected) == 0:
+                    # Resumed with a limit earlier responses already reached
+                    next_page_token = None
+                    break
+
+                try:
+                    response, call = self._call(
+                        invocation,
+                        resource,
+                        pageToken=next_page_token,
+                        maxResults=(
+                            request.page_size(collected, max_page_size)
+                            if paged
+                            else None
+                        ),
+                        **request.api_params(),
+                    )
+                except DeadlineExceeded:
+                    # Return what was listed so far, resuming at this page
+                    if not pages:
+                        raise
+
+                    break
+
+                pages += 1
+
+                page, done = request.accept(response["items"], collected, seen)
+                collected += len(page)
+
+                received += call.response_bytes
+                if (
+                    exporter is None
+                    and offload
+                    and self.offloader is not None
+                    and received > self.offloader.threshold
+                ):
+                    exporter = self._exporter(invocation, None, item_model)
+
+                next_page_token = response.get("nextPageToken")
+                if done or not next_page_token:
+                    next_page_token = None
+                    last = True
+                else:
+                    # Count pages of this listing only: invocations may run several
+                    last = request.budget_exhausted(pages) or invocation.expired()
+
+                if last and pipeline is None:
+                    # Nothing to overlap with
+                    process(page, exporter)
+                    break
+
+                if pipeline is None:
+                    pipeline = ThreadPoolExecutor(
+                        max_workers=1,
+                        thread_name_prefix="pages",
+                    )
+
+                pending.append(
+                    pipeline.submit(
+                        contextvars.copy_context().run, process, page, exporter
+                    )
+                )
+
+                if last:
+                    break
+
+            while pending:
+                pending.popleft().result()
+
+            continuation = request.continue_from(next_page_token, collected)
+            encoded_seen = seen.encode() if seen is not None else None
+
+            if exporter is not None:
+                return response_model(
+                    manifest=exporter.close(collected),
+                    continuation=continuation,
+                    seen=encoded_seen,
+                )
+        except BaseException:
+            if pipeline is not None:
+                # Don't write to the exporter while aborting it
+                pipeline.shutdown(cancel_futures=True)
+            if exporter is not None:
+                exporter.abort()
+            raise
+        finally:
+            if pipeline is not None:
+                pipeline.shutdown(wait=False)
+
+        with self._validation(invocation):
+            response = self.decoder.validate(
+                response_model,
+                {"items": [], "continuation": continuation, "seen": encoded_seen},
+            )
+
+        # Items were validated page by page
+        response.items = validated  # type: ignore[attr-defined]
+
+        return response
+
+    def _unseen(self, request: L) -> L | None:
+        """Drop the seen IDs from a lookup by ID, so they are not fetched again.
+
+        Returns None if all of them were seen.
+        """
+        seen = request.seen_ids()
+        if request.id is None or seen is None:
+            return request
+
+        ids = [i for i in request.id if i not in seen]
+        if not ids:
+            return None
+
+        return request.model_copy(update={"id": ids})
+
+    def _exporter(
+        self,
+        invocation: Invocation,
+        format: ExportFormat | None,
+        item_model: type[BaseModel],
+    ) -> Exporter:
+        offloader = self.offloader
+        if offloader is None:
+            raise NotConfiguredError("Exporting results requires an offloader")
+
+        return open_exporter(
+            format,
+            lambda extension, content_type: offloader.open(
+                invocation.name, extension, content_type
             ),
+            item_model,
         )
-        apiResponse = apiRequest.execute()
 
-        return ListChannelsResponse.model_validate(apiResponse)
+    def list_channels(self, request: ListChannelsRequest) -> ListChannelsResponse:
+        with self._invocation("list_channels", request) as invocation:
+            apiResponse = self._execute(
+                invocation,
+                "channels",
+                hedged=True,
+                **request.api_params(),
+            )
+
+            with self._validation(invocation):
+                response = self.decoder.validate(ListChannelsResponse, apiResponse)
+
+            self._remember_resolution(request, response.items)
+
+            return response
 
     def list_all_channels(
         self,
         request: ListAllChannelsRequest,
     ) -> ListAllChannelsResponse:
-        items: List[Channel] = []
-        next_page_token = None
-
-        while True:
-            apiRequest = self.youtube.channels().list(
-                pageToken=next_page_token,
-                maxResults=50,
-                **request.model_dump(
-                    exclude_none=True,
-                    context={"comma_separated": True},
-                ),
+        with self._invocation("list_all_channels", request) as invocation:
+            lookup = self._unseen(request)
+            if lookup is None:
+                return ListAllChannelsResponse.model_validate({"seen": request.seen})
+
+            return self._list_all(
+                invocation,
+                lookup,
+                "channels",
+                Channel,
+                ListAllChannelsResponse,
             )
-            response = apiRequest.execute()
 
-            items.extend(response["items"])
+    def resolve_channels(
+        self,
+        request: ResolveChannelsRequest,
+    ) -> ResolveChannelsResponse:
+        with self._invocation("resolve_channels", request) as invocation:
+            queries = [
+                (handle_key(handle), "forHandle") for handle in request.handles
+            ] + [
+                (username_key(username), "forUsername")
+                for username in request.usernames
+            ]
+
+            resolutions: dict[str, ChannelResolution] = {}
+            misses: dict[str, str] = {}
+            for key, param in queries:
+                if key in resolutions or key in misses:
+                    continue
 
-            next_page_token = response.get("nextPageToken")
-            if not next_page_token:
-                break
+                cached = self.resolution_cache.get(key)
 
-        return ListAllChannelsResponse(items=items)
+                # Resolutions learned from listings may lack the uploads playlist
+                if cached is not None and (
+                    cached.channel_id is None or cached.uploads_playlist_id is not None
+                ):
+                    resolutions[key] = cached
+                else:
+                    misses[key] = param
+
+            # The API takes a single handle or username per call: resolve
+            # the misses concurrently instead
+            def resolve(key: str, param: str) -> ChannelResolution:
+                response = self._execute(
+                    invocation,
+                    "channels",
+                    part="contentDetails",
+                    **{param: key.partition(":")[2]},
+                )
+
+                result = resolution(key)
+                if response.get("items"):
+                    channel = response["items"][0]
+                    playlists = channel.get("contentDetails", {}).get(
+                        "relatedPlaylists", {}
+                    )
+                    result = resolution(key, channel["id"], playlists.get("uploads"))
+
+                self.resolution_cache.set(key, result)
+
+                return result
+
+            if misses:
+                with ThreadPoolExecutor(max_workers=self.max_concurrency) as pool:
+                    futures = {
+                        key: pool.submit(
+                            contextvars.copy_context().run, resolve, key, param
+                        )
+                        for key, param in misses.items()
+                    }
+
+                    for key, future in futures.items():
+                        resolutions[key] = future.result()
+
+            return ResolveChannelsResponse(
+                items=[resolutions[key] for key, _ in queries]
+            )
+
+    def _remember_resolution(self, request: ListChannelsRequest, items: list[Any]):
+        """Cache the channel a handle or username listing resolved to."""
+        if request.for_handle is not None:
+            key = handle_key(request.for_handle)
+        elif request.for_username is not None:
+            key = username_key(request.for_username)
+        else:
+            return
+
+        # No items were asked for: nothing is known about the channel
+        if request.max_results == 0:
+            return
+
+        if not items:
+            self.resolution_cache.set(key, resolution(key))
+            return
+
+        details = getattr(items[0], "content_details", None)
+        playlists = getattr(details, "related_playlists", None)
+        uploads = getattr(playlists, "uploads", None)
+
+        # Don't replace a complete resolution with one lacking the uploads playlist
+        if uploads is None and self.resolution_cache.get(key) is not None:
+            return
+
+        self.resolution_cache.set(key, resolution(key, items[0].id, uploads))
 
     def list_playlists(self, request: ListPlaylistsRequest) -> ListPlaylistsResponse:
-        apiRequest = self.youtube.playlists().list(
-            **request.model_dump(
-                exclude_none=True,
-                context={"comma_separated": True},
-            ),
-        )
-        apiResponse = apiRequest.execute()
+        with self._invocation("list_playlists", request) as invocation:
+            apiResponse = self._execute(
+                invocation,
+                "playlists",
+                hedged=True,
+                **request.api_params(),
+            )
 
-        return ListPlaylistsResponse.model_validate(apiResponse)
+            with self._validation(invocation):
+                return self.decoder.validate(ListPlaylistsResponse, apiResponse)
 
     def list_all_playlists(
         self,
         request: ListAllPlaylistsRequest,
     ) -> ListAllPlaylistsResponse:
-        items: List[Playlist] = []
-        next_page_token = None
-
-        while True:
-            apiRequest = self.youtube.playlists().list(
-                pageToken=next_page_token,
-                maxResults=50,
-                **request.model_dump(
-                    exclude_none=True,
-                    context={"comma_separated": True},
-                ),
+        with self._invocation("list_all_playlists", request) as invocation:
+            return self._list_all(
+                invocation,
+                request,
+                "playlists",
+                Playlist,
+                ListAllPlaylistsResponse,
             )
-            response = apiRequest.execute()
-
-            items.extend(response["items"])
-
-            next_page_token = response.get("nextPageToken")
-            if not next_page_token:
-                break
-
-        return ListAllPlaylistsResponse(items=items)
 
     def list_playlist_items(
         self, request: ListPlaylistItemsRequest
     ) -> ListPlaylistItemsResponse:
-        apiRequest = self.youtube.playlistItems().list(
-            **request.model_dump(
-                exclude_none=True,
-                context={"comma_separated": True},
-            ),
-        )
-        apiResponse = apiRequest.execute()
+        with self._invocation("list_playlist_items", request) as invocation:
+            apiResponse = self._execute(
+                invocation,
+                "playlistItems",
+                hedged=True,
+                **request.api_params(),
+            )
 
-        return ListPlaylistItemsResponse.model_validate(apiResponse)
+            with self._validation(invocation):
+                return self.decoder.validate(ListPlaylistItemsResponse, apiResponse)
 
     def list_all_playlist_items(
         self,
         request: ListAllPlaylistItemsRequest,
     ) -> ListAllPlaylistItemsResponse:
-        items: List[PlaylistItem] = []
-        next_page_token = None
-
-        while True:
-            apiRequest = self.youtube.playlistItems().list(
-                pageToken=next_page_token,
-                maxResults=50,
-                **request.model_dump(
-                    exclude_none=True,
-                    context={"comma_separated": True},
-                ),
+        with self._invocation("list_all_playlist_items", request) as invocation:
+            return self._list_all(
+                invocation,
+                request,
+                "playlistItems",
+                PlaylistItem,
+                ListAllPlaylistItemsResponse,
             )
-            response = apiRequest.execute()
 
-            items.extend(response["items"])
+    def diff_playlist(self, request: DiffPlaylistRequest) -> DiffPlaylistResponse:
+        with self._invocation("diff_playlist", request) as invocation:
+            differ = PlaylistDiffer(request.index)
+
+            # Diffs must see the current items: replace cached pages instead
+            # of reading them
+            refreshing = _refreshing.set({})
+            try:
+                page_token = None
+                while True:
+                    response, _ = self._call(
+                        invocation,
+                        "playlistItems",
+                        part="contentDetails",
+                        playlistId=request.playlist_id,
+                        maxResults=PAGE_SIZE,
+                        pageToken=page_token,
+                        fields="etag,nextPageToken,items(id,etag,contentDetails/videoId)",
+                    )
+
+                    with self._validation(invocation):
+                        differ.page(response.get("etag"), response.get("items", []))
 
-            next_page_token = response.get("nextPageToken")
-            if not next_page_token:
-                break
+                    page_token = response.get("nextPageToken")
+                    if not page_token:
+                        break
+            finally:
+                _refreshing.reset(refreshing)
 
-        return ListAllPlaylistItemsResponse(items=items)
+            with self._validation(invocation):
+                return differ.result()
 
     def list_videos(self, request: ListVideosRequest) -> ListVideosResponse:
-        apiRequest = self.youtube.videos().list(
-            **request.model_dump(
-                exclude_none=True,
-                context={"comma_separated": True},
-            ),
-        )
-        apiResponse = apiRequest.execute()
+        with self._invocation("list_videos", request) as invocation:
+            apiResponse = self._execute(
+                invocation,
+                "videos",
+                hedged=True,
+                **request.api_params(),
+            )
 
-        return ListVideosResponse.model_validate(apiResponse)
+            with self._validation(invocation):
+                return self.decoder.validate(ListVideosResponse, apiResponse)
 
     def list_all_videos(
         self,
         request: ListAllVideosRequest,
     ) -> ListAllVideosResponse:
-        items: List[Video] = []
-        next_page_token = None
-        max_results = 50
-
-        if request.id is not None:
-            max_results = None
-
-        while True:
-            apiRequest = self.youtube.videos().list(
-                pageToken=next_page_token,
-                maxResults=max_results,
-                **request.model_dump(
-                    exclude_none=True,
-                    context={"comma_separated": True},
-                ),
+        with self._invocation("list_all_videos", request) as invocation:
+            lookup = self._unseen(request)
+            if lookup is None:
+                return ListAllVideosResponse.model_validate({"seen": request.seen})
+
+            return self._list_all(
+                invocation,
+                lookup,
+                "videos",
+                Video,
+                ListAllVideosResponse,
+                # maxResults is not supported with the id filter
+                paged=request.id is None,
             )
-            response = apiRequest.execute()
 
-            items.extend(response["items"])
+    def list_charts(self, request: ListChartsRequest) -> ListChartsResponse:
+        with self._invocation("list_charts", request) as invocation:
+
+            def run(region_code: str, video_category_id: str | None) -> list[Any]:
+                response = self._list_all(
+                    invocation,
+                    request.for_chart(region_code, video_category_id),
+                    "videos",
+                    Video,
+                    ListAllVideosResponse,
+                    # Charts are merged into one response
+                    offload=False,
+                )
+
+                return response.items
+
+            # Charts are listed concurrently; their pages are cached like any other
+            with ThreadPoolExecutor(max_workers=self.max_concurrency) as pool:
+                futures = [
+                    (
+                        region_code,
+                        video_category_id,
+                        pool.submit(
+                            contextvars.copy_context().run,
+                            run,
+                            region_code,
+                            video_category_id,
+                        ),
+                    )
+                    for region_code, video_category_id in request.charts()
+                ]
+
+                seen = request.seen_ids()
+                videos: dict[str, Any] = {}
+                charts = []
+                for region_code, video_category_id, future in futures:
+                    chart = ChartRanking(
+                        region_code=region_code,
+                        video_category_id=video_category_id,
+                    )
+                    charts.append(chart)
+
+                    try:
+                        items = future.result()
+                    except Exception as e:
+                        if not _client_error(e):
+                            raise
+
+                        # e.g. charts are not available in the region
+                        chart.error = BatchError(type=type(e).__name__, message=str(e))
+                        continue
+
+                    for video in items:
+                        chart.video_ids.append(video.id)
+
+                        if seen is not None:
+                            if video.id in seen:
+                                continue
+
+                            seen.add(video.id)
+
+                        videos.setdefault(video.id, video)
+
+            with self._validation(invocation):
+                # Results need to be models to be part of the response
+                return ListChartsResponse(
+                    videos=[
+                        video
+                        if isinstance(video, BaseModel)
+                        else Video.model_validate_json(encode_json(video))
+                        for video in videos.values()
+                    ],
+                    charts=charts,
+                    seen=seen.encode() if seen is not None else None,
+                )
+
+    def list_comment_threads(
+        self,
+        request: ListCommentThreadsRequest,
+    ) -> ListCommentThreadsResponse:
+        with self._invocation("list_comment_threads", request) as invocation:
+            apiResponse = self._execute(
+                invocation,
+                "commentThreads",
+                hedged=True,
+                **request.api_params(),
+            )
+
+            with self._validation(invocation):
+                return self.decoder.validate(ListCommentThreadsResponse, apiResponse)
+
+    def list_all_comment_threads(
+        self,
+        request: ListAllCommentThreadsRequest,
+    ) -> ListAllCommentThreadsResponse:
+        with self._invocation("list_all_comment_threads", request) as invocation:
+            return self._list_all(
+                invocation,
+                request,
+                "commentThreads",
+                CommentThread,
+                ListAllCommentThreadsResponse,
+                # maxResults is not supported with the id filter
+                paged=request.id is None,
+                max_page_size=100,
+            )
+
+    def list_all_comment_threads_by_video(
+        self,
+        request: ListAllCommentThreadsByVideoRequest,
+    ) -> ListAllCommentThreadsByVideoResponse:
+        with self._invocation(
+            "list_all_comment_threads_by_video", request
+        ) as invocation:
+
+            def run(video_id: str) -> VideoCommentThreads:
+                try:
+                    response = self._list_all(
+                        invocation,
+                        request.for_video(video_id),
+                        "commentThreads",
+                        CommentThread,
+                        ListAllCommentThreadsResponse,
+                        max_page_size=100,
+                    )
+                except Exception as e:
+                    if not _client_error(e):
+                        raise
+
+                    # e.g. comments are disabled on the video
+                    return VideoCommentThreads(
+                        video_id=video_id,
+                        error=BatchError(type=type(e).__name__, message=str(e)),
+                    )
+
+                # Results need to be models to be part of the response
+                if not isinstance(response, BaseModel):
+                    response = ListAllCommentThreadsResponse.model_validate_json(
+                        encode_json(response)
+                    )
+
+                return VideoCommentThreads(video_id=video_id, response=response)
+
+            seen = request.seen_ids()
+
+            # Videos are paged concurrently; large results are offloaded per video
+            with ThreadPoolExecutor(max_workers=self.max_concurrency) as pool:
+                futures = [
+                    pool.submit(contextvars.copy_context().run, run, video_id)
+                    for video_id in request.video_ids
+                    if seen is None or video_id not in seen
+                ]
+                items = [f.result() for f in futures]
+
+            if seen is not None:
+                # Incomplete videos are resumed or retried later
+                seen.update(
+                    item.video_id
+                    for item in items
+                    if item.response is not None and item.response.continuation is None
+                )
+
+            return ListAllCommentThreadsByVideoResponse(
+                items=items,
+                seen=seen.encode() if seen is not None else None,
+            )
+
+    def aggregate_channel_videos(
+        self,
+        request: AggregateChannelVideosRequest,
+    ) -> AggregateChannelVideosResponse:
+        from .analytics import aggregate
+
+        with self._invocation("aggregate_channel_videos", request) as invocation:
+            channels = self._execute(
+                invocation,
+                "channels",
+                part="contentDetails",
+                id=request.channel_id,
+            )
+            if not channels.get("items"):
+                raise NotFoundError(f"Channel not found: {request.channel_id}")
+
+            uploads = channels["items"][0]["contentDetails"]["relatedPlaylists"][
+                "uploads"
+            ]
+
+            def videos(ids: list[str]) -> list[dict[str, Any]]:
+                return self._execute(
+                    invocation,
+                    "videos",
+                    part="snippet,statistics,contentDetails",
+                    id=",".join(ids),
+                )["items"]
+
+            # Fetch statistics of a page of uploads while listing the next one
+            with ThreadPoolExecutor(max_workers=self.max_concurrency) as pool:
+                futures = []
+                next_page_token = None
+
+                while True:
+                    response = self._execute(
+                        invocation,
+                        "playlistItems",
+                        part="contentDetails",
+                        playlistId=uploads,
+                        maxResults=50,
+                        pageToken=next_page_token,
+                    )
+
+                    # Uploads are listed newest first
+                    ids = []
+                    done = False
+                    for item in response["items"]:
+                        published = published_at(item)
+                        if (
+                            request.published_after is not None
+                            and published is not None
+                            and published < request.published_after
+                        ):
+                            done = True
+                            break
+
+                        ids.append(item["contentDetails"]["videoId"])
+
+                    if ids:
+                        futures.append(
+                            pool.submit(contextvars.copy_context().run, videos, ids)
+                        )
+
+                    next_page_token = response.get("nextPageToken")
+                    if done or not next_page_token:
+                        break
+
+                items = [item for f in futures for item in f.result()]
+
+            with self._validation(invocation):
+                return aggregate(request, items)
+
+    def poll_live_videos(
+        self, request: PollLiveVideosRequest
+    ) -> PollLiveVideosResponse:
+        with self._invocation("poll_live_videos", request) as invocation:
+
+            def poll(ids: list[str]) -> list[dict[str, Any]]:
+                # Live samples must be fresh: replace cached responses instead
+                # of reading them
+                _refreshing.set({})
+
+                return self._execute(
+                    invocation,
+                    "videos",
+                    part="snippet,liveStreamingDetails",
+                    id=",".join(ids),
+                    # Leave out everything else of the snippet
+                    fields="items(id,snippet/liveBroadcastContent,liveStreamingDetails)",
+                ).get("items", [])
+
+            with ThreadPoolExecutor(max_workers=self.max_concurrency) as pool:
+                futures = [
+                    pool.submit(
+                        contextvars.copy_context().run,
+                        poll,
+                        request.video_ids[i : i + BATCH_SIZE],
+                    )
+                    for i in range(0, len(request.video_ids), BATCH_SIZE)
+                ]
+                items = {item["id"]: item for f in futures for item in f.result()}
+
+            sampled_at = time.time()
+
+            with self._validation(invocation):
+                return PollLiveVideosResponse(
+                    items=[
+                        LiveVideoSample.model_validate(
+                            {
+                                **items.get(video_id, {}).get(
+                                    "liveStreamingDetails", {}
+                                ),
+                                "liveBroadcastContent": items.get(video_id, {})
+                                .get("snippet", {})
+                                .get("liveBroadcastContent"),
+                                "videoId": video_id,
+                                "sampledAt": sampled_at,
+                            }
+                        )
+                        for video_id in request.video_ids
+                    ]
+                )
+
+    def batch(self, request: BatchRequest) -> BatchResponse:
+        with self._invocation("batch", request):
+            methods = {
+                operation: getattr(self, _method_name(operation.value))
+                for operation in BATCH_OPERATIONS
+            }
+
+            def run(entry: BatchEntry) -> BatchResult:
+                try:
+                    response = methods[entry.operation](entry.request)
+                except Exception as e:
+                    # Transient errors fail the batch, so it is retried
+                    if not _client_error(e):
+                        raise
+
+                    return BatchResult(
+                        operation=entry.operation,
+                        error=BatchError(type=type(e).__name__, message=str(e)),
+                    )
+
+                # Results need to be models to be part of the batch response
+                if not isinstance(response, BaseModel):
+                    model = BATCH_OPERATIONS[entry.operation][1]
+                    response = model.model_validate_json(encode_json(response))
+
+                return BatchResult(operation=entry.operation, response=response)
+
+            with ThreadPoolExecutor(max_workers=self.max_concurrency) as pool:
+                # Copy the context per entry so observers (e.g. tracing) see the batch
+                futures = [
+                    pool.submit(contextvars.copy_context().run, run, entry)
+                    for entry in request.items
+                ]
+
+                return BatchResponse(items=[f.result() for f in futures])
+
+    def prefetch(self, request: PrefetchRequest) -> PrefetchResponse:
+        if self.response_cache is None:
+            raise NotConfiguredError("Prefetching requires a response cache")
+
+        with self._invocation("prefetch", request):
+
+            def run(query: PrefetchQuery) -> PrefetchResult:
+                hits: dict[str, int] = {}
+                _refreshing.set(hits)
+
+                try:
+                    getattr(self, _method_name(query.operation.value))(query.request)
+                except Exception as e:
+                    if not _client_error(e):
+                        raise
+
+                    return PrefetchResult(
+                        operation=query.operation,
+                        hits=sum(hits.values()),
+                        interval=query.interval,
+                        error=BatchError(type=type(e).__name__, message=str(e)),
+                    )
+
+                return PrefetchResult(
+                    operation=query.operation,
+                    hits=sum(hits.values()),
+                    interval=query.next_interval(sum(hits.values())),
+                )
+
+            with ThreadPoolExecutor(max_workers=self.max_concurrency) as pool:
+                # Each query sets the refresh marker in its own context copy
+                futures = [
+                    pool.submit(contextvars.copy_context().run, run, query)
+                    for query in request.queries
+                ]
+
+                return PrefetchResponse(items=[f.result() for f in futures])
+
+
+class _HedgeRace:
+    """Adds the attempts of a hedged call to its invocation once one won.
+
+    Only the winning attempt's time counts; the other one is kept as a lost
+    call, whenever it finishes.
+    """
+
+    def __init__(self, invocation: Invocation):
+        self.invocation = invocation
+
+        self._lock = threading.Lock()
+        self._winner: UpstreamCall | None = None
+        self._finished: list[UpstreamCall] | None = []
+
+    def finished(self, call: UpstreamCall):
+        with self._lock:
+            if self._finished is not None:
+                self._finished.append(call)
+                return
+
+        self._add(call)
+
+    def decide(self, winner: UpstreamCall):
+        with self._lock:
+            self._winner = winner
+            finished, self._finished = self._finished or [], None
+
+        for call in finished:
+            self._add(call)
+
+    def _add(self, call: UpstreamCall):
+        call.lost = call is not self._winner
+        self.invocation.add_call(call)
+
+
+def _client_error(error: Exception) -> bool:
+    """Return whether an error is an answer to the request itself.
+
+    Invalid requests and client errors (e.g. not found) fail the same way on
+    retry; server errors, throttling, open circuits and aborted invocations
+    don't, so they are not reported as results.
+    """
+    if isinstance(error, HttpError):
+        return 400 <= error.resp.status < 500 and error.resp.status != 429
+
+    # Including validation errors
+    return isinstance(error, ValueError)
 
-            next_page_token = response.get("nextPageToken")
-            if not next_page_token:
-                break
 
-        return ListAllVideosResponse(items=items)
+def _method_name(operation: str) -> str:
+    return "".join(f"_{c.lower()}" if c.isupper() else c for c in operation)
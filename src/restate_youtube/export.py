@@ -0,0 +1,337 @@
+import io
+import json
+from collections.abc import Callable
+from dataclasses import dataclass
+from datetime import datetime
+from enum import Enum
+from typing import Any
+
+from pydantic import BaseModel
+
+from .decode import encode_json
+from .model import ExportFormat, OffloadManifest
+from .model_channels import Channel
+from .model_comment_threads import CommentThread
+from .model_playlist_item import PlaylistItem
+from .model_playlists import Playlist
+from .model_videos import Video, duration_seconds
+from .offload import Upload
+
+
+@dataclass(frozen=True)
+class Column:
+    """A column of the flat export schema.
+
+    ``path`` is the dot-separated attribute path of the value in the model.
+    """
+
+    name: str
+    type: str
+    path: str
+    convert: Callable[[Any], Any] | None = None
+
+    def value(self, item: BaseModel) -> Any:
+        value: Any = item
+        for attr in self.path.split("."):
+            value = getattr(value, attr, None)
+            if value is None:
+                return None
+
+        if isinstance(value, Enum):
+            value = value.value
+
+        return self.convert(value) if self.convert else value
+
+
+VIDEO_COLUMNS = [
+    Column("id", "string", "id"),
+    Column("channel_id", "string", "snippet.channel_id"),
+    Column("channel_title", "string", "snippet.channel_title"),
+    Column("title", "string", "snippet.title"),
+    Column("description", "string", "snippet.description"),
+    Column("published_at", "timestamp", "snippet.published_at"),
+    Column("category_id", "string", "snippet.category_id"),
+    Column("tags", "list<string>", "snippet.tags"),
+    Column("default_language", "string", "snippet.default_language"),
+    Column("live_broadcast_content", "string", "snippet.live_broadcast_content"),
+    Column(
+        "duration_seconds",
+        "int64",
+        "content_details.duration",
+        duration_seconds,
+    ),
+    Column("definition", "string", "content_details.definition"),
+    Column("caption", "string", "content_details.caption"),
+    Column("licensed_content", "bool", "content_details.licensed_content"),
+    Column("privacy_status", "string", "status.privacy_status"),
+    Column("made_for_kids", "bool", "status.made_for_kids"),
+    Column("view_count", "int64", "statistics.view_count", int),
+    Column("like_count", "int64", "statistics.like_count", int),
+    Column("comment_count", "int64", "statistics.comment_count", int),
+]
+
+CHANNEL_COLUMNS = [
+    Column("id", "string", "id"),
+    Column("title", "string", "snippet.title"),
+    Column("description", "string", "snippet.description"),
+    Column("custom_url", "string", "snippet.custom_url"),
+    Column("published_at", "timestamp", "snippet.published_at"),
+    Column("country", "string", "snippet.country"),
+    Column(
+        "uploads_playlist_id",
+        "string",
+        "content_details.related_playlists.uploads",
+    ),
+    Column("view_count", "int64", "statistics.view_count"),
+    Column("subscriber_count", "int64", "statistics.subscriber_count"),
+    Column("hidden_subscriber_count", "bool", "statistics.hidden_subscriber_count"),
+    Column("video_count", "int64", "statistics.video_count"),
+    Column("privacy_status", "string", "status.privacy_status"),
+    Column("made_for_kids", "bool", "status.made_for_kids"),
+]
+
+PLAYLIST_COLUMNS = [
+    Column("id", "string", "id"),
+    Column("channel_id", "string", "snippet.channel_id"),
+    Column("channel_title", "string", "snippet.channel_title"),
+    Column("title", "string", "snippet.title"),
+    Column("description", "string", "snippet.description"),
+    Column("published_at", "timestamp", "snippet.published_at"),
+    Column("item_count", "int64", "content_details.item_count"),
+    Column("privacy_status", "string", "status.privacy_status"),
+]
+
+PLAYLIST_ITEM_COLUMNS = [
+    Column("id", "string", "id"),
+    Column("playlist_id", "string", "snippet.playlist_id"),
+    Column("position", "int64", "snippet.position"),
+    Column("video_id", "string", "content_details.video_id"),
+    Column("channel_id", "string", "snippet.channel_id"),
+    Column("title", "string", "snippet.title"),
+    Column("description", "string", "snippet.description"),
+    Column("video_owner_channel_id", "string", "snippet.video_owner_channel_id"),
+    Column(
+        "video_owner_channel_title",
+        "string",
+        "snippet.video_owner_channel_title",
+    ),
+    Column("added_at", "timestamp", "snippet.published_at"),
+    Column("video_published_at", "timestamp", "content_details.video_published_at"),
+    Column("privacy_status", "string", "status.privacy_status"),
+]
+
+COMMENT_THREAD_COLUMNS = [
+    Column("id", "string", "id"),
+    Column("video_id", "string", "snippet.video_id"),
+    Column("channel_id", "string", "snippet.channel_id"),
+    Column(
+        "author_display_name",
+        "string",
+        "snippet.top_level_comment.snippet.author_display_name",
+    ),
+    Column(
+        "author_channel_id",
+        "string",
+        "snippet.top_level_comment.snippet.author_channel_id.value",
+    ),
+    Column("text", "string", "snippet.top_level_comment.snippet.text_original"),
+    Column("like_count", "int64", "snippet.top_level_comment.snippet.like_count"),
+    Column("reply_count", "int64", "snippet.total_reply_count"),
+    Column(
+        "published_at", "timestamp", "snippet.top_level_comment.snippet.published_at"
+    ),
+    Column("updated_at", "timestamp", "snippet.top_level_comment.snippet.updated_at"),
+]
+
+# Flat schema of each exportable item model
+COLUMNS: dict[type[BaseModel], list[Column]] = {
+    Video: VIDEO_COLUMNS,
+    Channel: CHANNEL_COLUMNS,
+    Playlist: PLAYLIST_COLUMNS,
+    PlaylistItem: PLAYLIST_ITEM_COLUMNS,
+    CommentThread: COMMENT_THREAD_COLUMNS,
+}
+
+
+class Exporter:
+    """Writes items page by page to an upload."""
+
+    extension = "ndjson"
+    content_type = "application/x-ndjson"
+
+    def __init__(self, upload: Upload):
+        self.upload = upload
+
+    def write(self, items: list[BaseModel]):
+        for item in items:
+            self.upload.write(encode_json(item) + b"\n")
+
+    def close(self, item_count: int) -> OffloadManifest:
+        return self.upload.close(item_count)
+
+    def abort(self):
+        self.upload.abort()
+
+
+class NDJSONExporter(Exporter):
+    """Writes flat records as newline-delimited JSON."""
+
+    def __init__(self, upload: Upload, columns: list[Column]):
+        super().__init__(upload)
+
+        self.columns = columns
+
+    def write(self, items: list[BaseModel]):
+        for item in items:
+            record = {c.name: c.value(item) for c in self.columns}
+            self.upload.write(
+                json.dumps(record, default=_json_default).encode() + b"\n"
+            )
+
+
+class _UploadFile(io.RawIOBase):
+    """File-like adapter for writers that expect a stream (e.g. pyarrow)."""
+
+    def __init__(self, upload: Upload):
+        self.upload = upload
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, b: Any) -> int:
+        data = bytes(b)
+        self.upload.write(data)
+
+        return len(data)
+
+
+class ArrowExporter(Exporter):
+    """Writes flat records as an Arrow IPC stream, one record batch per page.
+
+    Requires pyarrow.
+    """
+
+    extension = "arrows"
+    content_type = "application/vnd.apache.arrow.stream"
+
+    def __init__(self, upload: Upload, columns: list[Column]):
+        super().__init__(upload)
+
+        self.columns = columns
+        self.schema = arrow_schema(columns)
+        self._writer = self._open(_UploadFile(upload))
+
+    def _open(self, sink: Any) -> Any:
+        import pyarrow as pa
+
+        return pa.ipc.new_stream(sink, self.schema)
+
+    def _batch(self, items: list[BaseModel]) -> Any:
+        import pyarrow as pa
+
+        return pa.RecordBatch.from_pydict(
+            {c.name: [c.value(item) for item in items] for c in self.columns},
+            schema=self.schema,
+        )
+
+    def write(self, items: list[BaseModel]):
+        if items:
+            self._writer.write_batch(self._batch(items))
+
+    def close(self, item_count: int) -> OffloadManifest:
+        self._writer.close()
+
+        return super().close(item_count)
+
+
+class ParquetExporter(ArrowExporter):
+    """Writes flat records as Parquet.
+
+    Pages are buffered into row groups of ``row_group_size`` rows.
+    Requires pyarrow.
+    """
+
+    extension = "parquet"
+    content_type = "application/vnd.apache.parquet"
+
+    def __init__(
+        self,
+        upload: Upload,
+        columns: list[Column],
+        row_group_size: int = 10_000,
+    ):
+        self.row_group_size = row_group_size
+        self._rows: list[BaseModel] = []
+
+        super().__init__(upload, columns)
+
+    def _open(self, sink: Any) -> Any:
+        import pyarrow.parquet as pq
+
+        return pq.ParquetWriter(sink, self.schema)
+
+    def _flush(self):
+        if self._rows:
+            self._writer.write_batch(self._batch(self._rows))
+            self._rows = []
+
+    def write(self, items: list[BaseModel]):
+        self._rows += items
+
+        if len(self._rows) >= self.row_group_size:
+            self._flush()
+
+    def close(self, item_count: int) -> OffloadManifest:
+        self._flush()
+
+        return super().close(item_count)
+
+
+def arrow_schema(columns: list[Column]) -> Any:
+    """Return the Arrow schema of a list of columns."""
+    import pyarrow as pa
+
+    types = {
+        "string": pa.string(),
+        "int64": pa.int64(),
+        "bool": pa.bool_(),
+        "timestamp": pa.timestamp("us", tz="UTC"),
+        "list<string>": pa.list_(pa.string()),
+    }
+
+    return pa.schema([pa.field(c.name, types[c.type]) for c in columns])
+
+
+def open_exporter(
+    format: ExportFormat | None,
+    upload_factory: Callable[[str, str], Upload],
+    item_model: type[BaseModel],
+) -> Exporter:
+    """Create an exporter for ``format`` writing to a new upload.
+
+    Without a format, items are written in the JSON format of the response.
+    """
+    exporters: dict[ExportFormat, type[NDJSONExporter | ArrowExporter]] = {
+        ExportFormat.NDJSON: NDJSONExporter,
+        ExportFormat.ARROW: ArrowExporter,
+        ExportFormat.PARQUET: ParquetExporter,
+    }
+
+    if format is None:
+        return Exporter(upload_factory(Exporter.extension, Exporter.content_type))
+
+    exporter = exporters[format]
+    upload = upload_factory(exporter.extension, exporter.content_type)
+
+    try:
+        return exporter(upload, COLUMNS[item_model])
+    except BaseException:
+        upload.abort()
+        raise
+
+
+def _json_default(value: Any) -> Any:
+    if isinstance(value, datetime):
+        return value.isoformat()
+
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
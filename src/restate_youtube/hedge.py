@@ -0,0 +1,124 @@
+import contextvars
+import threading
+import time
+from collections import deque
+from collections.abc import Callable
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import TypeVar
+
+T = TypeVar("T")
+
+
+class Hedger:
+    """Sends a duplicate of slow idempotent calls; the first response wins.
+
+    A call is hedged once it takes longer than the ``percentile`` of the
+    recent durations of its resource (and at least ``min_delay`` seconds).
+    Hedges spend quota, so every call earns ``budget`` hedges, banked up to
+    ``max_burst``: with the default budget, at most 5% of calls are hedged.
+    """
+
+    def __init__(
+        self,
+        percentile: float = 95,
+        budget: float = 0.05,
+        max_burst: float = 10,
+        min_delay: float = 0.05,
+        min_samples: int = 20,
+        window: int = 200,
+        max_workers: int = 32,
+    ):
+        self.percentile = percentile
+        self.budget = budget
+        self.max_burst = max_burst
+        self.min_delay = min_delay
+        self.min_samples = min_samples
+        self.window = window
+
+        self._lock = threading.Lock()
+        self._durations: dict[str, deque[float]] = {}
+        self._credit = 0.0
+        self._pool = ThreadPoolExecutor(
+            max_workers=max_workers,
+            thread_name_prefix="hedge",
+        )
+
+    def delay(self, resource: str) -> float | None:
+        """Return how long to wait for a call before hedging it.
+
+        Calls are not hedged until ``min_samples`` calls were observed.
+        """
+        with self._lock:
+            durations = sorted(self._durations.get(resource, ()))
+
+        if len(durations) < self.min_samples:
+            return None
+
+        index = min(len(durations) - 1, int(len(durations) * self.percentile / 100))
+
+        return max(self.min_delay, durations[index])
+
+    def observe(self, resource: str, duration: float):
+        with self._lock:
+            durations = self._durations.get(resource)
+            if durations is None:
+                durations = self._durations[resource] = deque(maxlen=self.window)
+
+            durations.append(duration)
+
+    def run(self, resource: str, attempt: Callable[[bool], T]) -> T:
+        """Run ``attempt(False)``, and ``attempt(True)`` if it is slow.
+
+        Returns the first successful result; the slower attempt runs to
+        completion in the background. Raises the error of the primary
+        attempt if both fail.
+        """
+        with self._lock:
+            self._credit = min(self.max_burst, self._credit + self.budget)
+
+        delay = self.delay(resource)
+        if delay is None:
+            return self._timed(resource, attempt, False)
+
+        primary = self._submit(resource, attempt, False)
+        if wait([primary], timeout=delay).done or not self._spend():
+            return primary.result()
+
+        pending = {primary, self._submit(resource, attempt, True)}
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                if future.exception() is None:
+                    return future.result()
+
+        return primary.result()
+
+    def _submit(
+        self,
+        resource: str,
+        attempt: Callable[[bool], T],
+        hedge: bool,
+    ) -> Future[T]:
+        return self._pool.submit(
+            contextvars.copy_context().run,
+            self._timed,
+            resource,
+            attempt,
+            hedge,
+        )
+
+    def _timed(self, resource: str, attempt: Callable[[bool], T], hedge: bool) -> T:
+        start = time.perf_counter()
+        result = attempt(hedge)
+        self.observe(resource, time.perf_counter() - start)
+
+        return result
+
+    def _spend(self) -> bool:
+        with self._lock:
+            if self._credit < 1:
+                return False
+
+            self._credit -= 1
+
+            return True
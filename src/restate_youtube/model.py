@@ -1,7 +1,26 @@
+import base64
+import hashlib
+import json
+import time
+from collections.abc import Callable
+from datetime import UTC, datetime
 from enum import Enum
-from typing import Any, List, Type
+from typing import Any, ClassVar, List, Self, Type
 
-from pydantic import BaseModel, Field
+from pydantic import (
+    BaseModel,
+    ConfigDict,
+    Field,
+    PrivateAttr,
+    SerializationInfo,
+    SerializerFunctionWrapHandler,
+    TypeAdapter,
+    field_validator,
+    model_serializer,
+    model_validator,
+)
+
+from .seen import SeenIds
 
 
 class PrivacyStatus(str, Enum):
@@ -59,6 +78,584 @@ class Localized(BaseModel):
     description: str
 
 
+class LazyModel(BaseModel):
+    """Mixin for resources that validate their parts on first access.
+
+    Parts (every field but ``kind``, ``etag`` and ``id``) are kept as raw
+    API data until read, then validated and cached. Parts that were never
+    read are serialized as received.
+    """
+
+    __eager_fields__: ClassVar[frozenset[str]] = frozenset({"kind", "etag", "id"})
+    __part_adapters__: ClassVar[dict[str, TypeAdapter]]
+    __lazy_layout__: ClassVar[list[tuple[str, str, bool, Callable[[], Any]]]]
+
+    _raw_parts: dict[str, Any] = PrivateAttr(default_factory=dict)
+
+    @classmethod
+    def lazy_validate(cls, data: dict[str, Any]) -> Self:
+        """Create an instance from raw API data without validating it.
+
+        Like ``model_construct``, but without setting defaults for parts
+        present in ``data``, which is what makes it cheap.
+        """
+        layout = cls.__dict__.get("__lazy_layout__")
+        if layout is None:
+            layout = cls.__lazy_layout__ = [
+                (
+                    name,
+                    field.alias or name,
+                    name in cls.__eager_fields__,
+                    field.default_factory or (lambda d=field.default: d),
+                )
+                for name, field in cls.model_fields.items()
+            ]
+
+        values: dict[str, Any] = {}
+        parts: dict[str, Any] = {}
+        fields_set: set[str] = set()
+
+        for name, key, eager, default in layout:
+            if key not in data:
+                values[name] = default()
+            elif eager:
+                values[name] = data[key]
+                fields_set.add(name)
+            else:
+                parts[name] = data[key]
+                fields_set.add(name)
+
+        instance = cls.__new__(cls)
+        object.__setattr__(instance, "__dict__", values)
+        object.__setattr__(instance, "__pydantic_fields_set__", fields_set)
+        object.__setattr__(instance, "__pydantic_extra__", None)
+        object.__setattr__(instance, "__pydantic_private__", {"_raw_parts": parts})
+
+        return instance
+
+    def __getattr__(self, name: str) -> Any:
+        private = object.__getattribute__(self, "__pydantic_private__")
+        raw_parts = private.get("_raw_parts") if private else None
+
+        if raw_parts and name in raw_parts:
+            cls = type(self)
+            if "__part_adapters__" not in cls.__dict__:
+                cls.__part_adapters__ = {}
+
+            adapter = cls.__part_adapters__.get(name)
+            if adapter is None:
+                adapter = TypeAdapter(cls.model_fields[name].annotation)
+                cls.__part_adapters__[name] = adapter
+
+            value = self.__dict__[name] = adapter.validate_python(raw_parts[name])
+            del raw_parts[name]
+
+            return value
+
+        return super().__getattr__(name)  # type: ignore[misc]
+
+    def __copy__(self) -> Self:
+        copied = super().__copy__()
+
+        # Reading a part of the copy must not take it from the original
+        private = copied.__pydantic_private__
+        if private and private.get("_raw_parts"):
+            private["_raw_parts"] = dict(private["_raw_parts"])
+
+        return copied
+
+    def model_copy(
+        self,
+        *,
+        update: dict[str, Any] | None = None,
+        deep: bool = False,
+    ) -> Self:
+        copied = super().model_copy(update=update, deep=deep)
+
+        # Updated parts replace the raw ones
+        if update and copied._raw_parts:
+            for name in update:
+                copied._raw_parts.pop(name, None)
+
+        return copied
+
+    @model_serializer(mode="wrap")
+    def serialize_raw_parts(
+        self,
+        handler: SerializerFunctionWrapHandler,
+        info: SerializationInfo,
+    ) -> Any:
+        if not self._raw_parts:
+            return handler(self)
+
+        # Parts filtered by their contents are validated to be filtered
+        for name in list(self._raw_parts):
+            if _nested_filter(info.include, name) or _nested_filter(info.exclude, name):
+                getattr(self, name)
+
+        data = handler(self)
+        if not self._raw_parts:
+            return data
+
+        by_alias = info.by_alias
+        if by_alias is None:
+            by_alias = self.model_config.get("serialize_by_alias", False)
+
+        # Keep the field order of the model
+        result = {}
+        for name, field in type(self).model_fields.items():
+            key = field.alias or name if by_alias else name
+            if name in self._raw_parts:
+                value = self._raw_parts[name]
+                if _filtered(
+                    info, name, value, field.get_default(call_default_factory=True)
+                ):
+                    continue
+
+                result[key] = value
+            elif key in data:
+                result[key] = data[key]
+
+        return result
+
+
+def _filter_of(spec: Any, name: str) -> Any:
+    """Return the include or exclude filter of a field, if any."""
+    if spec is None:
+        return None
+
+    if isinstance(spec, dict):
+        return spec.get(name)
+
+    return True if name in spec else None
+
+
+def _nested_filter(spec: Any, name: str) -> bool:
+    return isinstance(_filter_of(spec, name), (dict, set))
+
+
+def _filtered(info: SerializationInfo, name: str, value: Any, default: Any) -> bool:
+    """Return whether a raw part is left out of a dump."""
+    if info.include is not None and _filter_of(info.include, name) is None:
+        return True
+
+    if _filter_of(info.exclude, name) not in (None, False):
+        return True
+
+    if info.exclude_none and value is None:
+        return True
+
+    return info.exclude_defaults and value == default
+
+
+class RequestMixin(BaseModel):
+    """Mixin for request options handled by the service itself.
+
+    These options are never sent to the YouTube Data API.
+    """
+
+    debug: bool = Field(
+        False,
+        description="Log a timing profile of the invocation",
+    )
+
+    tenant: str | None = Field(
+        None,
+        description=(
+            "Caller identity upstream calls are scheduled fairly by"
+            " (default onBehalfOfContentOwner)"
+        ),
+    )
+
+    def api_params(self) -> dict[str, Any]:
+        """Return the request as keyword arguments for the YouTube API client."""
+        # The client formats enums with str(), i.e. as "Chart.MOST_POPULAR"
+        return self.model_dump(
+            mode="json",
+            exclude_none=True,
+            exclude=_CONTROL_FIELDS,
+            context={"comma_separated": True},
+        )
+
+
+class SeenMixin(BaseModel):
+    """Mixin for requests skipping the items of earlier requests.
+
+    Responses return the seen IDs with the IDs of their items added, to be
+    passed to the next request (e.g. when crawling many playlists).
+    """
+
+    seen: str | None = Field(
+        None,
+        description="Seen IDs returned by a previous response: skip items with these IDs",
+    )
+
+    _seen_ids: SeenIds | None = PrivateAttr(None)
+
+    @model_validator(mode="after")
+    def validate_seen(self):
+        if self.seen is not None:
+            self._seen_ids = SeenIds.decode(self.seen)
+
+        return self
+
+    def seen_ids(self) -> SeenIds | None:
+        """Return a copy of the seen IDs, to add the IDs of new items to."""
+        return self._seen_ids.copy() if self._seen_ids is not None else None
+
+
+class PredicateOperator(str, Enum):
+    """Comparison operators for item predicates."""
+
+    EQ = "eq"
+    NE = "ne"
+    GT = "gt"
+    GTE = "gte"
+    LT = "lt"
+    LTE = "lte"
+    CONTAINS = "contains"
+    IN = "in"
+    EXISTS = "exists"
+
+
+class Predicate(BaseModel):
+    """Condition on a field of the items returned by the YouTube Data API."""
+
+    field: str = Field(
+        description="Dot-separated path of the field, e.g. snippet.channelId",
+    )
+    op: PredicateOperator = Field(
+        PredicateOperator.EQ,
+        description="Comparison operator",
+    )
+    value: Any = Field(
+        None,
+        description="Value to compare against (a list for the in operator)",
+    )
+
+    @model_validator(mode="after")
+    def validate_value(self):
+        if self.op == PredicateOperator.IN and not isinstance(self.value, list):
+            raise ValueError("The in operator requires a list value")
+
+        if self.op == PredicateOperator.CONTAINS and isinstance(
+            self.value, (list, dict)
+        ):
+            raise ValueError("The contains operator requires a string or scalar value")
+
+        return self
+
+    def matches(self, item: dict[str, Any]) -> bool:
+        value: Any = item
+        for key in self.field.split("."):
+            if not isinstance(value, dict) or key not in value:
+                return self.op == PredicateOperator.EXISTS and self.value is False
+
+            value = value[key]
+
+        if self.op == PredicateOperator.EXISTS:
+            return self.value is not False
+
+        # Counters (e.g. statistics.viewCount) are returned as strings
+        expected = self.value
+        if isinstance(expected, (int, float)) and isinstance(value, str):
+            try:
+                value = float(value)
+            except ValueError:
+                return False
+
+        try:
+            match self.op:
+                case PredicateOperator.CONTAINS:
+                    return self.value in value
+                case PredicateOperator.IN:
+                    return value in self.value
+                case PredicateOperator.EQ:
+                    return value == expected
+                case PredicateOperator.NE:
+                    return value != expected
+                case PredicateOperator.GT:
+                    return value > expected
+                case PredicateOperator.GTE:
+                    return value >= expected
+                case PredicateOperator.LT:
+                    return value < expected
+                case PredicateOperator.LTE:
+                    return value <= expected
+        except TypeError:
+            return False
+
+        return False
+
+
+class ExportFormat(str, Enum):
+    """File formats for exporting listAll* results."""
+
+    NDJSON = "ndjson"
+    PARQUET = "parquet"
+    ARROW = "arrow"
+
+
+def published_at(item: dict[str, Any]) -> datetime | None:
+    """Return the publication time of a raw API item.
+
+    Playlist items report when the video was published in contentDetails and
+    when it was added to the playlist in the snippet. Comment threads report
+    it in their top-level comment.
+    """
+    snippet = item.get("snippet", {})
+    value = (
+        item.get("contentDetails", {}).get("videoPublishedAt")
+        or snippet.get("publishedAt")
+        or snippet.get("topLevelComment", {}).get("snippet", {}).get("publishedAt")
+    )
+
+    return datetime.fromisoformat(value) if value else None
+
+
+class ListAllRequestMixin(RequestMixin, SeenMixin):
+    """Mixin for requests that page through all results.
+
+    Filters are evaluated on every page, so pagination stops as soon as the
+    limit is reached instead of fetching every page.
+
+    When the page or time budget runs out, the response carries a
+    continuation token that resumes pagination in a follow-up request.
+    """
+
+    limit: int | None = Field(
+        None,
+        ge=1,
+        description="Maximum number of items to return",
+    )
+
+    published_after: datetime | None = Field(
+        None,
+        alias="publishedAfter",
+        description="Return only items published at or after this time",
+    )
+
+    published_before: datetime | None = Field(
+        None,
+        alias="publishedBefore",
+        description="Return only items published before this time",
+    )
+
+    @field_validator("published_after", "published_before")
+    @classmethod
+    def validate_timezone(cls, v: datetime | None):
+        if v is not None and v.tzinfo is None:
+            return v.replace(tzinfo=UTC)
+
+        return v
+
+    newest_first: bool = Field(
+        False,
+        alias="newestFirst",
+        description=(
+            "Results are ordered from newest to oldest (e.g. channel uploads): "
+            "stop at the first item published before publishedAfter"
+        ),
+    )
+
+    where: list[Predicate] | None = Field(
+        None,
+        description="Return only items matching all predicates",
+    )
+
+    max_pages: int | None = Field(
+        None,
+        alias="maxPages",
+        ge=1,
+        description="Maximum number of pages to fetch before returning a continuation",
+    )
+
+    deadline: datetime | None = Field(
+        None,
+        description="Time after which no more pages are fetched",
+    )
+
+    @field_validator("deadline")
+    @classmethod
+    def validate_deadline_timezone(cls, v: datetime | None):
+        if v is not None and v.tzinfo is None:
+            return v.replace(tzinfo=UTC)
+
+        return v
+
+    continuation: str | None = Field(
+        None,
+        description="Continuation token returned by a previous, incomplete response",
+    )
+
+    export: ExportFormat | None = Field(
+        None,
+        description=(
+            "Write the items as flat records in this format to the object store "
+            "and return a manifest instead of the items"
+        ),
+    )
+
+    # Parts that carry the publication time of items
+    published_parts: ClassVar[frozenset[str]] = frozenset({"snippet"})
+
+    _resume_page_token: str | None = PrivateAttr(None)
+    _collected: int = PrivateAttr(0)
+
+    @model_validator(mode="after")
+    def validate_continuation(self):
+        if self.continuation is None:
+            return self
+
+        try:
+            state = json.loads(base64.urlsafe_b64decode(self.continuation))
+            page_token, fingerprint, collected = state
+        except (TypeError, ValueError):
+            raise ValueError("Invalid continuation token") from None
+
+        if fingerprint != self.fingerprint():
+            raise ValueError("Continuation token belongs to a different request")
+
+        self._resume_page_token = page_token
+        self._collected = collected
+
+        return self
+
+    @model_validator(mode="after")
+    def validate_published_parts(self):
+        if self.published_after is None and self.published_before is None:
+            return self
+
+        parts = {getattr(p, "value", p) for p in getattr(self, "part", [])}
+        if not parts & self.published_parts:
+            raise ValueError(
+                "publishedAfter and publishedBefore require the"
+                f" {' or '.join(sorted(self.published_parts, reverse=True))} part"
+            )
+
+        return self
+
+    def accept(
+        self,
+        page: list[dict[str, Any]],
+        collected: int = 0,
+        seen: SeenIds | None = None,
+    ) -> tuple[list[dict[str, Any]], bool]:
+        """Return the matching items of a page.
+
+        ``collected`` is the number of items accepted from previous pages.
+        Items in ``seen`` are skipped, and accepted ones are added to it.
+        Also returns whether pagination can stop.
+        """
+        items: list[dict[str, Any]] = []
+
+        remaining = self.remaining(collected)
+        if remaining == 0:
+            return items, True
+
+        for item in page:
+            if self.published_after or self.published_before:
+                published = published_at(item)
+                if published is None:
+                    continue
+
+                if self.published_after and published < self.published_after:
+                    if self.newest_first:
+                        return items, True
+
+                    continue
+
+                if self.published_before and published >= self.published_before:
+                    continue
+
+            if self.where and not all(p.matches(item) for p in self.where):
+                continue
+
+            if seen is not None:
+                seen_id = self.seen_id(item)
+                if seen_id is not None:
+                    if seen_id in seen:
+                        continue
+
+                    seen.add(seen_id)
+
+            items.append(item)
+
+            if remaining is not None and len(items) >= remaining:
+                return items, True
+
+        return items, False
+
+    def page_size(self, collected: int, max_page_size: int = 50) -> int:
+        """Return the number of items to request for the next page."""
+        filtered = (
+            self.where
+            or self.published_after
+            or self.published_before
+            or self.seen is not None
+        )
+        remaining = self.remaining(collected)
+        if remaining is None or filtered:
+            return max_page_size
+
+        return max(1, min(max_page_size, remaining))
+
+    def remaining(self, collected: int) -> int | None:
+        """Return the number of items left to list within the limit, if any.
+
+        ``collected`` is the number of items accepted so far by this response;
+        items of the responses before a continuation count too.
+        """
+        if self.limit is None:
+            return None
+
+        return max(0, self.limit - self._collected - collected)
+
+    def seen_id(self, item: dict[str, Any]) -> str | None:
+        """Return the ID an item is tracked by in the seen IDs."""
+        return item.get("id")
+
+    @property
+    def resume_page_token(self) -> str | None:
+        """Page token to start from when resuming from a continuation."""
+        return self._resume_page_token
+
+    def fingerprint(self) -> str:
+        """Identify the result set of the request, regardless of budgets."""
+        params = self.model_dump(
+            mode="json",
+            exclude_none=True,
+            exclude={
+                "debug",
+                "tenant",
+                "limit",
+                "max_pages",
+                "deadline",
+                "continuation",
+                "seen",
+            },
+        )
+        digest = hashlib.sha256(json.dumps(params, sort_keys=True).encode())
+
+        return digest.hexdigest()[:16]
+
+    def budget_exhausted(self, pages: int) -> bool:
+        """Return whether no more pages should be fetched."""
+        if self.max_pages is not None and pages >= self.max_pages:
+            return True
+
+        return self.deadline is not None and time.time() >= self.deadline.timestamp()
+
+    def continue_from(self, page_token: str | None, collected: int) -> str | None:
+        """Return a continuation token resuming at ``page_token``."""
+        if page_token is None:
+            return None
+
+        state = [page_token, self.fingerprint(), self._collected + collected]
+
+        return base64.urlsafe_b64encode(json.dumps(state).encode()).decode()
+
+
 class ListRequestMixin(BaseModel):
     """Mixin for paginated list requests."""
 
@@ -67,6 +664,50 @@ class ListRequestMixin(BaseModel):
     )
 
 
+class OffloadManifest(BaseModel):
+    """Location of a result that was too large to return inline (or exported).
+
+    Unless exported, the object holds one item per line, in the JSON format of
+    the response.
+    """
+
+    model_config = ConfigDict(populate_by_name=True, serialize_by_alias=True)
+
+    bucket: str | None = Field(None, description="Bucket, unless stored on local disk")
+    key: str
+    content_type: str = Field("application/x-ndjson", alias="contentType")
+    item_count: int = Field(alias="itemCount")
+    size: int = Field(description="Size of the object in bytes")
+    etag: str | None = None
+    checksum: str = Field(description="SHA-256 digest of the object (hex)")
+
+
+class BatchError(BaseModel):
+    """Error raised by a single operation of a batch or multi-item request."""
+
+    type: str
+    message: str
+
+
+class ListAllResponseMixin(BaseModel):
+    """Mixin for responses of requests that page through all results."""
+
+    continuation: str | None = Field(
+        None,
+        description="Token for resuming an incomplete listing, if the budget ran out",
+    )
+
+    manifest: OffloadManifest | None = Field(
+        None,
+        description="Object holding the items, if the result was offloaded",
+    )
+
+    seen: str | None = Field(
+        None,
+        description="Seen IDs of the request with the IDs of the items added",
+    )
+
+
 class ListResponseMixin(BaseModel):
     """Mixin for paginated list responses."""
 
@@ -120,3 +761,7 @@ def validate_id(v: Any) -> List[str] | None:
         raise ValueError("At least one ID must be provided")
 
     return ids
+
+
+# Fields of the mixins above, which are never sent to the YouTube Data API
+_CONTROL_FIELDS = set(RequestMixin.model_fields) | set(ListAllRequestMixin.model_fields)
@@ -0,0 +1,102 @@
+from datetime import UTC, datetime
+from enum import Enum
+from typing import Annotated, List
+
+from pydantic import BaseModel, ConfigDict, Field, field_validator
+
+from .model import RequestMixin
+
+
+class Period(str, Enum):
+    """Length of the periods of a histogram."""
+
+    DAY = "day"
+    WEEK = "week"
+    MONTH = "month"
+    YEAR = "year"
+
+
+class AggregateChannelVideosRequest(RequestMixin):
+    """Request for aggregating the statistics of all uploads of a channel."""
+
+    model_config = ConfigDict(validate_by_alias=True, serialize_by_alias=True)
+
+    channel_id: str = Field(
+        alias="channelId",
+        description="ID of the channel whose uploads are aggregated",
+    )
+
+    period: Period = Field(
+        Period.MONTH,
+        description="Period of the upload histogram",
+    )
+
+    percentiles: List[Annotated[float, Field(ge=0, le=100)]] = Field(
+        default_factory=lambda: [50.0, 90.0, 99.0],
+        description="Percentiles to compute for every metric (0-100)",
+    )
+
+    published_after: datetime | None = Field(
+        None,
+        alias="publishedAfter",
+        description="Aggregate only videos published at or after this time",
+    )
+
+    @field_validator("published_after")
+    @classmethod
+    def validate_timezone(cls, v: datetime | None):
+        if v is not None and v.tzinfo is None:
+            return v.replace(tzinfo=UTC)
+
+        return v
+
+
+class MetricSummary(BaseModel):
+    """Distribution of a per-video metric.
+
+    Videos that don't report the metric (e.g. hidden likes) are left out.
+    """
+
+    model_config = ConfigDict(populate_by_name=True, serialize_by_alias=True)
+
+    total: int
+    count: int = Field(description="Number of videos reporting the metric")
+    mean: float | None = None
+    percentiles: dict[str, float] = Field(default_factory=dict)
+
+
+class PeriodBucket(BaseModel):
+    """Uploads of a single period."""
+
+    model_config = ConfigDict(populate_by_name=True, serialize_by_alias=True)
+
+    start: datetime
+    videos: int
+    views: int
+    likes: int
+    comments: int
+    duration_seconds: int = Field(alias="durationSeconds")
+
+
+class AggregateChannelVideosResponse(BaseModel):
+    """Aggregated statistics of the uploads of a channel."""
+
+    model_config = ConfigDict(populate_by_name=True, serialize_by_alias=True)
+
+    channel_id: str = Field(alias="channelId")
+    video_count: int = Field(alias="videoCount")
+    views: MetricSummary
+    likes: MetricSummary
+    comments: MetricSummary
+    duration_seconds: MetricSummary = Field(alias="durationSeconds")
+    engagement_rate: float | None = Field(
+        None,
+        alias="engagementRate",
+        description="Likes and comments per view, over all videos",
+    )
+    median_engagement_rate: float | None = Field(
+        None,
+        alias="medianEngagementRate",
+        description="Median of the engagement rates of the videos",
+    )
+    periods: List[PeriodBucket] = Field(default_factory=list)
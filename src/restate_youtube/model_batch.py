@@ -0,0 +1,180 @@
+from enum import Enum
+from typing import Any, List
+
+from pydantic import BaseModel, ConfigDict, Field, model_validator
+
+from .model import BatchError
+from .model_channels import (
+    ListAllChannelsRequest,
+    ListAllChannelsResponse,
+    ListChannelsRequest,
+    ListChannelsResponse,
+)
+from .model_comment_threads import (
+    ListAllCommentThreadsRequest,
+    ListAllCommentThreadsResponse,
+    ListCommentThreadsRequest,
+    ListCommentThreadsResponse,
+)
+from .model_playlist_item import (
+    ListAllPlaylistItemsRequest,
+    ListAllPlaylistItemsResponse,
+    ListPlaylistItemsRequest,
+    ListPlaylistItemsResponse,
+)
+from .model_playlists import (
+    ListAllPlaylistsRequest,
+    ListAllPlaylistsResponse,
+    ListPlaylistsRequest,
+    ListPlaylistsResponse,
+)
+from .model_videos import (
+    ListAllVideosRequest,
+    ListAllVideosResponse,
+    ListVideosRequest,
+    ListVideosResponse,
+)
+
+
+class BatchOperation(str, Enum):
+    """Operations that can be part of a batch request."""
+
+    LIST_CHANNELS = "listChannels"
+    LIST_ALL_CHANNELS = "listAllChannels"
+    LIST_COMMENT_THREADS = "listCommentThreads"
+    LIST_ALL_COMMENT_THREADS = "listAllCommentThreads"
+    LIST_PLAYLISTS = "listPlaylists"
+    LIST_ALL_PLAYLISTS = "listAllPlaylists"
+    LIST_PLAYLIST_ITEMS = "listPlaylistItems"
+    LIST_ALL_PLAYLIST_ITEMS = "listAllPlaylistItems"
+    LIST_VIDEOS = "listVideos"
+    LIST_ALL_VIDEOS = "listAllVideos"
+
+
+# Request and response models of each operation
+BATCH_OPERATIONS: dict[BatchOperation, tuple[type[BaseModel], type[BaseModel]]] = {
+    BatchOperation.LIST_CHANNELS: (ListChannelsRequest, ListChannelsResponse),
+    BatchOperation.LIST_ALL_CHANNELS: (ListAllChannelsRequest, ListAllChannelsResponse),
+    BatchOperation.LIST_COMMENT_THREADS: (
+        ListCommentThreadsRequest,
+        ListCommentThreadsResponse,
+    ),
+    BatchOperation.LIST_ALL_COMMENT_THREADS: (
+        ListAllCommentThreadsRequest,
+        ListAllCommentThreadsResponse,
+    ),
+    BatchOperation.LIST_PLAYLISTS: (ListPlaylistsRequest, ListPlaylistsResponse),
+    BatchOperation.LIST_ALL_PLAYLISTS: (
+        ListAllPlaylistsRequest,
+        ListAllPlaylistsResponse,
+    ),
+    BatchOperation.LIST_PLAYLIST_ITEMS: (
+        ListPlaylistItemsRequest,
+        ListPlaylistItemsResponse,
+    ),
+    BatchOperation.LIST_ALL_PLAYLIST_ITEMS: (
+        ListAllPlaylistItemsRequest,
+        ListAllPlaylistItemsResponse,
+    ),
+    BatchOperation.LIST_VIDEOS: (ListVideosRequest, ListVideosResponse),
+    BatchOperation.LIST_ALL_VIDEOS: (ListAllVideosRequest, ListAllVideosResponse),
+}
+
+
+def _validate_by_operation(data: Any, field: str, index: int) -> Any:
+    """Validate ``field`` of a batch entry with the model of its operation.
+
+    The request and response models of several operations accept the same
+    input, so they cannot be told apart by a plain union.
+    """
+    if not isinstance(data, dict) or not isinstance(data.get(field), dict):
+        return data
+
+    operation = data.get("operation")
+    if operation is None:
+        return data
+
+    model = BATCH_OPERATIONS[BatchOperation(operation)][index]
+
+    return {**data, field: model.model_validate(data[field])}
+
+
+class BatchEntry(BaseModel):
+    """A single operation of a batch request."""
+
+    model_config = ConfigDict(validate_by_alias=True, serialize_by_alias=True)
+
+    operation: BatchOperation
+    request: (
+        ListChannelsRequest
+        | ListAllChannelsRequest
+        | ListCommentThreadsRequest
+        | ListAllCommentThreadsRequest
+        | ListPlaylistsRequest
+        | ListAllPlaylistsRequest
+        | ListPlaylistItemsRequest
+        | ListAllPlaylistItemsRequest
+        | ListVideosRequest
+        | ListAllVideosRequest
+    )
+
+    @model_validator(mode="before")
+    @classmethod
+    def validate_request(cls, data: Any):
+        return _validate_by_operation(data, "request", 0)
+
+    @model_validator(mode="after")
+    def validate_request_type(self):
+        if type(self.request) is not BATCH_OPERATIONS[self.operation][0]:
+            raise ValueError(
+                f"Request of type {type(self.request).__name__} "
+                f"does not match operation {self.operation.value}"
+            )
+
+        return self
+
+
+class BatchRequest(BaseModel):
+    """Request for executing several operations in a single invocation."""
+
+    model_config = ConfigDict(validate_by_alias=True, serialize_by_alias=True)
+
+    items: List[BatchEntry] = Field(
+        min_length=1,
+        description="Operations to execute concurrently",
+    )
+
+
+class BatchResult(BaseModel):
+    """Outcome of a single operation of a batch request."""
+
+    model_config = ConfigDict(validate_by_alias=True, serialize_by_alias=True)
+
+    operation: BatchOperation
+    response: (
+        ListChannelsResponse
+        | ListAllChannelsResponse
+        | ListCommentThreadsResponse
+        | ListAllCommentThreadsResponse
+        | ListPlaylistsResponse
+        | ListAllPlaylistsResponse
+        | ListPlaylistItemsResponse
+        | ListAllPlaylistItemsResponse
+        | ListVideosResponse
+        | ListAllVideosResponse
+        | None
+    ) = None
+    error: BatchError | None = None
+
+    @model_validator(mode="before")
+    @classmethod
+    def validate_response(cls, data: Any):
+        return _validate_by_operation(data, "response", 1)
+
+
+class BatchResponse(BaseModel):
+    """Results of a batch request, in the order of the requested operations."""
+
+    model_config = ConfigDict(validate_by_alias=True, serialize_by_alias=True)
+
+    items: List[BatchResult] = Field(default_factory=list)
@@ -7,17 +7,22 @@ from pydantic import (
     ConfigDict,
     Field,
     FieldSerializationInfo,
+    SerializeAsAny,
     field_serializer,
     field_validator,
     model_validator,
 )
 
 from .model import (
+    LazyModel,
+    ListAllRequestMixin,
+    ListAllResponseMixin,
     ListRequestMixin,
     ListResponseMixin,
     Localized,
     LongUploadsStatus,
     PrivacyStatus,
+    RequestMixin,
     Thumbnails,
     validate_id,
     validate_part,
@@ -176,8 +181,12 @@ class Channel(BaseModel):
     localizations: Dict[str, Localized] | None = None
 
 
-class ListAllChannelsRequest(BaseModel):
-    """Request parameters for listing all channels from the YouTube Data API channels.list endpoint."""
+class LazyChannel(LazyModel, Channel):
+    """A YouTube channel resource whose parts are validated on first access."""
+
+
+class ChannelsRequest(RequestMixin):
+    """Common request parameters for the YouTube Data API channels.list endpoint."""
 
     model_config = ConfigDict(validate_by_alias=True, serialize_by_alias=True)
 
@@ -280,16 +289,21 @@ class ListAllChannelsRequest(BaseModel):
     )
 
 
-class ListAllChannelsResponse(BaseModel):
+class ListAllChannelsRequest(ChannelsRequest, ListAllRequestMixin):
+    """Request parameters for listing all channels from the YouTube Data API channels.list endpoint."""
+
+
+class ListAllChannelsResponse(ListAllResponseMixin):
     model_config = ConfigDict(validate_by_alias=True, serialize_by_alias=True)
 
     kind: Literal["youtube#channelListResponse"] = Field(
         default="youtube#channelListResponse"
     )
-    items: List[Channel] = Field(default_factory=list)
+    # Serialize lazy channels with their own serializer
+    items: List[SerializeAsAny[Channel]] = Field(default_factory=list)
 
 
-class ListChannelsRequest(ListAllChannelsRequest, ListRequestMixin):
+class ListChannelsRequest(ChannelsRequest, ListRequestMixin):
     """Request parameters for the YouTube Data API channels.list endpoint."""
 
     max_results: int | None = Field(
@@ -303,3 +317,57 @@ class ListChannelsRequest(ListAllChannelsRequest, ListRequestMixin):
 
 class ListChannelsResponse(ListAllChannelsResponse, ListResponseMixin):
     pass
+
+
+class ResolveChannelsRequest(RequestMixin):
+    """Request for resolving handles and usernames to channels."""
+
+    model_config = ConfigDict(validate_by_alias=True, serialize_by_alias=True)
+
+    handles: list[str] = Field(
+        default_factory=list,
+        description="List of YouTube handles (can include @ symbol) or comma-separated string",
+    )
+
+    usernames: list[str] = Field(
+        default_factory=list,
+        description="List of YouTube usernames or comma-separated string",
+    )
+
+    @field_validator("handles", "usernames", mode="before")
+    @classmethod
+    def validate_names(cls, v: Any):
+        return validate_id(v) if v else []
+
+    @model_validator(mode="after")
+    def validate_not_empty(self):
+        if not self.handles and not self.usernames:
+            raise ValueError("At least one handle or username must be provided")
+
+        return self
+
+
+class ChannelResolution(BaseModel):
+    """Channel a handle or username resolves to.
+
+    The channel ID is not set if no channel has the handle or username.
+    """
+
+    model_config = ConfigDict(populate_by_name=True, serialize_by_alias=True)
+
+    handle: str | None = None
+    username: str | None = None
+    channel_id: str | None = Field(None, alias="channelId")
+    uploads_playlist_id: str | None = Field(None, alias="uploadsPlaylistId")
+    resolved_at: datetime = Field(alias="resolvedAt")
+    cached: bool = Field(
+        False,
+        description="Whether the resolution was served from the cache",
+    )
+
+
+class ResolveChannelsResponse(BaseModel):
+    model_config = ConfigDict(validate_by_alias=True, serialize_by_alias=True)
+
+    # In request order: handles first, then usernames
+    items: List[ChannelResolution] = Field(default_factory=list)
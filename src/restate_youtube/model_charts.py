@@ -0,0 +1,113 @@
+from typing import Any, List
+
+from pydantic import BaseModel, ConfigDict, Field, SerializeAsAny, field_validator
+
+from .model import BatchError, RequestMixin, SeenMixin, validate_id, validate_part
+from .model_videos import Chart, ListAllVideosRequest, Video, VideoPart
+
+
+class ListChartsRequest(RequestMixin, SeenMixin):
+    """Request for listing the most popular videos of several regions and categories.
+
+    Charts of every combination of region and category are listed
+    concurrently. Seen videos are ranked, but left out of the videos.
+    """
+
+    model_config = ConfigDict(validate_by_alias=True, serialize_by_alias=True)
+
+    part: list[VideoPart] = Field(
+        description="List of video resource properties to include in the response",
+    )
+
+    @field_validator("part", mode="before")
+    @classmethod
+    def validate_part(cls, v: Any):
+        return validate_part(v, VideoPart)
+
+    region_codes: list[str] = Field(
+        alias="regionCodes",
+        description="ISO 3166-1 alpha-2 country codes or comma-separated string",
+    )
+
+    @field_validator("region_codes", mode="before")
+    @classmethod
+    def validate_region_codes(cls, v: Any):
+        return list(dict.fromkeys(validate_id(v)))
+
+    video_category_ids: list[str] | None = Field(
+        None,
+        alias="videoCategoryIds",
+        description="Video category IDs or comma-separated string (default: all categories)",
+    )
+
+    @field_validator("video_category_ids", mode="before")
+    @classmethod
+    def validate_video_category_ids(cls, v: Any):
+        return list(dict.fromkeys(validate_id(v))) if v is not None else None
+
+    limit: int = Field(
+        50,
+        ge=1,
+        le=200,
+        description="Maximum number of videos per chart",
+    )
+
+    hl: str | None = Field(None, description="Language code for localized metadata")
+
+    def charts(self) -> list[tuple[str, str | None]]:
+        """Return the (region, category) pairs to list."""
+        categories = self.video_category_ids or [None]
+
+        return [
+            (region, category)
+            for region in self.region_codes
+            for category in categories
+        ]
+
+    def for_chart(
+        self, region_code: str, video_category_id: str | None
+    ) -> ListAllVideosRequest:
+        """Return the request listing a single chart."""
+        return ListAllVideosRequest.model_validate(
+            {
+                **self.model_dump(
+                    include={"part", "hl", "limit", "debug", "tenant"},
+                    exclude_none=True,
+                ),
+                "chart": Chart.MOST_POPULAR,
+                "regionCode": region_code,
+                "videoCategoryId": video_category_id,
+            }
+        )
+
+
+class ChartRanking(BaseModel):
+    """Videos of a single chart in rank order, or the error listing them."""
+
+    model_config = ConfigDict(populate_by_name=True, serialize_by_alias=True)
+
+    region_code: str = Field(alias="regionCode")
+    video_category_id: str | None = Field(None, alias="videoCategoryId")
+    video_ids: List[str] = Field(
+        default_factory=list,
+        alias="videoIds",
+        description="IDs of the videos of the chart, most popular first",
+    )
+    error: BatchError | None = None
+
+
+class ListChartsResponse(BaseModel):
+    """Charts as rankings of video IDs, with each video listed once."""
+
+    model_config = ConfigDict(populate_by_name=True, serialize_by_alias=True)
+
+    # In order of first appearance
+    videos: List[SerializeAsAny[Video]] = Field(default_factory=list)
+
+    # In request order: regions, then categories
+    charts: List[ChartRanking] = Field(default_factory=list)
+
+    seen: str | None = Field(
+        None,
+        description="Seen IDs of the request with the IDs of the videos added",
+    )
@@ -0,0 +1,322 @@
+from datetime import datetime
+from enum import Enum
+from typing import Any, List, Literal
+
+from pydantic import (
+    BaseModel,
+    ConfigDict,
+    Field,
+    FieldSerializationInfo,
+    field_serializer,
+    field_validator,
+    model_validator,
+)
+
+from .model import (
+    BatchError,
+    ListAllRequestMixin,
+    ListAllResponseMixin,
+    ListRequestMixin,
+    ListResponseMixin,
+    RequestMixin,
+    validate_id,
+    validate_part,
+)
+
+
+class CommentThreadPart(str, Enum):
+    """Comment thread resource parts that can be included in API responses."""
+
+    ID = "id"
+    REPLIES = "replies"
+    SNIPPET = "snippet"
+
+
+class CommentThreadOrder(str, Enum):
+    """Order of comment threads."""
+
+    RELEVANCE = "relevance"
+    TIME = "time"
+
+
+class TextFormat(str, Enum):
+    """Format of the text of comments."""
+
+    HTML = "html"
+    PLAIN_TEXT = "plainText"
+
+
+class ModerationStatus(str, Enum):
+    """Moderation status of comments."""
+
+    HELD_FOR_REVIEW = "heldForReview"
+    LIKELY_SPAM = "likelySpam"
+    PUBLISHED = "published"
+    REJECTED = "rejected"
+
+
+class AuthorChannelId(BaseModel):
+    """Channel of the author of a comment."""
+
+    value: str | None = None
+
+
+class CommentSnippet(BaseModel):
+    """Basic details about a comment."""
+
+    model_config = ConfigDict(validate_by_alias=True, serialize_by_alias=True)
+
+    author_display_name: str | None = Field(None, alias="authorDisplayName")
+    author_profile_image_url: str | None = Field(None, alias="authorProfileImageUrl")
+    author_channel_url: str | None = Field(None, alias="authorChannelUrl")
+    author_channel_id: AuthorChannelId | None = Field(None, alias="authorChannelId")
+    channel_id: str | None = Field(None, alias="channelId")
+    video_id: str | None = Field(None, alias="videoId")
+    text_display: str | None = Field(None, alias="textDisplay")
+    text_original: str | None = Field(None, alias="textOriginal")
+    parent_id: str | None = Field(None, alias="parentId")
+    can_rate: bool | None = Field(None, alias="canRate")
+    viewer_rating: str | None = Field(None, alias="viewerRating")
+    like_count: int | None = Field(None, alias="likeCount")
+    moderation_status: ModerationStatus | None = Field(None, alias="moderationStatus")
+    published_at: datetime | None = Field(None, alias="publishedAt")
+    updated_at: datetime | None = Field(None, alias="updatedAt")
+
+
+class Comment(BaseModel):
+    """A YouTube comment resource."""
+
+    model_config = ConfigDict(validate_by_alias=True, serialize_by_alias=True)
+
+    kind: Literal["youtube#comment"] = Field(default="youtube#comment")
+    etag: str | None = None
+    id: str | None = None
+    snippet: CommentSnippet | None = None
+
+
+class CommentThreadSnippet(BaseModel):
+    """Basic details about a comment thread."""
+
+    model_config = ConfigDict(validate_by_alias=True, serialize_by_alias=True)
+
+    channel_id: str | None = Field(None, alias="channelId")
+    video_id: str | None = Field(None, alias="videoId")
+    top_level_comment: Comment | None = Field(None, alias="topLevelComment")
+    can_reply: bool | None = Field(None, alias="canReply")
+    total_reply_count: int | None = Field(None, alias="totalReplyCount")
+    is_public: bool | None = Field(None, alias="isPublic")
+
+
+class CommentThreadReplies(BaseModel):
+    """Replies to the top-level comment (not necessarily all of them)."""
+
+    comments: List[Comment] = Field(default_factory=list)
+
+
+class CommentThread(BaseModel):
+    """A YouTube comment thread resource."""
+
+    model_config = ConfigDict(validate_by_alias=True, serialize_by_alias=True)
+
+    kind: Literal["youtube#commentThread"] = Field(default="youtube#commentThread")
+    etag: str | None = None
+    id: str | None = None
+    snippet: CommentThreadSnippet | None = None
+    replies: CommentThreadReplies | None = None
+
+
+class CommentThreadsRequest(RequestMixin):
+    """Common request parameters for the YouTube Data API commentThreads.list endpoint."""
+
+    model_config = ConfigDict(validate_by_alias=True, serialize_by_alias=True)
+
+    part: list[CommentThreadPart] = Field(
+        description="List of comment thread resource properties to include in the response",
+    )
+
+    @field_validator("part", mode="before")
+    @classmethod
+    def validate_part(cls, v: Any):
+        return validate_part(v, CommentThreadPart)
+
+    @field_serializer("part")
+    def serialize_part(
+        self,
+        v: list[str],
+        info: FieldSerializationInfo,
+    ) -> str | list[str]:
+        if info.context and info.context.get("comma_separated"):
+            return ",".join(v)
+
+        return v
+
+    # Filter parameters (exactly one must be specified)
+    all_threads_related_to_channel_id: str | None = Field(
+        None,
+        alias="allThreadsRelatedToChannelId",
+        description="Return all comment threads associated with the channel",
+    )
+
+    id: list[str] | None = Field(
+        None,
+        description="List of comment thread IDs or comma-separated string",
+    )
+
+    @field_validator("id", mode="before")
+    @classmethod
+    def validate_id(cls, v: Any):
+        return validate_id(v)
+
+    @field_serializer("id")
+    def serialize_id(
+        self,
+        v: list[str] | None,
+        info: FieldSerializationInfo,
+    ) -> str | list[str] | None:
+        if v is None:
+            return v
+
+        if info.context and info.context.get("comma_separated"):
+            return ",".join(v)
+
+        return v
+
+    video_id: str | None = Field(
+        None,
+        alias="videoId",
+        description="Return comment threads associated with the video",
+    )
+
+    @model_validator(mode="after")
+    def validate_exactly_one_filter(self):
+        filter_fields = ["all_threads_related_to_channel_id", "id", "video_id"]
+        specified = [f for f in filter_fields if getattr(self, f) is not None]
+
+        if len(specified) != 1:
+            raise ValueError(
+                "Exactly one filter must be specified: "
+                "allThreadsRelatedToChannelId, id, videoId. "
+                f"Got: {specified or 'none'}"
+            )
+
+        return self
+
+    # Optional parameters
+    moderation_status: ModerationStatus | None = Field(
+        None,
+        alias="moderationStatus",
+        description="Return only comment threads with this moderation status",
+    )
+    order: CommentThreadOrder | None = Field(
+        None,
+        description="Order of the comment threads (default time)",
+    )
+    search_terms: str | None = Field(
+        None,
+        alias="searchTerms",
+        description="Return only comments containing the search terms",
+    )
+    text_format: TextFormat | None = Field(
+        None,
+        alias="textFormat",
+        description="Format of the comments (default html)",
+    )
+
+
+class ListAllCommentThreadsRequest(CommentThreadsRequest, ListAllRequestMixin):
+    """Request parameters for listing all comment threads from the YouTube Data API commentThreads.list endpoint."""
+
+
+class ListAllCommentThreadsResponse(ListAllResponseMixin):
+    model_config = ConfigDict(validate_by_alias=True, serialize_by_alias=True)
+
+    kind: Literal["youtube#commentThreadListResponse"] = Field(
+        default="youtube#commentThreadListResponse"
+    )
+    items: List[CommentThread] = Field(default_factory=list)
+
+
+class ListCommentThreadsRequest(CommentThreadsRequest, ListRequestMixin):
+    """Request parameters for the YouTube Data API commentThreads.list endpoint."""
+
+    max_results: int | None = Field(
+        None,
+        alias="maxResults",
+        ge=1,
+        le=100,
+        description="Maximum number of results (1-100, default 20)",
+    )
+
+
+class ListCommentThreadsResponse(ListAllCommentThreadsResponse, ListResponseMixin):
+    pass
+
+
+class ListAllCommentThreadsByVideoRequest(ListAllCommentThreadsRequest):
+    """Request for listing all comment threads of several videos concurrently.
+
+    Filters, limits and budgets apply to each video separately, except for
+    the deadline, which is shared. Seen IDs are the videos whose threads were
+    listed completely, which are skipped.
+    """
+
+    seen: str | None = Field(
+        None,
+        description="Seen IDs returned by a previous response: skip these videos",
+    )
+
+    video_ids: list[str] = Field(
+        alias="videoIds",
+        description="List of YouTube video IDs or comma-separated string",
+    )
+
+    @field_validator("video_ids", mode="before")
+    @classmethod
+    def validate_video_ids(cls, v: Any):
+        return validate_id(v)
+
+    @model_validator(mode="after")
+    def validate_exactly_one_filter(self):
+        filter_fields = ["all_threads_related_to_channel_id", "id", "video_id"]
+        specified = [f for f in filter_fields if getattr(self, f) is not None]
+
+        if specified:
+            raise ValueError(f"Filters cannot be combined with videoIds: {specified}")
+
+        if self.continuation is not None:
+            raise ValueError(
+                "Continuations resume single videos: use listAllCommentThreads"
+            )
+
+        return self
+
+    def for_video(self, video_id: str) -> ListAllCommentThreadsRequest:
+        """Return the request listing the comment threads of a single video."""
+        return ListAllCommentThreadsRequest.model_validate(
+            {
+                **self.model_dump(exclude={"video_ids", "seen"}, exclude_none=True),
+                "videoId": video_id,
+            }
+        )
+
+
+class VideoCommentThreads(BaseModel):
+    """Comment threads of a single video, or the error listing them."""
+
+    model_config = ConfigDict(populate_by_name=True, serialize_by_alias=True)
+
+    video_id: str = Field(alias="videoId")
+    response: ListAllCommentThreadsResponse | None = None
+    error: BatchError | None = None
+
+
+class ListAllCommentThreadsByVideoResponse(BaseModel):
+    model_config = ConfigDict(validate_by_alias=True, serialize_by_alias=True)
+
+    # In request order, except for seen videos
+    items: List[VideoCommentThreads] = Field(default_factory=list)
+
+    seen: str | None = Field(
+        None,
+        description="Seen IDs of the request with the completely listed videos added",
+    )
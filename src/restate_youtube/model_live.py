@@ -0,0 +1,263 @@
+from datetime import datetime
+from typing import Any, List
+
+from pydantic import BaseModel, ConfigDict, Field, field_validator
+
+from .model import RequestMixin, validate_id
+from .model_videos import LiveBroadcastContent
+
+# Maximum number of IDs of a videos.list call
+BATCH_SIZE = 50
+
+
+class PollLiveVideosRequest(RequestMixin):
+    """Request for sampling the live streaming details of videos."""
+
+    model_config = ConfigDict(validate_by_alias=True, serialize_by_alias=True)
+
+    video_ids: list[str] = Field(
+        alias="videoIds",
+        description="List of YouTube video IDs or comma-separated string",
+    )
+
+    @field_validator("video_ids", mode="before")
+    @classmethod
+    def validate_video_ids(cls, v: Any):
+        return validate_id(v)
+
+
+class LiveVideoSample(BaseModel):
+    """Live streaming details of a video at a point in time.
+
+    The broadcast status is not set if the video was not found.
+    """
+
+    model_config = ConfigDict(populate_by_name=True, serialize_by_alias=True)
+
+    video_id: str = Field(alias="videoId")
+    sampled_at: float = Field(alias="sampledAt")
+    live_broadcast_content: LiveBroadcastContent | None = Field(
+        None,
+        alias="liveBroadcastContent",
+    )
+    concurrent_viewers: int | None = Field(None, alias="concurrentViewers")
+    scheduled_start_time: datetime | None = Field(None, alias="scheduledStartTime")
+    actual_start_time: datetime | None = Field(None, alias="actualStartTime")
+    actual_end_time: datetime | None = Field(None, alias="actualEndTime")
+
+
+class PollLiveVideosResponse(BaseModel):
+    model_config = ConfigDict(validate_by_alias=True, serialize_by_alias=True)
+
+    # In request order
+    items: List[LiveVideoSample] = Field(default_factory=list)
+
+
+class ViewerSeries(BaseModel):
+    """Concurrent viewer counts over time, delta-encoded.
+
+    ``offsets`` holds the seconds elapsed since the previous sample (the
+    first one is always 0), starting at ``start`` (Unix time).
+    """
+
+    start: int = 0
+    end: int = 0
+    offsets: List[int] = Field(default_factory=list)
+    viewers: List[int] = Field(default_factory=list)
+
+    def append(self, at: float, viewers: int, max_samples: int):
+        at = int(at)
+        if not self.viewers:
+            self.start = self.end = at
+
+        self.offsets.append(at - self.end)
+        self.viewers.append(viewers)
+        self.end = at
+
+        # Drop the oldest samples
+        while len(self.viewers) > max_samples:
+            del self.viewers[0], self.offsets[0]
+            self.start += self.offsets[0]
+            self.offsets[0] = 0
+
+    def points(self) -> list[tuple[int, int]]:
+        """Return the samples as (Unix time, viewers) pairs."""
+        points = []
+        at = self.start
+        for offset, viewers in zip(self.offsets, self.viewers):
+            at += offset
+            points.append((at, viewers))
+
+        return points
+
+
+class TrackedVideo(BaseModel):
+    """State of a video tracked by the live poller."""
+
+    model_config = ConfigDict(populate_by_name=True, serialize_by_alias=True)
+
+    live_broadcast_content: LiveBroadcastContent | None = Field(
+        None,
+        alias="liveBroadcastContent",
+    )
+    scheduled_start_time: datetime | None = Field(None, alias="scheduledStartTime")
+    actual_start_time: datetime | None = Field(None, alias="actualStartTime")
+    actual_end_time: datetime | None = Field(None, alias="actualEndTime")
+    next_poll_at: float | None = Field(
+        None,
+        alias="nextPollAt",
+        description="Unix time of the next poll; not set once tracking ended",
+    )
+    series: ViewerSeries = Field(default_factory=ViewerSeries)
+
+
+class TrackLiveVideosRequest(BaseModel):
+    """Request for tracking the viewers of live and upcoming videos."""
+
+    model_config = ConfigDict(validate_by_alias=True, serialize_by_alias=True)
+
+    video_ids: list[str] = Field(
+        alias="videoIds",
+        description="List of YouTube video IDs or comma-separated string",
+    )
+
+    @field_validator("video_ids", mode="before")
+    @classmethod
+    def validate_video_ids(cls, v: Any):
+        return validate_id(v)
+
+    live_interval: float = Field(
+        30,
+        alias="liveInterval",
+        gt=0,
+        description="Seconds between polls of live videos",
+    )
+
+    upcoming_interval: float = Field(
+        1800,
+        alias="upcomingInterval",
+        gt=0,
+        description="Longest number of seconds between polls of upcoming videos",
+    )
+
+    max_samples: int = Field(
+        10_000,
+        alias="maxSamples",
+        ge=1,
+        description="Number of viewer samples kept per video",
+    )
+
+
+class UntrackLiveVideosRequest(BaseModel):
+    """Request for no longer tracking videos, dropping their viewer series."""
+
+    model_config = ConfigDict(validate_by_alias=True, serialize_by_alias=True)
+
+    video_ids: list[str] = Field(
+        alias="videoIds",
+        description="List of YouTube video IDs or comma-separated string",
+    )
+
+    @field_validator("video_ids", mode="before")
+    @classmethod
+    def validate_video_ids(cls, v: Any):
+        return validate_id(v)
+
+
+class LiveTracker(BaseModel):
+    """Videos tracked by a live poller, and its polling settings."""
+
+    model_config = ConfigDict(validate_by_alias=True, serialize_by_alias=True)
+
+    # Polls scheduled for an older generation are dropped
+    generation: int = 0
+    live_interval: float = Field(30, alias="liveInterval")
+    upcoming_interval: float = Field(1800, alias="upcomingInterval")
+    max_samples: int = Field(10_000, alias="maxSamples")
+    videos: dict[str, TrackedVideo] = Field(default_factory=dict)
+
+    def track(self, request: TrackLiveVideosRequest, now: float):
+        """Start tracking videos, polling them right away."""
+        self.live_interval = request.live_interval
+        self.upcoming_interval = request.upcoming_interval
+        self.max_samples = request.max_samples
+
+        for video_id in request.video_ids:
+            video = self.videos.setdefault(video_id, TrackedVideo())
+            video.next_poll_at = now
+
+    def due(self, now: float) -> list[str]:
+        """Return the videos to poll now.
+
+        Calls take up to 50 videos for the same quota, so the last batch is
+        filled up with the videos due next.
+        """
+        due = []
+        pending = []
+        for video_id, video in self.videos.items():
+            if video.next_poll_at is None:
+                continue
+
+            if video.next_poll_at <= now:
+                due.append(video_id)
+            else:
+                pending.append((video.next_poll_at, video_id))
+
+        if not due:
+            return due
+
+        pending.sort()
+        spare = -len(due) % BATCH_SIZE
+
+        return due + [video_id for _, video_id in pending[:spare]]
+
+    def update(self, samples: list[LiveVideoSample]):
+        """Record samples and schedule the next poll of their videos."""
+        for sample in samples:
+            video = self.videos.get(sample.video_id)
+            if video is None:
+                continue
+
+            video.live_broadcast_content = sample.live_broadcast_content
+            video.scheduled_start_time = sample.scheduled_start_time
+            video.actual_start_time = sample.actual_start_time
+            video.actual_end_time = sample.actual_end_time
+            video.next_poll_at = self._next_poll_at(sample)
+
+            if sample.concurrent_viewers is not None:
+                video.series.append(
+                    sample.sampled_at,
+                    sample.concurrent_viewers,
+                    self.max_samples,
+                )
+
+    def next_poll_at(self) -> float | None:
+        """Return when the next video is due, if any is still tracked."""
+        return min(
+            (
+                v.next_poll_at
+                for v in self.videos.values()
+                if v.next_poll_at is not None
+            ),
+            default=None,
+        )
+
+    def _next_poll_at(self, sample: LiveVideoSample) -> float | None:
+        now = sample.sampled_at
+
+        if sample.live_broadcast_content == LiveBroadcastContent.LIVE:
+            return now + self.live_interval
+
+        if sample.live_broadcast_content == LiveBroadcastContent.UPCOMING:
+            scheduled = sample.scheduled_start_time
+            if scheduled is None or scheduled.timestamp() <= now:
+                # Overdue streams may start any time
+                return now + self.live_interval
+
+            # Poll faster as the scheduled start approaches
+            until = (scheduled.timestamp() - now) / 2
+
+            return now + min(max(until, self.live_interval), self.upcoming_interval)
+
+        # Ended, not a live stream, or gone
+        return None
@@ -0,0 +1,89 @@
+from typing import List
+
+from pydantic import BaseModel, ConfigDict, Field
+
+from .model import RequestMixin
+
+# Items per playlistItems.list page
+PAGE_SIZE = 50
+
+
+class PlaylistIndex(BaseModel):
+    """Compact index of the items of a playlist, in playlist order.
+
+    Item IDs, video IDs and etags are kept in parallel lists: the position of
+    an item is its index. ``pageEtags`` holds the etag of each page of 50
+    items, which proves a page unchanged.
+    """
+
+    model_config = ConfigDict(populate_by_name=True, serialize_by_alias=True)
+
+    item_ids: List[str] = Field(default_factory=list, alias="itemIds")
+    video_ids: List[str] = Field(default_factory=list, alias="videoIds")
+    etags: List[str] = Field(default_factory=list)
+    page_etags: List[str] = Field(default_factory=list, alias="pageEtags")
+
+
+class DiffPlaylistRequest(RequestMixin):
+    """Request for diffing the items of a playlist against an earlier index."""
+
+    model_config = ConfigDict(validate_by_alias=True, serialize_by_alias=True)
+
+    playlist_id: str = Field(
+        alias="playlistId",
+        description="YouTube playlist ID",
+    )
+
+    index: PlaylistIndex | None = Field(
+        None,
+        description="Index returned by the previous diff (none for the first one)",
+    )
+
+
+class PlaylistItemChange(BaseModel):
+    """An item added to, removed from, moved within or updated in a playlist."""
+
+    model_config = ConfigDict(populate_by_name=True, serialize_by_alias=True)
+
+    item_id: str = Field(alias="itemId")
+    video_id: str | None = Field(None, alias="videoId")
+    # Position in the playlist (before removal for removed items)
+    position: int
+    previous_position: int | None = Field(None, alias="previousPosition")
+
+
+class PlaylistDiff(BaseModel):
+    """Changes of a playlist since the index it was diffed against.
+
+    Moves are the fewest items to move to get from the old order to the new
+    one: inserting or removing an item doesn't move the ones after it.
+    """
+
+    model_config = ConfigDict(populate_by_name=True, serialize_by_alias=True)
+
+    # No index to diff against: the listing is the baseline of the next diff
+    baseline: bool = False
+    item_count: int = Field(0, alias="itemCount")
+    pages: int = 0
+    unchanged_pages: int = Field(
+        0,
+        alias="unchangedPages",
+        description="Pages proven unchanged by their etag, not diffed item by item",
+    )
+
+    # In position order
+    added: List[PlaylistItemChange] = Field(default_factory=list)
+    removed: List[PlaylistItemChange] = Field(default_factory=list)
+    moved: List[PlaylistItemChange] = Field(default_factory=list)
+    updated: List[PlaylistItemChange] = Field(
+        default_factory=list,
+        description="Items whose etag changed (e.g. their note)",
+    )
+
+
+class DiffPlaylistResponse(BaseModel):
+    model_config = ConfigDict(populate_by_name=True, serialize_by_alias=True)
+
+    diff: PlaylistDiff
+    # Index of the current items, to diff against next time
+    index: PlaylistIndex
@@ -13,9 +13,12 @@ from pydantic import (
 )
 
 from .model import (
+    ListAllRequestMixin,
+    ListAllResponseMixin,
     ListRequestMixin,
     ListResponseMixin,
     PrivacyStatus,
+    RequestMixin,
     Thumbnails,
     validate_id,
     validate_part,
@@ -93,8 +96,8 @@ class PlaylistItem(BaseModel):
     status: PlaylistItemStatus | None = None
 
 
-class ListAllPlaylistItemsRequest(BaseModel):
-    """Request parameters for listing all playlist items from the YouTube Data API playlistItems.list endpoint."""
+class PlaylistItemsRequest(RequestMixin):
+    """Common request parameters for the YouTube Data API playlistItems.list endpoint."""
 
     model_config = ConfigDict(validate_by_alias=True, serialize_by_alias=True)
 
@@ -175,7 +178,22 @@ class ListAllPlaylistItemsRequest(BaseModel):
     )
 
 
-class ListAllPlaylistItemsResponse(BaseModel):
+class ListAllPlaylistItemsRequest(PlaylistItemsRequest, ListAllRequestMixin):
+    """Request parameters for listing all playlist items from the YouTube Data API playlistItems.list endpoint."""
+
+    # contentDetails holds when the video was published
+    published_parts = frozenset({"snippet", "contentDetails"})
+
+    def seen_id(self, item: dict[str, Any]) -> str | None:
+        # The same video is seen in any playlist
+        return (
+            item.get("contentDetails", {}).get("videoId")
+            or item.get("snippet", {}).get("resourceId", {}).get("videoId")
+            or item.get("id")
+        )
+
+
+class ListAllPlaylistItemsResponse(ListAllResponseMixin):
     model_config = ConfigDict(validate_by_alias=True, serialize_by_alias=True)
 
     kind: Literal["youtube#playlistItemListResponse"] = Field(
@@ -184,7 +202,7 @@ class ListAllPlaylistItemsResponse(BaseModel):
     items: List[PlaylistItem] = Field(default_factory=list)
 
 
-class ListPlaylistItemsRequest(ListAllPlaylistItemsRequest, ListRequestMixin):
+class ListPlaylistItemsRequest(PlaylistItemsRequest, ListRequestMixin):
     max_results: int | None = Field(
         None,
         alias="maxResults",
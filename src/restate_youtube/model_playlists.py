@@ -13,11 +13,14 @@ from pydantic import (
 )
 
 from .model import (
+    ListAllRequestMixin,
+    ListAllResponseMixin,
     ListRequestMixin,
     ListResponseMixin,
     Localized,
     PodcastStatus,
     PrivacyStatus,
+    RequestMixin,
     Thumbnails,
     validate_id,
     validate_part,
@@ -90,8 +93,8 @@ class Playlist(BaseModel):
     localizations: Dict[str, Localized] | None = None
 
 
-class ListAllPlaylistsRequest(BaseModel):
-    """Request parameters for the YouTube Data API playlists.list endpoint."""
+class PlaylistsRequest(RequestMixin):
+    """Common request parameters for the YouTube Data API playlists.list endpoint."""
 
     model_config = ConfigDict(validate_by_alias=True, serialize_by_alias=True)
 
@@ -178,7 +181,11 @@ class ListAllPlaylistsRequest(BaseModel):
     )
 
 
-class ListAllPlaylistsResponse(BaseModel):
+class ListAllPlaylistsRequest(PlaylistsRequest, ListAllRequestMixin):
+    """Request parameters for listing all playlists from the YouTube Data API playlists.list endpoint."""
+
+
+class ListAllPlaylistsResponse(ListAllResponseMixin):
     model_config = ConfigDict(validate_by_alias=True, serialize_by_alias=True)
 
     kind: Literal["youtube#playlistListResponse"] = Field(
@@ -187,7 +194,7 @@ class ListAllPlaylistsResponse(BaseModel):
     items: List[Playlist] = Field(default_factory=list)
 
 
-class ListPlaylistsRequest(ListAllPlaylistsRequest, ListRequestMixin):
+class ListPlaylistsRequest(PlaylistsRequest, ListRequestMixin):
     max_results: int | None = Field(
         None,
         alias="maxResults",
@@ -0,0 +1,122 @@
+from typing import Any, List
+
+from pydantic import BaseModel, ConfigDict, Field, model_validator
+
+from .model_batch import BatchError, BatchOperation, _validate_by_operation
+from .model_channels import ListChannelsRequest
+from .model_playlist_item import ListPlaylistItemsRequest
+from .model_playlists import ListPlaylistsRequest
+from .model_videos import ListVideosRequest
+
+# Single-page operations whose responses can be prefetched
+PREFETCH_OPERATIONS = {
+    BatchOperation.LIST_CHANNELS,
+    BatchOperation.LIST_PLAYLISTS,
+    BatchOperation.LIST_PLAYLIST_ITEMS,
+    BatchOperation.LIST_VIDEOS,
+}
+
+
+class PrefetchQuery(BaseModel):
+    """A query refreshed into the response cache ahead of demand.
+
+    The refresh interval adapts to how often the cached response was read
+    since the previous refresh: it doubles when it was not read at all and
+    halves when it was read at least ``hotHits`` times.
+    """
+
+    model_config = ConfigDict(validate_by_alias=True, serialize_by_alias=True)
+
+    operation: BatchOperation
+    request: (
+        ListChannelsRequest
+        | ListPlaylistsRequest
+        | ListPlaylistItemsRequest
+        | ListVideosRequest
+    )
+
+    interval: float = Field(
+        300,
+        gt=0,
+        description="Seconds until the next refresh",
+    )
+
+    min_interval: float = Field(
+        60,
+        alias="minInterval",
+        gt=0,
+        description="Shortest refresh interval in seconds",
+    )
+
+    max_interval: float = Field(
+        3600,
+        alias="maxInterval",
+        gt=0,
+        description="Longest refresh interval in seconds",
+    )
+
+    hot_hits: int = Field(
+        10,
+        alias="hotHits",
+        ge=1,
+        description="Cache hits between refreshes that make the query hot",
+    )
+
+    @model_validator(mode="before")
+    @classmethod
+    def validate_request(cls, data: Any):
+        if isinstance(data, dict) and data.get("operation") is not None:
+            operation = BatchOperation(data["operation"])
+            if operation not in PREFETCH_OPERATIONS:
+                raise ValueError(f"Operation {operation.value} cannot be prefetched")
+
+        return _validate_by_operation(data, "request", 0)
+
+    @model_validator(mode="after")
+    def validate_intervals(self):
+        if self.min_interval > self.max_interval:
+            raise ValueError("minInterval must not be greater than maxInterval")
+
+        return self
+
+    def next_interval(self, hits: int) -> float:
+        """Return the refresh interval following ``hits`` cache hits."""
+        interval = self.interval
+        if hits == 0:
+            interval *= 2
+        elif hits >= self.hot_hits:
+            interval /= 2
+
+        return min(max(interval, self.min_interval), self.max_interval)
+
+
+class PrefetchRequest(BaseModel):
+    """Request for refreshing queries into the response cache."""
+
+    model_config = ConfigDict(validate_by_alias=True, serialize_by_alias=True)
+
+    queries: List[PrefetchQuery] = Field(
+        min_length=1,
+        description="Queries to refresh concurrently",
+    )
+
+
+class PrefetchResult(BaseModel):
+    """Outcome of refreshing a single query."""
+
+    model_config = ConfigDict(validate_by_alias=True, serialize_by_alias=True)
+
+    operation: BatchOperation
+    hits: int = Field(
+        0,
+        description="Cache hits of the query since its previous refresh",
+    )
+    interval: float = Field(description="Seconds until the next refresh")
+    error: BatchError | None = None
+
+
+class PrefetchResponse(BaseModel):
+    model_config = ConfigDict(validate_by_alias=True, serialize_by_alias=True)
+
+    # In request order
+    items: List[PrefetchResult] = Field(default_factory=list)
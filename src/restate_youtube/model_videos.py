@@ -1,3 +1,4 @@
+import re
 from datetime import datetime
 from enum import Enum
 from typing import Any, Dict, List, Literal
@@ -7,16 +8,21 @@ from pydantic import (
     ConfigDict,
     Field,
     FieldSerializationInfo,
+    SerializeAsAny,
     field_serializer,
     field_validator,
     model_validator,
 )
 
 from .model import (
+    LazyModel,
+    ListAllRequestMixin,
+    ListAllResponseMixin,
     ListRequestMixin,
     ListResponseMixin,
     Localized,
     PrivacyStatus,
+    RequestMixin,
     Thumbnails,
     validate_id,
     validate_part,
@@ -147,6 +153,28 @@ class RegionRestriction(BaseModel):
     blocked: List[str] | None = None
 
 
+_DURATION = re.compile(
+    r"P(?:(?P<days>\d+)D)?"
+    r"(?:T(?:(?P<hours>\d+)H)?(?:(?P<minutes>\d+)M)?(?:(?P<seconds>\d+)S)?)?"
+)
+
+
+def duration_seconds(value: str) -> int | None:
+    """Convert an ISO 8601 duration (e.g. ``PT1H2M3S``) to seconds."""
+    match = _DURATION.fullmatch(value)
+    if match is None:
+        return None
+
+    parts = {k: int(v) for k, v in match.groupdict(default="0").items()}
+
+    return (
+        parts["days"] * 86400
+        + parts["hours"] * 3600
+        + parts["minutes"] * 60
+        + parts["seconds"]
+    )
+
+
 class VideoContentDetails(BaseModel):
     """Video content details."""
 
@@ -163,6 +191,11 @@ class VideoContentDetails(BaseModel):
     projection: Projection | None = None
     has_custom_thumbnail: bool | None = Field(None, alias="hasCustomThumbnail")
 
+    @property
+    def duration_seconds(self) -> int | None:
+        """Length of the video in seconds."""
+        return duration_seconds(self.duration) if self.duration else None
+
 
 class VideoStatus(BaseModel):
     """Video status information."""
@@ -374,8 +407,12 @@ class Video(BaseModel):
     localizations: Dict[str, Localized] | None = None
 
 
-class ListAllVideosRequest(BaseModel):
-    """Request parameters for the YouTube Data API videos.list endpoint."""
+class LazyVideo(LazyModel, Video):
+    """A YouTube video resource whose parts are validated on first access."""
+
+
+class VideosRequest(RequestMixin):
+    """Common request parameters for the YouTube Data API videos.list endpoint."""
 
     model_config = ConfigDict(populate_by_name=True, serialize_by_alias=True)
 
@@ -481,16 +518,21 @@ class ListAllVideosRequest(BaseModel):
     )
 
 
-class ListAllVideosResponse(BaseModel):
+class ListAllVideosRequest(VideosRequest, ListAllRequestMixin):
+    """Request parameters for listing all videos from the YouTube Data API videos.list endpoint."""
+
+
+class ListAllVideosResponse(ListAllResponseMixin):
     model_config = ConfigDict(validate_by_alias=True, serialize_by_alias=True)
 
     kind: Literal["youtube#videoListResponse"] = Field(
         default="youtube#videoListResponse"
     )
-    items: List[Video] = Field(default_factory=list)
+    # Serialize lazy videos with their own serializer
+    items: List[SerializeAsAny[Video]] = Field(default_factory=list)
 
 
-class ListVideosRequest(ListAllVideosRequest, ListRequestMixin):
+class ListVideosRequest(VideosRequest, ListRequestMixin):
     max_results: int | None = Field(
         None,
         alias="maxResults",
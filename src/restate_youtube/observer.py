@@ -0,0 +1,218 @@
+import threading
+import time
+from collections.abc import Iterator
+from contextlib import ExitStack, contextmanager
+from dataclasses import dataclass, field
+from typing import Any, TypeVar
+
+from pydantic import BaseModel
+from restate.serde import Serde
+
+from .breaker import CircuitState
+from .scheduler import DEFAULT_TENANT
+
+T = TypeVar("T")
+
+
+@dataclass
+class Invocation:
+    """A single executor operation (e.g. listing all videos of a chart)."""
+
+    name: str
+    request: BaseModel
+    tenant: str = DEFAULT_TENANT
+    # Unix time the invocation must be done by
+    deadline: float | None = None
+    started_at: float = 0.0
+    duration: float = 0.0
+    pages: int = 0
+    wait_time: float = 0.0
+    network_time: float = 0.0
+    parse_time: float = 0.0
+    validation_time: float = 0.0
+    cache_hits: int = 0
+    calls: list["UpstreamCall"] = field(default_factory=list)
+    error: BaseException | None = None
+
+    # Calls of an invocation may finish on several threads (e.g. hedges)
+    _lock: threading.Lock = field(
+        default_factory=threading.Lock, init=False, repr=False, compare=False
+    )
+
+    def expired(self) -> bool:
+        return self.deadline is not None and time.time() >= self.deadline
+
+    def add_call(self, call: "UpstreamCall"):
+        """Add a finished upstream call, and its time unless it lost a hedge."""
+        with self._lock:
+            self.calls.append(call)
+            if call.cached:
+                self.cache_hits += 1
+            if not call.lost:
+                self.wait_time += call.wait_time
+                self.network_time += call.network_time
+                self.parse_time += call.parse_time
+
+    def add_wait(self, wait_time: float):
+        """Add the time a call that never ran waited for a slot."""
+        with self._lock:
+            self.wait_time += wait_time
+
+    def profile(self) -> dict[str, Any]:
+        """Return a JSON-serializable timing breakdown of the invocation."""
+        return {
+            "name": self.name,
+            "tenant": self.tenant,
+            "startedAt": self.started_at,
+            "duration": self.duration,
+            "pages": self.pages,
+            "waitTime": self.wait_time,
+            "networkTime": self.network_time,
+            "parseTime": self.parse_time,
+            "validationTime": self.validation_time,
+            "cacheHits": self.cache_hits,
+            "calls": [
+                {
+                    "resource": call.resource,
+                    "page": call.page,
+                    "duration": call.duration,
+                    "networkTime": call.network_time,
+                    "parseTime": call.parse_time,
+                    "status": call.status,
+                    "responseBytes": call.response_bytes,
+                    "items": call.item_count,
+                    "cached": call.cached,
+                    "hedge": call.hedge,
+                    "lost": call.lost,
+                    "error": repr(call.error) if call.error else None,
+                }
+                for call in self.calls
+            ],
+            "error": repr(self.error) if self.error else None,
+        }
+
+
+@dataclass
+class UpstreamCall:
+    """A single request sent to the YouTube Data API."""
+
+    resource: str
+    params: dict[str, Any] = field(default_factory=dict)
+    page: int = 1
+    started_at: float = 0.0
+    duration: float = 0.0
+    wait_time: float = 0.0
+    network_time: float = 0.0
+    parse_time: float = 0.0
+    status: int | None = None
+    response_bytes: int = 0
+    item_count: int = 0
+    quota_cost: int = 1
+    # Served from the response cache: observers are not notified
+    cached: bool = False
+    # Duplicate of a slow call, sent by the hedger
+    hedge: bool = False
+    # Attempt of a hedged call whose response was not used: its time is not
+    # part of the invocation's
+    lost: bool = False
+    response: dict[str, Any] | None = None
+    error: BaseException | None = None
+
+    @property
+    def parts(self) -> str | None:
+        return self.params.get("part")
+
+
+class Observer:
+    """Receives executor invocations and the upstream calls made on their behalf.
+
+    Both hooks wrap the observed operation: records are filled in by the executor
+    while the context is open and are complete by the time it exits.
+    """
+
+    @contextmanager
+    def invocation(self, invocation: Invocation) -> Iterator[None]:
+        yield
+
+    @contextmanager
+    def upstream_call(
+        self,
+        invocation: Invocation,
+        call: UpstreamCall,
+    ) -> Iterator[None]:
+        yield
+
+    def record_serde(self, model: str, operation: str, duration: float, size: int):
+        """Called after a Restate payload of ``model`` was (de)serialized."""
+
+    def call_rejected(self, invocation: Invocation, call: UpstreamCall):
+        """Called when an upstream call was rejected by an open circuit."""
+
+    def circuit_changed(self, resource: str, state: CircuitState):
+        """Called when the circuit breaker of ``resource`` changed state."""
+
+
+class Observers(Observer):
+    """Fans out to several observers, outermost first."""
+
+    def __init__(self, *observers: Observer):
+        self.observers = observers
+
+    @contextmanager
+    def invocation(self, invocation: Invocation) -> Iterator[None]:
+        with ExitStack() as stack:
+            for observer in self.observers:
+                stack.enter_context(observer.invocation(invocation))
+
+            yield
+
+    @contextmanager
+    def upstream_call(
+        self,
+        invocation: Invocation,
+        call: UpstreamCall,
+    ) -> Iterator[None]:
+        with ExitStack() as stack:
+            for observer in self.observers:
+                stack.enter_context(observer.upstream_call(invocation, call))
+
+            yield
+
+    def record_serde(self, model: str, operation: str, duration: float, size: int):
+        for observer in self.observers:
+            observer.record_serde(model, operation, duration, size)
+
+    def call_rejected(self, invocation: Invocation, call: UpstreamCall):
+        for observer in self.observers:
+            observer.call_rejected(invocation, call)
+
+    def circuit_changed(self, resource: str, state: CircuitState):
+        for observer in self.observers:
+            observer.circuit_changed(resource, state)
+
+
+class ObservedSerde(Serde[T]):
+    """Reports the time spent in a wrapped Restate serde to an observer."""
+
+    def __init__(self, serde: Serde[T], observer: Observer, model: str):
+        self.serde = serde
+        self.observer = observer
+        self.model = model
+
+    def deserialize(self, buf: bytes) -> T | None:
+        start = time.perf_counter()
+        try:
+            return self.serde.deserialize(buf)
+        finally:
+            self.observer.record_serde(
+                self.model, "deserialize", time.perf_counter() - start, len(buf)
+            )
+
+    def serialize(self, obj: T | None) -> bytes:
+        start = time.perf_counter()
+        buf = self.serde.serialize(obj)
+        self.observer.record_serde(
+            self.model, "serialize", time.perf_counter() - start, len(buf)
+        )
+
+        return buf
@@ -0,0 +1,211 @@
+import hashlib
+import time
+import uuid
+from pathlib import Path
+from typing import Any
+
+from .model import OffloadManifest
+
+
+class Upload:
+    """An object being written to storage, one chunk at a time."""
+
+    def write(self, data: bytes):
+        raise NotImplementedError
+
+    def close(self, item_count: int) -> OffloadManifest:
+        """Finish the upload and return the location of the object."""
+        raise NotImplementedError
+
+    def abort(self):
+        """Discard the upload."""
+
+
+class Offloader:
+    """Stores listAll* results that are too large to return inline.
+
+    Once the upstream responses of an invocation exceed ``threshold`` bytes,
+    the executor streams the remaining items to an upload and returns a
+    manifest instead of the items.
+    """
+
+    def __init__(self, threshold: int = 4 * 1024 * 1024):
+        self.threshold = threshold
+
+    def open(
+        self,
+        name: str,
+        extension: str = "ndjson",
+        content_type: str = "application/x-ndjson",
+    ) -> Upload:
+        raise NotImplementedError
+
+    def _key(self, name: str, extension: str) -> str:
+        return f"{name}/{time.strftime('%Y/%m/%d')}/{uuid.uuid4()}.{extension}"
+
+
+class LocalOffloader(Offloader):
+    """Offloads results to files in a local directory."""
+
+    def __init__(self, directory: str | Path, threshold: int = 4 * 1024 * 1024):
+        super().__init__(threshold)
+
+        self.directory = Path(directory)
+
+    def open(
+        self,
+        name: str,
+        extension: str = "ndjson",
+        content_type: str = "application/x-ndjson",
+    ) -> Upload:
+        return _LocalUpload(self.directory / self._key(name, extension), content_type)
+
+
+class _LocalUpload(Upload):
+    def __init__(self, path: Path, content_type: str):
+        path.parent.mkdir(parents=True, exist_ok=True)
+
+        self.path = path
+        self.content_type = content_type
+        self.size = 0
+        self._file = path.open("wb")
+        self._digest = hashlib.sha256()
+
+    def write(self, data: bytes):
+        self._file.write(data)
+        self._digest.update(data)
+        self.size += len(data)
+
+    def close(self, item_count: int) -> OffloadManifest:
+        self._file.close()
+
+        return OffloadManifest(
+            key=str(self.path),
+            content_type=self.content_type,
+            item_count=item_count,
+            size=self.size,
+            checksum=self._digest.hexdigest(),
+        )
+
+    def abort(self):
+        self._file.close()
+        self.path.unlink(missing_ok=True)
+
+
+class S3Offloader(Offloader):
+    """Offloads results to an S3-compatible bucket (AWS S3, rustfs, MinIO).
+
+    Objects are written with multipart uploads of ``part_size`` bytes, so
+    only a single part is held in memory at a time.
+
+    Args:
+        client: S3 client (``boto3.client("s3", endpoint_url=...)``).
+        bucket: Bucket to upload results to.
+        prefix: Prefix of the object keys.
+        threshold: Size of upstream responses above which results are offloaded.
+        part_size: Size of multipart upload parts (at least 5 MiB).
+    """
+
+    def __init__(
+        self,
+        client: Any,
+        bucket: str,
+        prefix: str = "",
+        threshold: int = 4 * 1024 * 1024,
+        part_size: int = 8 * 1024 * 1024,
+    ):
+        super().__init__(threshold)
+
+        self.client = client
+        self.bucket = bucket
+        self.prefix = prefix
+        self.part_size = part_size
+
+    def open(
+        self,
+        name: str,
+        extension: str = "ndjson",
+        content_type: str = "application/x-ndjson",
+    ) -> Upload:
+        return _S3Upload(self, self.prefix + self._key(name, extension), content_type)
+
+
+class _S3Upload(Upload):
+    def __init__(self, offloader: S3Offloader, key: str, content_type: str):
+        self.offloader = offloader
+        self.key = key
+        self.content_type = content_type
+        self.size = 0
+        self._buffer = bytearray()
+        self._digest = hashlib.sha256()
+        self._upload_id: str | None = None
+        self._parts: list[dict[str, Any]] = []
+
+    @property
+    def _client(self) -> Any:
+        return self.offloader.client
+
+    def write(self, data: bytes):
+        self._buffer += data
+        self._digest.update(data)
+        self.size += len(data)
+
+        if len(self._buffer) >= self.offloader.part_size:
+            self._upload_part()
+
+    def _upload_part(self):
+        if self._upload_id is None:
+            self._upload_id = self._client.create_multipart_upload(
+                Bucket=self.offloader.bucket,
+                Key=self.key,
+                ContentType=self.content_type,
+            )["UploadId"]
+
+        number = len(self._parts) + 1
+        response = self._client.upload_part(
+            Bucket=self.offloader.bucket,
+            Key=self.key,
+            UploadId=self._upload_id,
+            PartNumber=number,
+            Body=bytes(self._buffer),
+        )
+        self._parts.append({"PartNumber": number, "ETag": response["ETag"]})
+        self._buffer.clear()
+
+    def close(self, item_count: int) -> OffloadManifest:
+        # Small objects don't need a multipart upload
+        if self._upload_id is None:
+            response = self._client.put_object(
+                Bucket=self.offloader.bucket,
+                Key=self.key,
+                Body=bytes(self._buffer),
+                ContentType=self.content_type,
+            )
+        else:
+            if self._buffer:
+                self._upload_part()
+
+            response = self._client.complete_multipart_upload(
+                Bucket=self.offloader.bucket,
+                Key=self.key,
+                UploadId=self._upload_id,
+                MultipartUpload={"Parts": self._parts},
+            )
+
+        return OffloadManifest(
+            bucket=self.offloader.bucket,
+            key=self.key,
+            content_type=self.content_type,
+            item_count=item_count,
+            size=self.size,
+            etag=response.get("ETag", "").strip('"') or None,
+            checksum=self._digest.hexdigest(),
+        )
+
+    def abort(self):
+        if self._upload_id is not None:
+            self._client.abort_multipart_upload(
+                Bucket=self.offloader.bucket,
+                Key=self.key,
+                UploadId=self._upload_id,
+            )
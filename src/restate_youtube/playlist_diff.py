@@ -0,0 +1,158 @@
+import bisect
+from typing import Any
+
+from .model_playlist_diff import (
+    DiffPlaylistResponse,
+    PlaylistDiff,
+    PlaylistIndex,
+    PlaylistItemChange,
+)
+
+
+class PlaylistDiffer:
+    """Diffs the pages of a playlist against an index in a single pass.
+
+    Pages are fed in order as they arrive and are not kept: only the new
+    index and the old and new positions of the items present in both are.
+    Pages with the same etag as the page at the same place in the index
+    hold the same items, so they are taken from the index instead.
+    """
+
+    def __init__(self, index: PlaylistIndex | None = None):
+        self.old = index
+        self.index = PlaylistIndex()
+        self.diff = PlaylistDiff(baseline=index is None)
+
+        old_ids = index.item_ids if index is not None else []
+        self._old_positions = {item_id: p for p, item_id in enumerate(old_ids)}
+        self._seen = bytearray(len(old_ids))
+
+        # Items present in both, in new order
+        self._new_positions: list[int] = []
+        self._previous_positions: list[int] = []
+
+    def page(self, etag: str | None, items: list[dict[str, Any]]):
+        """Diff the next page of playlist items."""
+        page = self.diff.pages
+        self.diff.pages += 1
+        self.index.page_etags.append(etag or "")
+
+        old = self.old
+        start = len(self.index.item_ids)
+        end = start + len(items)
+
+        if (
+            old is not None
+            and etag
+            and page < len(old.page_etags)
+            and old.page_etags[page] == etag
+            and end <= len(old.item_ids)
+        ):
+            self.diff.unchanged_pages += 1
+
+            self.index.item_ids += old.item_ids[start:end]
+            self.index.video_ids += old.video_ids[start:end]
+            self.index.etags += old.etags[start:end]
+
+            for position in range(start, end):
+                self._survived(position, position)
+
+            return
+
+        for item in items:
+            self._item(item)
+
+    def result(self) -> DiffPlaylistResponse:
+        """Return the diff of the pages fed so far, and the new index."""
+        diff = self.diff
+        diff.item_count = len(self.index.item_ids)
+
+        old = self.old
+        if old is not None:
+            diff.removed = [
+                PlaylistItemChange(
+                    item_id=item_id,
+                    video_id=old.video_ids[position] or None,
+                    position=position,
+                )
+                for position, item_id in enumerate(old.item_ids)
+                if not self._seen[position]
+            ]
+
+            diff.moved = [
+                self._change(position, previous)
+                for position, previous, kept in zip(
+                    self._new_positions,
+                    self._previous_positions,
+                    _increasing(self._previous_positions),
+                )
+                if not kept
+            ]
+
+        return DiffPlaylistResponse(diff=diff, index=self.index)
+
+    def _item(self, item: dict[str, Any]):
+        index = self.index
+        position = len(index.item_ids)
+
+        item_id = item["id"]
+        etag = item.get("etag") or ""
+        index.item_ids.append(item_id)
+        index.video_ids.append(item.get("contentDetails", {}).get("videoId") or "")
+        index.etags.append(etag)
+
+        if self.old is None:
+            return
+
+        previous = self._old_positions.get(item_id)
+        if previous is None:
+            self.diff.added.append(self._change(position))
+            return
+
+        self._survived(position, previous)
+        if self.old.etags[previous] != etag:
+            self.diff.updated.append(self._change(position, previous))
+
+    def _survived(self, position: int, previous: int):
+        self._seen[previous] = 1
+        self._new_positions.append(position)
+        self._previous_positions.append(previous)
+
+    def _change(self, position: int, previous: int | None = None) -> PlaylistItemChange:
+        return PlaylistItemChange(
+            item_id=self.index.item_ids[position],
+            video_id=self.index.video_ids[position] or None,
+            position=position,
+            previous_position=previous,
+        )
+
+
+def _increasing(values: list[int]) -> bytearray:
+    """Flag the values of a longest increasing subsequence of distinct values.
+
+    Items outside of it are the fewest ones to move to restore the order.
+    """
+    # Index of the smallest value ending an increasing run of each length
+    tails: list[int] = []
+    tail_values: list[int] = []
+    previous = [-1] * len(values)
+
+    for i, value in enumerate(values):
+        length = bisect.bisect_left(tail_values, value)
+        if length:
+            previous[i] = tails[length - 1]
+
+        if length == len(tails):
+            tails.append(i)
+            tail_values.append(value)
+        else:
+            tails[length] = i
+            tail_values[length] = value
+
+    kept = bytearray(len(values))
+    i = tails[-1] if tails else -1
+    while i >= 0:
+        kept[i] = 1
+        i = previous[i]
+
+    return kept
@@ -0,0 +1,73 @@
+import cProfile
+import logging
+import random
+import threading
+from collections.abc import Iterator
+from contextlib import contextmanager
+from pathlib import Path
+
+from .observer import Invocation, Observer
+
+_logger = logging.getLogger(__name__)
+
+
+class ProfilingObserver(Observer):
+    """Captures cProfile output for a sample of slow invocations.
+
+    A ``sample_rate`` fraction of invocations (and every invocation with the
+    ``debug`` request flag) runs under cProfile. Profiles of invocations that
+    take at least ``threshold`` seconds, or were requested with ``debug``, are
+    written to ``output_dir`` in pstats format (``python -m pstats``, snakeviz).
+
+    Only one invocation is profiled at a time, since Python allows a single
+    active profiler per process.
+    """
+
+    def __init__(
+        self,
+        output_dir: str | Path,
+        sample_rate: float = 0.01,
+        threshold: float = 10.0,
+        logger: logging.Logger = _logger,
+    ):
+        self.output_dir = Path(output_dir)
+        self.sample_rate = sample_rate
+        self.threshold = threshold
+        self.logger = logger
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def invocation(self, invocation: Invocation) -> Iterator[None]:
+        debug = getattr(invocation.request, "debug", False)
+
+        if not (debug or random.random() < self.sample_rate):
+            yield
+            return
+
+        if not self._lock.acquire(blocking=False):
+            yield
+            return
+
+        try:
+            profiler = cProfile.Profile()
+            profiler.enable()
+            try:
+                yield
+            finally:
+                profiler.disable()
+
+            if debug or invocation.duration >= self.threshold:
+                self.output_dir.mkdir(parents=True, exist_ok=True)
+                path = self.output_dir / (
+                    f"{invocation.name}-{int(invocation.started_at * 1000)}.prof"
+                )
+                profiler.dump_stats(path)
+
+                self.logger.info(
+                    "Profiled %s (%.3fs) to %s",
+                    invocation.name,
+                    invocation.duration,
+                    path,
+                )
+        finally:
+            self._lock.release()
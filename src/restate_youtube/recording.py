@@ -0,0 +1,340 @@
+import contextvars
+import json
+import statistics
+import threading
+import time
+import typing
+from collections import defaultdict, deque
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, TextIO
+
+from googleapiclient.errors import HttpError
+
+from .breaker import CircuitOpenError
+from .deadline import Cancelled, DeadlineExceeded
+from .executor import Executor
+from .observer import Invocation, Observer, UpstreamCall
+
+REDACTED = "REDACTED"
+
+DEFAULT_REDACTED_PARAMS = frozenset(
+    {
+        "key",
+        "onBehalfOfContentOwner",
+        "onBehalfOfContentOwnerChannel",
+    }
+)
+
+# Invocation being recorded, inherited by the invocations it starts
+_parent: contextvars.ContextVar[Invocation | None] = contextvars.ContextVar(
+    "parent", default=None
+)
+
+
+def sanitize(
+    params: dict[str, Any],
+    redact: Iterable[str] = DEFAULT_REDACTED_PARAMS,
+) -> dict[str, Any]:
+    """Replace sensitive parameter values and drop unset ones."""
+    redact = frozenset(redact)
+
+    return {
+        k: REDACTED if k in redact else v
+        for k, v in sorted(params.items())
+        if v is not None
+    }
+
+
+class Recorder(Observer):
+    """Records upstream traffic and invocation timings as newline-delimited JSON.
+
+    Each line is either a ``call`` entry (sanitized request parameters, the raw
+    response and its latency) or an ``invocation`` entry (the executor method,
+    its sanitized request and its duration). Invocations started by another
+    one (e.g. batch entries) are marked as ``nested``.
+    """
+
+    def __init__(
+        self,
+        stream: TextIO,
+        redact: Iterable[str] = DEFAULT_REDACTED_PARAMS,
+    ):
+        self.stream = stream
+        self.redact = frozenset(redact)
+        self._lock = threading.Lock()
+
+    @classmethod
+    def open(cls, path: str | Path, **kwargs: Any) -> "Recorder":
+        return cls(open(path, "a", encoding="utf-8"), **kwargs)
+
+    def close(self):
+        self.stream.close()
+
+    def _write(self, entry: dict[str, Any]):
+        line = json.dumps(entry, default=str)
+
+        with self._lock:
+            self.stream.write(line + "\n")
+            self.stream.flush()
+
+    @contextmanager
+    def invocation(self, invocation: Invocation) -> Iterator[None]:
+        nested = _parent.get() is not None
+        token = _parent.set(invocation)
+
+        try:
+            yield
+        finally:
+            _parent.reset(token)
+            self._write(
+                {
+                    "type": "invocation",
+                    "name": invocation.name,
+                    "request": sanitize(
+                        invocation.request.model_dump(mode="json", exclude_none=True),
+                        self.redact,
+                    ),
+                    "startedAt": invocation.started_at,
+                    "duration": invocation.duration,
+                    "pages": invocation.pages,
+                    "nested": nested,
+                    "error": repr(invocation.error) if invocation.error else None,
+                }
+            )
+
+    @contextmanager
+    def upstream_call(
+        self,
+        invocation: Invocation,
+        call: UpstreamCall,
+    ) -> Iterator[None]:
+        try:
+            yield
+        finally:
+            self._write(
+                {
+                    "type": "call",
+                    "resource": call.resource,
+                    "params": sanitize(call.params, self.redact),
+                    "startedAt": call.started_at,
+                    "duration": call.duration,
+                    "response": call.response,
+                    "error": repr(call.error) if call.error else None,
+                }
+            )
+
+
+@dataclass
+class Recording:
+    """Entries loaded from a file written by ``Recorder``."""
+
+    calls: list[dict[str, Any]] = field(default_factory=list)
+    invocations: list[dict[str, Any]] = field(default_factory=list)
+
+    @classmethod
+    def load(cls, path: str | Path) -> "Recording":
+        recording = cls()
+
+        with open(path, encoding="utf-8") as f:
+            for line in f:
+                if not line.strip():
+                    continue
+
+                entry = json.loads(line)
+                if entry["type"] == "call":
+                    recording.calls.append(entry)
+                elif entry["type"] == "invocation":
+                    recording.invocations.append(entry)
+
+        recording.invocations.sort(key=lambda e: e["startedAt"])
+
+        return recording
+
+
+def _call_key(resource: str, params: dict[str, Any]) -> str:
+    return json.dumps([resource, params], sort_keys=True, default=str)
+
+
+class ReplayClient:
+    """Serves recorded responses in place of the YouTube API client.
+
+    It can be passed to ``Executor`` instead of the object returned by
+    ``googleapiclient.discovery.build``. Requests are matched on resource and
+    sanitized parameters; repeated requests cycle through the recorded responses.
+
+    ``speed`` controls simulated upstream latency: ``None`` answers immediately,
+    ``1.0`` sleeps for the recorded duration and ``2.0`` for half of it.
+    """
+
+    def __init__(
+        self,
+        recording: Recording,
+        speed: float | None = None,
+        redact: Iterable[str] = DEFAULT_REDACTED_PARAMS,
+    ):
+        self.speed = speed
+        self.redact = frozenset(redact)
+        self._lock = threading.Lock()
+        # Duration and body of the recorded responses
+        self._calls: dict[str, deque[tuple[float, bytes]]] = defaultdict(deque)
+
+        for call in recording.calls:
+            if call.get("error") is None:
+                self._calls[_call_key(call["resource"], call["params"])].append(
+                    (call["duration"], json.dumps(call["response"]).encode())
+                )
+
+    def _next(self, resource: str, params: dict[str, Any]) -> bytes:
+        key = _call_key(resource, sanitize(params, self.redact))
+
+        with self._lock:
+            calls = self._calls.get(key)
+            if not calls:
+                raise LookupError(f"No recorded response for {resource}: {params}")
+
+            duration, content = calls[0]
+            calls.rotate(-1)
+
+        if self.speed:
+            time.sleep(duration / self.speed)
+
+        return content
+
+    def __getattr__(self, resource: str) -> Callable[[], "_ReplayResource"]:
+        if resource.startswith("_"):
+            raise AttributeError(resource)
+
+        return lambda: _ReplayResource(self, resource)
+
+
+class _ReplayResource:
+    def __init__(self, client: ReplayClient, resource: str):
+        self.client = client
+        self.resource = resource
+
+    def list(self, **params: Any) -> "_ReplayRequest":
+        return _ReplayRequest(self.client, self.resource, params)
+
+
+class _ReplayResponse:
+    status = 200
+
+
+class _ReplayRequest:
+    def __init__(self, client: ReplayClient, resource: str, params: dict[str, Any]):
+        self.client = client
+        self.resource = resource
+        self.params = params
+
+    # Parses the body like googleapiclient, so the executor can hook it
+    def postproc(self, resp: Any, content: bytes) -> Any:
+        return json.loads(content)
+
+    def execute(self, http: Any = None, num_retries: int = 0) -> Any:
+        return self.postproc(
+            _ReplayResponse(), self.client._next(self.resource, self.params)
+        )
+
+
+# Errors of replayed invocations that are reported instead of ending the replay
+_CALL_ERRORS = (
+    HttpError,
+    LookupError,
+    ValueError,
+    OSError,
+    CircuitOpenError,
+    DeadlineExceeded,
+    Cancelled,
+)
+
+
+@dataclass
+class ReplayResult:
+    name: str
+    recorded_duration: float
+    duration: float
+    error: str | None = None
+
+
+@dataclass
+class ReplayReport:
+    """Outcome of replaying recorded invocations against an executor."""
+
+    results: list[ReplayResult]
+    wall_time: float
+
+    @property
+    def throughput(self) -> float:
+        return len(self.results) / self.wall_time if self.wall_time else 0.0
+
+    def percentile(self, p: float, name: str | None = None) -> float:
+        durations = [
+            r.duration
+            for r in self.results
+            if r.error is None and (name is None or r.name == name)
+        ]
+        if len(durations) < 2:
+            return durations[0] if durations else 0.0
+
+        return statistics.quantiles(durations, n=100, method="inclusive")[
+            min(max(int(p), 1), 99) - 1
+        ]
+
+
+def replay(
+    executor: Executor,
+    invocations: list[dict[str, Any]],
+    speed: float | None = 1.0,
+    max_workers: int = 16,
+) -> ReplayReport:
+    """Re-issue recorded invocations against an executor.
+
+    Invocations are started at their recorded offsets divided by ``speed``
+    (``None`` starts them all at once) and run on a thread pool, the same way
+    Restate runs executor methods. Nested invocations are skipped: the
+    invocations that started them run them again.
+    """
+    invocations = [e for e in invocations if not e.get("nested")]
+    if not invocations:
+        return ReplayReport(results=[], wall_time=0.0)
+
+    origin = invocations[0]["startedAt"]
+    start = time.perf_counter()
+
+    def run(entry: dict[str, Any]) -> ReplayResult:
+        method = getattr(executor, entry["name"])
+        request_type = typing.get_type_hints(method)["request"]
+        request = request_type.model_validate(entry["request"])
+
+        call_start = time.perf_counter()
+        error = None
+        try:
+            method(request)
+        except _CALL_ERRORS as e:
+            error = repr(e)
+
+        return ReplayResult(
+            name=entry["name"],
+            recorded_duration=entry["duration"],
+            duration=time.perf_counter() - call_start,
+            error=error,
+        )
+
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        futures = []
+        for entry in invocations:
+            if speed:
+                delay = (entry["startedAt"] - origin) / speed
+                delay -= time.perf_counter() - start
+                if delay > 0:
+                    time.sleep(delay)
+
+            futures.append(pool.submit(run, entry))
+
+        results = [f.result() for f in futures]
+
+    return ReplayReport(results=results, wall_time=time.perf_counter() - start)
@@ -0,0 +1,149 @@
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from datetime import UTC, datetime
+from pathlib import Path
+
+from .model_channels import ChannelResolution
+
+
+def handle_key(handle: str) -> str:
+    """Return the cache key of a handle; handles are case-insensitive."""
+    handle = handle.strip().lower()
+    if not handle.startswith("@"):
+        handle = f"@{handle}"
+
+    return f"handle:{handle}"
+
+
+def username_key(username: str) -> str:
+    """Return the cache key of a legacy username; usernames are case-insensitive."""
+    return f"username:{username.strip().lower()}"
+
+
+class ResolutionStore:
+    """Persistent backing of a :class:`ResolutionCache`."""
+
+    def get(self, key: str) -> ChannelResolution | None:
+        raise NotImplementedError
+
+    def set(self, key: str, resolution: ChannelResolution):
+        raise NotImplementedError
+
+
+class SQLiteResolutionStore(ResolutionStore):
+    """Stores resolutions in an SQLite database.
+
+    The database is opened in WAL mode, so processes on the same host can
+    share it.
+    """
+
+    def __init__(self, path: str | Path):
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(path, check_same_thread=False, timeout=10)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS resolutions"
+            " (key TEXT PRIMARY KEY, value BLOB NOT NULL)"
+        )
+        self._db.commit()
+
+    def get(self, key: str) -> ChannelResolution | None:
+        with self._lock:
+            row = self._db.execute(
+                "SELECT value FROM resolutions WHERE key = ?", (key,)
+            ).fetchone()
+
+        return ChannelResolution.model_validate_json(row[0]) if row else None
+
+    def set(self, key: str, resolution: ChannelResolution):
+        value = resolution.model_dump_json(exclude={"cached"})
+
+        with self._lock, self._db:
+            self._db.execute(
+                "INSERT OR REPLACE INTO resolutions (key, value) VALUES (?, ?)",
+                (key, value),
+            )
+
+
+class ResolutionCache:
+    """Caches the channels handles and usernames resolve to.
+
+    Resolutions are kept in process (least recently used ones are evicted
+    beyond ``max_size``) and, if a store is given, persisted in it.
+    Handles and usernames without a channel are cached for ``negative_ttl``
+    seconds, as they may be claimed later.
+    """
+
+    def __init__(
+        self,
+        store: ResolutionStore | None = None,
+        ttl: float = 7 * 24 * 3600,
+        negative_ttl: float = 3600,
+        max_size: int = 100_000,
+    ):
+        self.store = store
+        self.ttl = ttl
+        self.negative_ttl = negative_ttl
+        self.max_size = max_size
+
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[str, ChannelResolution] = OrderedDict()
+
+    def get(self, key: str) -> ChannelResolution | None:
+        """Return the cached resolution of a key, unless it expired."""
+        with self._lock:
+            resolution = self._entries.get(key)
+            if resolution is not None:
+                self._entries.move_to_end(key)
+
+        # Other processes sharing the store may have resolved it since
+        if self.store is not None and (resolution is None or self._expired(resolution)):
+            stored = self.store.get(key)
+            if stored is not None:
+                resolution = stored
+                self._remember(key, resolution)
+
+        if resolution is None or self._expired(resolution):
+            return None
+
+        return resolution.model_copy(update={"cached": True})
+
+    def set(self, key: str, resolution: ChannelResolution):
+        self._remember(key, resolution)
+
+        if self.store is not None:
+            self.store.set(key, resolution)
+
+    def _remember(self, key: str, resolution: ChannelResolution):
+        with self._lock:
+            self._entries[key] = resolution
+            self._entries.move_to_end(key)
+
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def _expired(self, resolution: ChannelResolution) -> bool:
+        ttl = self.ttl if resolution.channel_id is not None else self.negative_ttl
+
+        return resolution.resolved_at.timestamp() + ttl < time.time()
+
+
+def resolution(
+    key: str,
+    channel_id: str | None = None,
+    uploads_playlist_id: str | None = None,
+) -> ChannelResolution:
+    """Create the resolution of a cache key resolved just now."""
+    kind, _, name = key.partition(":")
+
+    return ChannelResolution(
+        **{kind: name},
+        channel_id=channel_id,
+        uploads_playlist_id=uploads_playlist_id,
+        resolved_at=datetime.now(UTC),
+    )
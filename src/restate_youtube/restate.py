@@ -1,11 +1,48 @@
+import asyncio
+from collections.abc import Callable, Mapping
+from datetime import datetime, timedelta
+
 import restate
+from pydantic import BaseModel
+from restate.serde import PydanticJsonSerde, Serde
 
-from .executor import Executor
+from .deadline import CancelScope, DeadlineExceeded
+from .decode import MsgspecDecoder
+from .executor import Executor, NotConfiguredError, NotFoundError
+from .model_analytics import (
+    AggregateChannelVideosRequest,
+    AggregateChannelVideosResponse,
+)
+from .model_batch import BatchRequest, BatchResponse
 from .model_channels import (
     ListAllChannelsRequest,
     ListAllChannelsResponse,
     ListChannelsRequest,
     ListChannelsResponse,
+    ResolveChannelsRequest,
+    ResolveChannelsResponse,
+)
+from .model_charts import ListChartsRequest, ListChartsResponse
+from .model_comment_threads import (
+    ListAllCommentThreadsByVideoRequest,
+    ListAllCommentThreadsByVideoResponse,
+    ListAllCommentThreadsRequest,
+    ListAllCommentThreadsResponse,
+    ListCommentThreadsRequest,
+    ListCommentThreadsResponse,
+)
+from .model_live import (
+    LiveTracker,
+    PollLiveVideosRequest,
+    PollLiveVideosResponse,
+    TrackLiveVideosRequest,
+    UntrackLiveVideosRequest,
+)
+from .model_playlist_diff import (
+    DiffPlaylistRequest,
+    DiffPlaylistResponse,
+    PlaylistDiff,
+    PlaylistIndex,
 )
 from .model_playlist_item import (
     ListAllPlaylistItemsRequest,
@@ -19,21 +56,32 @@ from .model_playlists import (
     ListPlaylistsRequest,
     ListPlaylistsResponse,
 )
+from .model_prefetch import PrefetchQuery, PrefetchRequest, PrefetchResponse
 from .model_videos import (
     ListAllVideosRequest,
     ListAllVideosResponse,
     ListVideosRequest,
     ListVideosResponse,
 )
+from .observer import ObservedSerde
+from .serde import ModelSerde
+
+# Creates the serde of a request or response model
+SerdeFactory = Callable[[type[BaseModel]], Serde]
+
+# Unix time or ISO 8601 timestamp the caller stops waiting at
+DEADLINE_HEADER = "x-deadline"
 
 
 def create_service(
     executor: Executor,
     service_name: str = "YouTube",
+    serde_factory: SerdeFactory = PydanticJsonSerde,
+    journal_serde_factory: SerdeFactory | None = None,
 ) -> restate.Service:
     service = restate.Service(service_name)
 
-    register_service(executor, service)
+    register_service(executor, service, serde_factory, journal_serde_factory)
 
     return service
 
@@ -41,91 +89,599 @@ def create_service(
 def register_service(
     executor: Executor,
     service: restate.Service,
+    serde_factory: SerdeFactory = PydanticJsonSerde,
+    journal_serde_factory: SerdeFactory | None = None,
 ):
-    @service.handler("listChannels")
+    """Register the handlers of the executor.
+
+    ``serde_factory`` creates the serdes of handler input and output,
+    ``journal_serde_factory`` those of the results journaled by ``ctx.run``
+    (e.g. a compressing ``ModelSerde``). Journal entries use the handler serdes
+    when not set. With ``MsgspecDecoder``, the default pydantic serdes are
+    replaced by ``ModelSerde``, which encodes its Structs.
+    """
+
+    serde, journal_serde = _serdes(executor, serde_factory, journal_serde_factory)
+
+    @service.handler(
+        "listChannels",
+        input_serde=serde(ListChannelsRequest),
+        output_serde=serde(ListChannelsResponse),
+    )
     async def list_channels(
         ctx: restate.Context,
         request: ListChannelsRequest,
     ) -> ListChannelsResponse:
-        return await ctx.run_typed(
+        return await _run(
+            ctx,
             "list_channels",
             executor.list_channels,
-            request=request,
+            journal_serde(ListChannelsResponse),
+            request,
         )
 
-    @service.handler("listPlaylists")
+    @service.handler(
+        "resolveChannels",
+        input_serde=serde(ResolveChannelsRequest),
+        output_serde=serde(ResolveChannelsResponse),
+    )
+    async def resolve_channels(
+        ctx: restate.Context,
+        request: ResolveChannelsRequest,
+    ) -> ResolveChannelsResponse:
+        return await _run(
+            ctx,
+            "resolve_channels",
+            executor.resolve_channels,
+            journal_serde(ResolveChannelsResponse),
+            request,
+        )
+
+    @service.handler(
+        "listPlaylists",
+        input_serde=serde(ListPlaylistsRequest),
+        output_serde=serde(ListPlaylistsResponse),
+    )
     async def list_playlists(
         ctx: restate.Context,
         request: ListPlaylistsRequest,
     ) -> ListPlaylistsResponse:
-        return await ctx.run_typed(
+        return await _run(
+            ctx,
             "list_playlists",
             executor.list_playlists,
-            request=request,
+            journal_serde(ListPlaylistsResponse),
+            request,
         )
 
-    @service.handler("listAllPlaylists")
+    @service.handler(
+        "listAllPlaylists",
+        input_serde=serde(ListAllPlaylistsRequest),
+        output_serde=serde(ListAllPlaylistsResponse),
+    )
     async def list_all_playlists(
         ctx: restate.Context,
         request: ListAllPlaylistsRequest,
     ) -> ListAllPlaylistsResponse:
-        return await ctx.run_typed(
+        return await _run(
+            ctx,
             "list_all_playlists",
             executor.list_all_playlists,
-            request=request,
+            journal_serde(ListAllPlaylistsResponse),
+            request,
         )
 
-    @service.handler("listAllChannels")
+    @service.handler(
+        "listAllChannels",
+        input_serde=serde(ListAllChannelsRequest),
+        output_serde=serde(ListAllChannelsResponse),
+    )
     async def list_all_channels(
         ctx: restate.Context,
         request: ListAllChannelsRequest,
     ) -> ListAllChannelsResponse:
-        return await ctx.run_typed(
+        return await _run(
+            ctx,
             "list_all_channels",
             executor.list_all_channels,
-            request=request,
+            journal_serde(ListAllChannelsResponse),
+            request,
         )
 
-    @service.handler("listPlaylistItems")
+    @service.handler(
+        "listPlaylistItems",
+        input_serde=serde(ListPlaylistItemsRequest),
+        output_serde=serde(ListPlaylistItemsResponse),
+    )
     async def list_playlist_items(
         ctx: restate.Context,
         request: ListPlaylistItemsRequest,
     ) -> ListPlaylistItemsResponse:
-        return await ctx.run_typed(
+        return await _run(
+            ctx,
             "list_playlist_items",
             executor.list_playlist_items,
-            request=request,
+            journal_serde(ListPlaylistItemsResponse),
+            request,
         )
 
-    @service.handler("listAllPlaylistItems")
+    @service.handler(
+        "listAllPlaylistItems",
+        input_serde=serde(ListAllPlaylistItemsRequest),
+        output_serde=serde(ListAllPlaylistItemsResponse),
+    )
     async def list_all_playlist_items(
         ctx: restate.Context,
         request: ListAllPlaylistItemsRequest,
     ) -> ListAllPlaylistItemsResponse:
-        return await ctx.run_typed(
+        return await _run(
+            ctx,
             "list_all_playlist_items",
             executor.list_all_playlist_items,
-            request=request,
+            journal_serde(ListAllPlaylistItemsResponse),
+            request,
+        )
+
+    @service.handler(
+        "diffPlaylist",
+        input_serde=serde(DiffPlaylistRequest),
+        output_serde=serde(DiffPlaylistResponse),
+    )
+    async def diff_playlist(
+        ctx: restate.Context,
+        request: DiffPlaylistRequest,
+    ) -> DiffPlaylistResponse:
+        return await _run(
+            ctx,
+            "diff_playlist",
+            executor.diff_playlist,
+            journal_serde(DiffPlaylistResponse),
+            request,
         )
 
-    @service.handler("listVideos")
+    @service.handler(
+        "listVideos",
+        input_serde=serde(ListVideosRequest),
+        output_serde=serde(ListVideosResponse),
+    )
     async def list_videos(
         ctx: restate.Context,
         request: ListVideosRequest,
     ) -> ListVideosResponse:
-        return await ctx.run_typed(
+        return await _run(
+            ctx,
             "list_videos",
             executor.list_videos,
-            request=request,
+            journal_serde(ListVideosResponse),
+            request,
         )
 
-    @service.handler("listAllVideos")
+    @service.handler(
+        "listAllVideos",
+        input_serde=serde(ListAllVideosRequest),
+        output_serde=serde(ListAllVideosResponse),
+    )
     async def list_all_videos(
         ctx: restate.Context,
         request: ListAllVideosRequest,
     ) -> ListAllVideosResponse:
-        return await ctx.run_typed(
+        return await _run(
+            ctx,
             "list_all_videos",
             executor.list_all_videos,
+            journal_serde(ListAllVideosResponse),
+            request,
+        )
+
+    @service.handler(
+        "listCharts",
+        input_serde=serde(ListChartsRequest),
+        output_serde=serde(ListChartsResponse),
+    )
+    async def list_charts(
+        ctx: restate.Context,
+        request: ListChartsRequest,
+    ) -> ListChartsResponse:
+        return await _run(
+            ctx,
+            "list_charts",
+            executor.list_charts,
+            journal_serde(ListChartsResponse),
+            request,
+        )
+
+    @service.handler(
+        "listCommentThreads",
+        input_serde=serde(ListCommentThreadsRequest),
+        output_serde=serde(ListCommentThreadsResponse),
+    )
+    async def list_comment_threads(
+        ctx: restate.Context,
+        request: ListCommentThreadsRequest,
+    ) -> ListCommentThreadsResponse:
+        return await _run(
+            ctx,
+            "list_comment_threads",
+            executor.list_comment_threads,
+            journal_serde(ListCommentThreadsResponse),
+            request,
+        )
+
+    @service.handler(
+        "listAllCommentThreads",
+        input_serde=serde(ListAllCommentThreadsRequest),
+        output_serde=serde(ListAllCommentThreadsResponse),
+    )
+    async def list_all_comment_threads(
+        ctx: restate.Context,
+        request: ListAllCommentThreadsRequest,
+    ) -> ListAllCommentThreadsResponse:
+        return await _run(
+            ctx,
+            "list_all_comment_threads",
+            executor.list_all_comment_threads,
+            journal_serde(ListAllCommentThreadsResponse),
+            request,
+        )
+
+    @service.handler(
+        "listAllCommentThreadsByVideo",
+        input_serde=serde(ListAllCommentThreadsByVideoRequest),
+        output_serde=serde(ListAllCommentThreadsByVideoResponse),
+    )
+    async def list_all_comment_threads_by_video(
+        ctx: restate.Context,
+        request: ListAllCommentThreadsByVideoRequest,
+    ) -> ListAllCommentThreadsByVideoResponse:
+        return await _run(
+            ctx,
+            "list_all_comment_threads_by_video",
+            executor.list_all_comment_threads_by_video,
+            journal_serde(ListAllCommentThreadsByVideoResponse),
+            request,
+        )
+
+    @service.handler(
+        "aggregateChannelVideos",
+        input_serde=serde(AggregateChannelVideosRequest),
+        output_serde=serde(AggregateChannelVideosResponse),
+    )
+    async def aggregate_channel_videos(
+        ctx: restate.Context,
+        request: AggregateChannelVideosRequest,
+    ) -> AggregateChannelVideosResponse:
+        return await _run(
+            ctx,
+            "aggregate_channel_videos",
+            executor.aggregate_channel_videos,
+            journal_serde(AggregateChannelVideosResponse),
+            request,
+        )
+
+    @service.handler(
+        "pollLiveVideos",
+        input_serde=serde(PollLiveVideosRequest),
+        output_serde=serde(PollLiveVideosResponse),
+    )
+    async def poll_live_videos(
+        ctx: restate.Context,
+        request: PollLiveVideosRequest,
+    ) -> PollLiveVideosResponse:
+        return await _run(
+            ctx,
+            "poll_live_videos",
+            executor.poll_live_videos,
+            journal_serde(PollLiveVideosResponse),
+            request,
+        )
+
+    @service.handler(
+        "prefetch",
+        input_serde=serde(PrefetchRequest),
+        output_serde=serde(PrefetchResponse),
+    )
+    async def prefetch(
+        ctx: restate.Context,
+        request: PrefetchRequest,
+    ) -> PrefetchResponse:
+        return await _run(
+            ctx,
+            "prefetch",
+            executor.prefetch,
+            journal_serde(PrefetchResponse),
+            request,
+        )
+
+    @service.handler(
+        "batch",
+        input_serde=serde(BatchRequest),
+        output_serde=serde(BatchResponse),
+    )
+    async def batch(
+        ctx: restate.Context,
+        request: BatchRequest,
+    ) -> BatchResponse:
+        return await _run(
+            ctx,
+            "batch",
+            executor.batch,
+            journal_serde(BatchResponse),
+            request,
+        )
+
+
+def create_prefetcher(
+    executor: Executor,
+    object_name: str = "YouTubePrefetcher",
+    serde_factory: SerdeFactory = PydanticJsonSerde,
+    journal_serde_factory: SerdeFactory | None = None,
+) -> restate.VirtualObject:
+    """Create a virtual object refreshing queries into the response cache.
+
+    Each object key holds one query: ``schedule`` (re)starts refreshing it
+    through delayed calls to itself, at intervals adapting to its cache
+    hits, and ``stop`` ends it.
+    """
+    if executor.response_cache is None:
+        raise ValueError("Prefetching requires a response cache")
+
+    prefetcher = restate.VirtualObject(object_name)
+    serde, journal_serde = _serdes(executor, serde_factory, journal_serde_factory)
+
+    @prefetcher.handler("schedule", input_serde=serde(PrefetchQuery))
+    async def schedule(ctx: restate.ObjectContext, query: PrefetchQuery):
+        # Refreshes scheduled before carry an older generation and stop
+        generation = (await ctx.get("generation", type_hint=int) or 0) + 1
+
+        ctx.set("generation", generation)
+        ctx.set("query", query, serde=serde(PrefetchQuery))
+        ctx.object_send(refresh, key=ctx.key(), arg=generation)
+
+    @prefetcher.handler("refresh")
+    async def refresh(ctx: restate.ObjectContext, generation: int):
+        query = await ctx.get("query", serde=serde(PrefetchQuery))
+        if query is None or generation != await ctx.get("generation", type_hint=int):
+            return
+
+        response = await _run(
+            ctx,
+            "prefetch",
+            executor.prefetch,
+            journal_serde(PrefetchResponse),
+            PrefetchRequest(queries=[query]),
+        )
+        (result,) = response.items
+
+        ctx.set(
+            "query",
+            query.model_copy(update={"interval": result.interval}),
+            serde=serde(PrefetchQuery),
+        )
+        ctx.object_send(
+            refresh,
+            key=ctx.key(),
+            arg=generation,
+            send_delay=timedelta(seconds=result.interval),
+        )
+
+    @prefetcher.handler("stop")
+    async def stop(ctx: restate.ObjectContext):
+        ctx.clear("generation")
+        ctx.clear("query")
+
+    return prefetcher
+
+
+def create_live_poller(
+    executor: Executor,
+    object_name: str = "YouTubeLivePoller",
+    serde_factory: SerdeFactory = PydanticJsonSerde,
+    journal_serde_factory: SerdeFactory | None = None,
+) -> restate.VirtualObject:
+    """Create a virtual object tracking the viewers of live and upcoming videos.
+
+    Each object key tracks a set of videos, polled in batches of 50 through
+    delayed calls to itself: live videos every ``liveInterval`` seconds,
+    upcoming ones faster as their scheduled start approaches. Videos stop
+    being polled once they end.
+    """
+    poller = restate.VirtualObject(object_name)
+    serde, journal_serde = _serdes(executor, serde_factory, journal_serde_factory)
+
+    async def schedule(ctx: restate.ObjectContext, tracker: LiveTracker, now: float):
+        ctx.set("tracker", tracker, serde=serde(LiveTracker))
+
+        next_poll_at = tracker.next_poll_at()
+        if next_poll_at is not None:
+            ctx.object_send(
+                poll,
+                key=ctx.key(),
+                arg=tracker.generation,
+                send_delay=timedelta(seconds=max(0.0, next_poll_at - now)),
+            )
+
+    @poller.handler("track", input_serde=serde(TrackLiveVideosRequest))
+    async def track(ctx: restate.ObjectContext, request: TrackLiveVideosRequest):
+        tracker = await ctx.get("tracker", serde=serde(LiveTracker)) or LiveTracker()
+        now = await ctx.time()
+
+        # Polls scheduled before carry an older generation and stop
+        tracker.generation += 1
+        tracker.track(request, now)
+
+        await schedule(ctx, tracker, now)
+
+    @poller.handler("untrack", input_serde=serde(UntrackLiveVideosRequest))
+    async def untrack(ctx: restate.ObjectContext, request: UntrackLiveVideosRequest):
+        tracker = await ctx.get("tracker", serde=serde(LiveTracker))
+        if tracker is None:
+            return
+
+        for video_id in request.video_ids:
+            tracker.videos.pop(video_id, None)
+
+        ctx.set("tracker", tracker, serde=serde(LiveTracker))
+
+    @poller.handler("poll", ingress_private=True)
+    async def poll(ctx: restate.ObjectContext, generation: int):
+        tracker = await ctx.get("tracker", serde=serde(LiveTracker))
+        if tracker is None or generation != tracker.generation:
+            return
+
+        now = await ctx.time()
+
+        due = tracker.due(now)
+        if due:
+            response = await _run(
+                ctx,
+                "poll",
+                executor.poll_live_videos,
+                journal_serde(PollLiveVideosResponse),
+                PollLiveVideosRequest.model_validate({"videoIds": due}),
+            )
+            tracker.update(response.items)
+
+        await schedule(ctx, tracker, now)
+
+    @poller.handler("status", kind="shared", output_serde=serde(LiveTracker))
+    async def status(ctx: restate.ObjectSharedContext) -> LiveTracker:
+        return await ctx.get("tracker", serde=serde(LiveTracker)) or LiveTracker()
+
+    @poller.handler("stop")
+    async def stop(ctx: restate.ObjectContext):
+        # Pending polls find no tracker and stop
+        ctx.clear("tracker")
+
+    return poller
+
+
+def create_playlist_differ(
+    executor: Executor,
+    object_name: str = "YouTubePlaylistDiffer",
+    serde_factory: SerdeFactory = PydanticJsonSerde,
+    journal_serde_factory: SerdeFactory | None = None,
+) -> restate.VirtualObject:
+    """Create a virtual object diffing playlists against their previous check.
+
+    Each object key is a playlist ID, and stores the index of its items as
+    of the last diff.
+    """
+    differ = restate.VirtualObject(object_name)
+    serde, journal_serde = _serdes(executor, serde_factory, journal_serde_factory)
+
+    @differ.handler("diff", output_serde=serde(PlaylistDiff))
+    async def diff(ctx: restate.ObjectContext) -> PlaylistDiff:
+        index = await ctx.get("index", serde=serde(PlaylistIndex))
+
+        response = await _run(
+            ctx,
+            "diff",
+            executor.diff_playlist,
+            journal_serde(DiffPlaylistResponse),
+            DiffPlaylistRequest.model_validate(
+                {"playlistId": ctx.key(), "index": index}
+            ),
+        )
+        ctx.set("index", response.index, serde=serde(PlaylistIndex))
+
+        return response.diff
+
+    @differ.handler("index", kind="shared", output_serde=serde(PlaylistIndex))
+    async def index(ctx: restate.ObjectSharedContext) -> PlaylistIndex:
+        return await ctx.get("index", serde=serde(PlaylistIndex)) or PlaylistIndex()
+
+    @differ.handler("reset")
+    async def reset(ctx: restate.ObjectContext):
+        # The next diff is a baseline
+        ctx.clear("index")
+
+    return differ
+
+
+def _serdes(
+    executor: Executor,
+    serde_factory: SerdeFactory,
+    journal_serde_factory: SerdeFactory | None,
+) -> tuple[SerdeFactory, SerdeFactory]:
+    if isinstance(executor.decoder, MsgspecDecoder):
+        # Results hold Structs, which pydantic serdes can't encode
+        if serde_factory is PydanticJsonSerde:
+            serde_factory = ModelSerde
+        if journal_serde_factory is PydanticJsonSerde:
+            journal_serde_factory = ModelSerde
+
+    def serde(model: type[BaseModel]) -> Serde:
+        return ObservedSerde(serde_factory(model), executor.observer, model.__name__)
+
+    def journal_serde(model: type[BaseModel]) -> Serde:
+        if journal_serde_factory is None:
+            return serde(model)
+
+        return ObservedSerde(
+            journal_serde_factory(model),
+            executor.observer,
+            model.__name__,
+        )
+
+    return serde, journal_serde
+
+
+async def _run[RequestT, ResponseT](
+    ctx: restate.Context | restate.ObjectContext,
+    name: str,
+    action: Callable[[RequestT], ResponseT],
+    serde: Serde[ResponseT],
+    request: RequestT,
+) -> ResponseT:
+    """Journal the result of an executor action, run in a cancel scope.
+
+    The scope carries the deadline of the ``x-deadline`` header, and is
+    cancelled once the attempt finishes (e.g. the invocation was cancelled or
+    the connection to Restate was lost), so the action stops paginating.
+    """
+    scope = CancelScope(_deadline(ctx.request().headers))
+
+    def run(request: RequestT) -> ResponseT:
+        try:
+            return scope.run(action, request)
+        except DeadlineExceeded as e:
+            # Retrying won't make the deadline
+            raise restate.TerminalError(str(e), status_code=504) from e
+        except NotFoundError as e:
+            raise restate.TerminalError(str(e), status_code=404) from e
+        except NotConfiguredError as e:
+            raise restate.TerminalError(str(e), status_code=501) from e
+
+    finished = asyncio.ensure_future(ctx.request().attempt_finished_event.wait())
+    finished.add_done_callback(lambda _: scope.cancel())
+
+    try:
+        return await ctx.run_typed(
+            name,
+            run,
+            restate.RunOptions(serde=serde),
             request=request,
         )
+    finally:
+        finished.cancel()
+
+
+def _deadline(headers: Mapping[str, str]) -> float | None:
+    for name, value in headers.items():
+        if name.lower() != DEADLINE_HEADER:
+            continue
+
+        try:
+            return float(value)
+        except ValueError:
+            pass
+
+        try:
+            return datetime.fromisoformat(value).timestamp()
+        except ValueError:
+            raise restate.TerminalError(
+                f"Invalid {DEADLINE_HEADER} header: {value}",
+                status_code=400,
+            ) from None
+
+    return None
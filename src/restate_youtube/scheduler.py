@@ -0,0 +1,284 @@
+import itertools
+import threading
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+
+from pydantic import BaseModel, ConfigDict, Field
+
+from .deadline import CancelScope, DeadlineExceeded
+
+# Tenant of requests that name no caller or content owner
+DEFAULT_TENANT = "default"
+
+# Longest wait between checks of the cancel scope of queued calls
+_WAIT_SLICE = 0.1
+
+# Fewest tenants to sweep idle ones at
+_SWEEP_THRESHOLD = 64
+
+
+class TenantPolicy(BaseModel):
+    """Share of the upstream capacity granted to a tenant."""
+
+    model_config = ConfigDict(validate_by_alias=True, serialize_by_alias=True)
+
+    weight: float = Field(
+        1.0,
+        gt=0,
+        description="Share of the concurrency slots and quota under contention",
+    )
+
+    max_concurrency: int | None = Field(
+        None,
+        alias="maxConcurrency",
+        ge=1,
+        description="Upstream calls the tenant may have in flight at most",
+    )
+
+    quota_rate: float | None = Field(
+        None,
+        alias="quotaRate",
+        gt=0,
+        description="Quota units per second the tenant may spend at most",
+    )
+
+    quota_burst: float | None = Field(
+        None,
+        alias="quotaBurst",
+        gt=0,
+        description="Quota units the tenant may spend at once (default quotaRate)",
+    )
+
+
+@dataclass
+class _Tenant:
+    policy: TenantPolicy
+    in_flight: int = 0
+    queued: int = 0
+    # Virtual time the tenant's last queued call finishes at
+    finish: float = 0.0
+    tokens: float = 0.0
+    refilled_at: float = field(default_factory=time.monotonic)
+
+    def refill(self, now: float):
+        rate = self.policy.quota_rate
+        if rate is None:
+            return
+
+        burst = self.policy.quota_burst or rate
+        self.tokens = min(burst, self.tokens + (now - self.refilled_at) * rate)
+        self.refilled_at = now
+
+
+@dataclass(order=True)
+class _Waiter:
+    tag: float
+    seq: int
+    tenant: str = field(compare=False)
+    cost: float = field(compare=False)
+
+
+class FairScheduler:
+    """Shares upstream concurrency slots and quota between tenants.
+
+    Calls are granted slots in start-time fair queueing order: each call is
+    tagged with the virtual time its tenant's previous call finishes at, and
+    advances it by its quota cost divided by the tenant's weight. A tenant
+    crawling thousands of pages thus queues behind its own calls, while
+    others' calls are granted slots as if it were not there. Tenants may
+    also be capped in concurrency and quota spend rate.
+
+    Tenants without a policy are forgotten once idle, so callers naming
+    arbitrary tenants don't grow the scheduler.
+    """
+
+    def __init__(
+        self,
+        max_concurrency: int = 8,
+        policies: dict[str, TenantPolicy] | None = None,
+        default_policy: TenantPolicy | None = None,
+    ):
+        """
+        Args:
+            max_concurrency: Maximum number of concurrent upstream calls.
+            policies: Policies of tenants by name.
+            default_policy: Policy of tenants without one (each tenant gets
+                its own share).
+        """
+        self.max_concurrency = max_concurrency
+        self.policies = policies or {}
+        self.default_policy = default_policy or TenantPolicy()
+
+        self._cond = threading.Condition()
+        self._seq = itertools.count()
+        self._tenants: dict[str, _Tenant] = {}
+        self._waiting: list[_Waiter] = []
+        self._in_flight = 0
+        self._virtual_time = 0.0
+        self._sweep_at = _SWEEP_THRESHOLD
+
+    @contextmanager
+    def slot(
+        self,
+        tenant: str = DEFAULT_TENANT,
+        cost: float = 1,
+        scope: CancelScope | None = None,
+    ) -> Iterator[None]:
+        """Hold an upstream call slot of a tenant for a call of ``cost`` quota."""
+        self.acquire(tenant, cost, scope)
+        try:
+            yield
+        finally:
+            self.release(tenant)
+
+    def acquire(
+        self,
+        tenant: str = DEFAULT_TENANT,
+        cost: float = 1,
+        scope: CancelScope | None = None,
+    ):
+        """Wait for an upstream call slot of a tenant.
+
+        Raises :class:`DeadlineExceeded` or :class:`Cancelled` if the deadline
+        of ``scope`` passes or it is cancelled while the call is queued.
+        """
+        with self._cond:
+            state = self._tenant(tenant)
+
+            start = max(self._virtual_time, state.finish)
+            state.finish = start + cost / state.policy.weight
+
+            waiter = _Waiter(start, next(self._seq), tenant, cost)
+            self._waiting.append(waiter)
+            state.queued += 1
+
+            try:
+                while True:
+                    eligible, timeout = self._next()
+                    if eligible is waiter:
+                        break
+
+                    if scope is not None:
+                        scope.check()
+
+                        remaining = scope.remaining()
+                        if remaining is not None and remaining <= 0:
+                            raise DeadlineExceeded("Deadline passed while queued")
+
+                        # Cancelling the scope doesn't wake up queued calls
+                        timeout = min(
+                            t
+                            for t in (timeout, remaining, _WAIT_SLICE)
+                            if t is not None
+                        )
+
+                    self._cond.wait(timeout)
+            except BaseException:
+                self._leave(waiter, state)
+                raise
+
+            self._waiting.remove(waiter)
+            state.queued -= 1
+            self._virtual_time = max(self._virtual_time, waiter.tag)
+            self._in_flight += 1
+            state.in_flight += 1
+            if state.policy.quota_rate is not None:
+                state.tokens -= cost
+
+            # The next waiter may be eligible as well
+            self._cond.notify_all()
+
+    def release(self, tenant: str = DEFAULT_TENANT):
+        with self._cond:
+            self._in_flight -= 1
+            self._tenants[tenant].in_flight -= 1
+            self._evict(tenant)
+
+            self._cond.notify_all()
+
+    def _leave(self, waiter: _Waiter, state: _Tenant):
+        """Remove a call from the queue without granting it a slot."""
+        self._waiting.remove(waiter)
+        state.queued -= 1
+
+        # Give back the virtual time of the call if it was the tenant's last
+        finish = waiter.tag + waiter.cost / state.policy.weight
+        if state.finish == finish:
+            state.finish = waiter.tag
+
+        self._evict(waiter.tenant)
+
+        # Calls queued behind it may be eligible now
+        self._cond.notify_all()
+
+    def _idle(self, state: _Tenant, now: float) -> bool:
+        if state.in_flight or state.queued:
+            return False
+
+        # Forgetting a tenant refills its bucket: keep it until it is full
+        state.refill(now)
+        burst = state.policy.quota_burst or state.policy.quota_rate
+
+        return burst is None or state.tokens >= burst
+
+    def _evict(self, tenant: str):
+        state = self._tenants.get(tenant)
+        if (
+            state is not None
+            and tenant not in self.policies
+            and self._idle(state, time.monotonic())
+        ):
+            del self._tenants[tenant]
+
+    def _sweep(self):
+        """Forget idle tenants without a policy that were not evicted yet."""
+        now = time.monotonic()
+        for tenant, state in list(self._tenants.items()):
+            if tenant not in self.policies and self._idle(state, now):
+                del self._tenants[tenant]
+
+        self._sweep_at = max(_SWEEP_THRESHOLD, 2 * len(self._tenants))
+
+    def _tenant(self, tenant: str) -> _Tenant:
+        state = self._tenants.get(tenant)
+        if state is None:
+            if len(self._tenants) >= self._sweep_at:
+                self._sweep()
+
+            policy = self.policies.get(tenant, self.default_policy)
+            state = self._tenants[tenant] = _Tenant(policy)
+            state.tokens = policy.quota_burst or policy.quota_rate or 0.0
+
+        return state
+
+    def _next(self) -> tuple[_Waiter | None, float | None]:
+        """Return the waiter to grant the next slot to, and how long to wait
+        for quota if no waiter is eligible."""
+        if self._in_flight >= self.max_concurrency:
+            return None, None
+
+        now = time.monotonic()
+        timeout = None
+
+        for waiter in sorted(self._waiting):
+            state = self._tenants[waiter.tenant]
+
+            max_concurrency = state.policy.max_concurrency
+            if max_concurrency is not None and state.in_flight >= max_concurrency:
+                continue
+
+            state.refill(now)
+            rate = state.policy.quota_rate
+            if rate is not None:
+                # Calls costing more than the burst run on a full bucket
+                needed = min(waiter.cost, state.policy.quota_burst or rate)
+                if state.tokens < needed:
+                    wait = (needed - state.tokens) / rate
+                    timeout = wait if timeout is None else min(timeout, wait)
+                    continue
+
+            return waiter, None
+
+        return None, timeout
@@ -0,0 +1,176 @@
+import array
+import base64
+import binascii
+import bisect
+import re
+import struct
+import sys
+from collections.abc import Iterable, Iterator
+
+# 10 characters of 6 bits and one of 4: video IDs are 64-bit integers
+_VIDEO_ID = re.compile(r"[A-Za-z0-9_-]{10}[AEIMQUYcgkosw048]")
+
+_URLSAFE = str.maketrans("-_", "+/")
+
+_VERSION = 1
+_HEADER = struct.Struct("<BI")
+
+
+def pack_video_id(video_id: str) -> int | None:
+    """Return the 64-bit integer a video ID encodes, if it is one."""
+    if not _VIDEO_ID.fullmatch(video_id):
+        return None
+
+    return int.from_bytes(
+        binascii.a2b_base64(video_id.translate(_URLSAFE) + "="), "big"
+    )
+
+
+class SeenIds:
+    """Compact set of IDs, e.g. of the items processed by earlier requests.
+
+    Video IDs are packed into 64-bit integers and kept in a sorted array: 8
+    bytes per ID instead of about 100 for a string in a set. Other IDs
+    (channels, playlists, comment threads) are kept as strings.
+
+    IDs are added to a small buffer that is merged into the array once it
+    reaches an eighth of its size, so adding stays amortized O(1) with a few
+    bytes of overhead per ID.
+    """
+
+    # Smallest number of buffered IDs to merge
+    merge_threshold = 4096
+
+    def __init__(self, ids: Iterable[str] = ()):
+        self._packed = array.array("Q")
+        self._pending: set[int] = set()
+        self._other: set[str] = set()
+
+        self.update(ids)
+
+    def __contains__(self, id: object) -> bool:
+        if not isinstance(id, str):
+            return False
+
+        packed = pack_video_id(id)
+        if packed is None:
+            return id in self._other
+
+        return self._has_packed(packed)
+
+    def __len__(self) -> int:
+        return len(self._packed) + len(self._pending) + len(self._other)
+
+    def __iter__(self) -> Iterator[str]:
+        self._merge()
+        for packed in self._packed:
+            yield base64.urlsafe_b64encode(packed.to_bytes(8, "big")).decode()[:11]
+
+        yield from self._other
+
+    def add(self, id: str):
+        packed = pack_video_id(id)
+        if packed is None:
+            self._other.add(id)
+            return
+
+        if self._has_packed(packed):
+            return
+
+        self._pending.add(packed)
+        if len(self._pending) >= max(self.merge_threshold, len(self._packed) // 8):
+            self._merge()
+
+    def update(self, ids: Iterable[str]):
+        for id in ids:
+            self.add(id)
+
+    def copy(self) -> "SeenIds":
+        seen = SeenIds()
+        seen._packed = array.array("Q", self._packed)
+        seen._pending = set(self._pending)
+        seen._other = set(self._other)
+
+        return seen
+
+    def to_bytes(self) -> bytes:
+        """Serialize the set, e.g. to store it in Restate state or on disk."""
+        self._merge()
+
+        packed = self._packed
+        if sys.byteorder == "big":
+            packed = array.array("Q", packed)
+            packed.byteswap()
+
+        return b"".join(
+            [
+                _HEADER.pack(_VERSION, len(packed)),
+                packed.tobytes(),
+                "\n".join(sorted(self._other)).encode(),
+            ]
+        )
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> "SeenIds":
+        try:
+            version, count = _HEADER.unpack_from(data)
+        except struct.error:
+            raise ValueError("Invalid seen IDs") from None
+
+        end = _HEADER.size + count * 8
+        if version != _VERSION or len(data) < end:
+            raise ValueError("Invalid seen IDs")
+
+        seen = cls()
+        seen._packed.frombytes(data[_HEADER.size : end])
+        if sys.byteorder == "big":
+            seen._packed.byteswap()
+
+        if any(a >= b for a, b in zip(seen._packed, seen._packed[1:])):
+            raise ValueError("Invalid seen IDs")
+
+        other = data[end:].decode()
+        if other:
+            seen._other = set(other.split("\n"))
+
+        return seen
+
+    def encode(self) -> str:
+        """Return the set as a string, e.g. to pass it in a request."""
+        return base64.urlsafe_b64encode(self.to_bytes()).decode()
+
+    @classmethod
+    def decode(cls, token: str) -> "SeenIds":
+        try:
+            data = base64.urlsafe_b64decode(token)
+        except (binascii.Error, ValueError):
+            raise ValueError("Invalid seen IDs") from None
+
+        return cls.from_bytes(data)
+
+    def _has_packed(self, packed: int) -> bool:
+        if packed in self._pending:
+            return True
+
+        i = bisect.bisect_left(self._packed, packed)
+
+        return i < len(self._packed) and self._packed[i] == packed
+
+    def _merge(self):
+        if not self._pending:
+            return
+
+        # Copy the runs between insertion points instead of each ID
+        packed = self._packed
+        merged = array.array("Q")
+        start = 0
+        for value in sorted(self._pending):
+            i = bisect.bisect_left(packed, value, start)
+            merged += packed[start:i]
+            merged.append(value)
+            start = i
+
+        merged += packed[start:]
+
+        self._packed = merged
+        self._pending.clear()
@@ -0,0 +1,67 @@
+from pydantic import BaseModel
+from restate.serde import Serde
+
+from .decode import encode_json
+
+# Frame header of zstd payloads; JSON documents never start with it
+_ZSTD_MAGIC = b"\x28\xb5\x2f\xfd"
+
+
+class ModelSerde[M: BaseModel](Serde[M]):
+    """Compact serde for pydantic models.
+
+    Encodes straight to bytes with the pydantic-core serializer, optionally
+    leaving out unset (``None``) fields, and compresses payloads of at least
+    ``compression_threshold`` bytes with zstd (requires zstandard).
+
+    Structs produced by ``MsgspecDecoder`` are encoded with msgspec.
+
+    Compressed and plain payloads are told apart on decoding, so the
+    threshold can be changed without breaking existing journal entries.
+    Compression is meant for journal entries: handler input and output
+    should stay plain JSON for callers.
+    """
+
+    def __init__(
+        self,
+        model: type[M],
+        exclude_none: bool = False,
+        compression_threshold: int | None = None,
+        compression_level: int = 3,
+    ):
+        self.model = model
+        self.exclude_none = exclude_none
+        self.compression_threshold = compression_threshold
+        self.compression_level = compression_level
+
+    def deserialize(self, buf: bytes) -> M | None:
+        if not buf:
+            return None
+
+        if buf[:4] == _ZSTD_MAGIC:
+            import zstandard
+
+            buf = zstandard.ZstdDecompressor().decompress(buf)
+
+        return self.model.model_validate_json(buf)
+
+    def serialize(self, obj: M | None) -> bytes:
+        if obj is None:
+            return b""
+
+        if isinstance(obj, BaseModel):
+            buf = self.model.__pydantic_serializer__.to_json(
+                obj,
+                by_alias=True,
+                exclude_none=self.exclude_none,
+            )
+        else:
+            buf = encode_json(obj)
+
+        threshold = self.compression_threshold
+        if threshold is not None and len(buf) >= threshold:
+            import zstandard
+
+            buf = zstandard.ZstdCompressor(level=self.compression_level).compress(buf)
+
+        return buf
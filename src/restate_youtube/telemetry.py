@@ -0,0 +1,222 @@
+from collections.abc import Iterable, Iterator
+from contextlib import contextmanager
+
+from opentelemetry import metrics, trace
+from opentelemetry.metrics import CallbackOptions, Observation
+from opentelemetry.trace import Status, StatusCode
+
+from .breaker import CircuitState
+from .observer import Invocation, Observer, UpstreamCall
+from .scheduler import DEFAULT_TENANT
+
+_INSTRUMENTATION_NAME = "restate_youtube"
+
+# Metric label of tenants that are not labeled by name
+OTHER_TENANT = "other"
+
+# Values of the circuit state gauge
+_CIRCUIT_STATES = {
+    CircuitState.CLOSED: 0,
+    CircuitState.HALF_OPEN: 1,
+    CircuitState.OPEN: 2,
+}
+
+
+class TelemetryObserver(Observer):
+    """Exports executor activity as OpenTelemetry spans and metrics.
+
+    Every invocation gets a span with one child span per upstream call.
+    Exporters (OTLP, Prometheus) are configured on the global tracer and meter
+    providers by the application.
+
+    Tenants are named by callers, so metrics only label the given tenants
+    (e.g. those with a scheduling policy) by name, and the others as
+    ``other``; spans carry every tenant.
+    """
+
+    def __init__(
+        self,
+        tracer_provider: trace.TracerProvider | None = None,
+        meter_provider: metrics.MeterProvider | None = None,
+        tenants: Iterable[str] = (),
+    ):
+        self.tenants = frozenset(tenants) | {DEFAULT_TENANT}
+        self.tracer = trace.get_tracer(
+            _INSTRUMENTATION_NAME,
+            tracer_provider=tracer_provider,
+        )
+        meter = metrics.get_meter(_INSTRUMENTATION_NAME, meter_provider=meter_provider)
+
+        self.upstream_duration = meter.create_histogram(
+            "youtube.upstream.duration",
+            unit="s",
+            description="Duration of YouTube Data API calls",
+        )
+        self.upstream_response_size = meter.create_histogram(
+            "youtube.upstream.response.size",
+            unit="By",
+            description="Size of YouTube Data API response bodies",
+        )
+        self.upstream_items = meter.create_counter(
+            "youtube.upstream.items",
+            description="Items returned by the YouTube Data API",
+        )
+        self.upstream_quota = meter.create_counter(
+            "youtube.upstream.quota",
+            unit="{unit}",
+            description="YouTube Data API quota units spent",
+        )
+        self.invocation_duration = meter.create_histogram(
+            "youtube.invocation.duration",
+            unit="s",
+            description="Duration of executor invocations",
+        )
+        self.invocation_pages = meter.create_histogram(
+            "youtube.invocation.pages",
+            description="Pages fetched per executor invocation",
+        )
+        self.invocation_phase_duration = meter.create_histogram(
+            "youtube.invocation.phase.duration",
+            unit="s",
+            description="Time spent per phase (wait, network, parse, validation)",
+        )
+        self.serde_duration = meter.create_histogram(
+            "youtube.serde.duration",
+            unit="s",
+            description="Duration of Restate payload (de)serialization",
+        )
+        self.serde_size = meter.create_histogram(
+            "youtube.serde.size",
+            unit="By",
+            description="Size of Restate payloads",
+        )
+
+        self.circuit_states: dict[str, CircuitState] = {}
+        self.circuit_rejected = meter.create_counter(
+            "youtube.circuit.rejected",
+            description="Upstream calls rejected by an open circuit",
+        )
+        meter.create_observable_gauge(
+            "youtube.circuit.state",
+            callbacks=[self._observe_circuits],
+            description="Circuit breaker state per resource (0 closed, 1 half-open, 2 open)",
+        )
+
+    @contextmanager
+    def invocation(self, invocation: Invocation) -> Iterator[None]:
+        with self.tracer.start_as_current_span(
+            f"YouTube {invocation.name}",
+            record_exception=False,
+            set_status_on_exception=False,
+        ) as span:
+            try:
+                yield
+            finally:
+                attributes = {
+                    "youtube.operation": invocation.name,
+                    "error": invocation.error is not None,
+                }
+
+                span.set_attributes(
+                    {
+                        "youtube.operation": invocation.name,
+                        "youtube.tenant": invocation.tenant,
+                        "youtube.pages": invocation.pages,
+                        "youtube.wait_time": invocation.wait_time,
+                        "youtube.network_time": invocation.network_time,
+                        "youtube.parse_time": invocation.parse_time,
+                        "youtube.validation_time": invocation.validation_time,
+                    }
+                )
+                if invocation.error is not None:
+                    span.record_exception(invocation.error)
+                    span.set_status(Status(StatusCode.ERROR, str(invocation.error)))
+
+                self.invocation_duration.record(invocation.duration, attributes)
+                self.invocation_pages.record(invocation.pages, attributes)
+
+                for phase, duration in (
+                    ("wait", invocation.wait_time),
+                    ("network", invocation.network_time),
+                    ("parse", invocation.parse_time),
+                    ("validation", invocation.validation_time),
+                ):
+                    self.invocation_phase_duration.record(
+                        duration,
+                        {
+                            "youtube.operation": invocation.name,
+                            "youtube.tenant": self._tenant_label(invocation.tenant),
+                            "phase": phase,
+                        },
+                    )
+
+    @contextmanager
+    def upstream_call(
+        self,
+        invocation: Invocation,
+        call: UpstreamCall,
+    ) -> Iterator[None]:
+        with self.tracer.start_as_current_span(
+            f"youtube.{call.resource}.list",
+            kind=trace.SpanKind.CLIENT,
+            record_exception=False,
+            set_status_on_exception=False,
+        ) as span:
+            try:
+                yield
+            finally:
+                attributes = {
+                    "youtube.resource": call.resource,
+                    "youtube.tenant": self._tenant_label(invocation.tenant),
+                    "youtube.hedge": call.hedge,
+                    "http.response.status_code": call.status or 0,
+                }
+
+                span.set_attributes(
+                    {
+                        "youtube.resource": call.resource,
+                        "youtube.parts": call.parts or "",
+                        "youtube.page": call.page,
+                        "youtube.items": call.item_count,
+                        "youtube.quota_cost": call.quota_cost,
+                        "youtube.hedge": call.hedge,
+                        "youtube.network_time": call.network_time,
+                        "youtube.parse_time": call.parse_time,
+                        "http.response.body.size": call.response_bytes,
+                    }
+                )
+                if call.status is not None:
+                    span.set_attribute("http.response.status_code", call.status)
+                if call.error is not None:
+                    span.record_exception(call.error)
+                    span.set_status(Status(StatusCode.ERROR, str(call.error)))
+
+                self.upstream_duration.record(call.duration, attributes)
+                self.upstream_response_size.record(call.response_bytes, attributes)
+                self.upstream_items.add(call.item_count, attributes)
+                self.upstream_quota.add(call.quota_cost, attributes)
+
+    def record_serde(self, model: str, operation: str, duration: float, size: int):
+        attributes = {"youtube.model": model, "operation": operation}
+
+        self.serde_duration.record(duration, attributes)
+        self.serde_size.record(size, attributes)
+
+    def call_rejected(self, invocation: Invocation, call: UpstreamCall):
+        self.circuit_rejected.add(
+            1,
+            {
+                "youtube.resource": call.resource,
+                "youtube.tenant": self._tenant_label(invocation.tenant),
+            },
+        )
+
+    def circuit_changed(self, resource: str, state: CircuitState):
+        self.circuit_states[resource] = state
+
+    def _tenant_label(self, tenant: str) -> str:
+        return tenant if tenant in self.tenants else OTHER_TENANT
+
+    def _observe_circuits(self, options: CallbackOptions) -> Iterator[Observation]:
+        for resource, state in list(self.circuit_states.items()):
+            yield Observation(_CIRCUIT_STATES[state], {"youtube.resource": resource})
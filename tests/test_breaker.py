@@ -0,0 +1,210 @@
+import time
+import types
+
+import httplib2
+import pytest
+from googleapiclient.errors import HttpError
+
+from restate_youtube import Executor, ListVideosRequest
+from restate_youtube.breaker import (
+    CircuitBreaker,
+    CircuitOpenError,
+    CircuitState,
+    is_failure,
+)
+from restate_youtube.deadline import CancelScope, DeadlineExceeded
+
+RESOURCE = "videos"
+
+
+class Clock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def monotonic(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch) -> Clock:
+    clock = Clock()
+    monkeypatch.setattr(
+        "restate_youtube.breaker.time", types.SimpleNamespace(monotonic=clock.monotonic)
+    )
+
+    return clock
+
+
+def http_error(status: int) -> HttpError:
+    return HttpError(httplib2.Response({"status": status}), b"{}")
+
+
+def call(
+    breaker: CircuitBreaker,
+    error: BaseException | None = None,
+    duration: float = 0.1,
+) -> CircuitState | None:
+    """Make a call through the breaker and return the state it changed to."""
+    changed = breaker.allow(RESOURCE)
+
+    return breaker.record(RESOURCE, duration, error) or changed
+
+
+def open_circuit(breaker: CircuitBreaker):
+    for _ in range(breaker.min_calls):
+        call(breaker, http_error(503))
+
+    assert breaker.state(RESOURCE) == CircuitState.OPEN
+
+
+def test_is_failure():
+    assert not is_failure(None)
+    assert not is_failure(http_error(404))
+    assert not is_failure(http_error(403))
+    assert is_failure(http_error(429))
+    assert is_failure(http_error(500))
+    assert is_failure(TimeoutError())
+
+
+def test_opens_at_failure_rate(clock: Clock):
+    breaker = CircuitBreaker(min_calls=4, failure_rate_threshold=0.5)
+
+    assert call(breaker) is None
+    assert call(breaker) is None
+    assert call(breaker, http_error(500)) is None
+    # Half of the minimum number of calls failed
+    assert call(breaker, http_error(500)) == CircuitState.OPEN
+
+    with pytest.raises(CircuitOpenError):
+        breaker.allow(RESOURCE)
+
+
+def test_client_errors_do_not_open(clock: Clock):
+    breaker = CircuitBreaker(min_calls=4)
+
+    for _ in range(10):
+        assert call(breaker, http_error(404)) is None
+
+    assert breaker.state(RESOURCE) == CircuitState.CLOSED
+
+
+def test_opens_at_slow_call_rate(clock: Clock):
+    breaker = CircuitBreaker(
+        min_calls=4, slow_call_duration=1.0, slow_call_rate_threshold=0.75
+    )
+
+    assert call(breaker) is None
+    for _ in range(2):
+        assert call(breaker, duration=2.0) is None
+
+    assert call(breaker, duration=2.0) == CircuitState.OPEN
+
+
+def test_outcomes_leave_the_window(clock: Clock):
+    breaker = CircuitBreaker(min_calls=4, window=60.0)
+
+    for _ in range(3):
+        call(breaker, http_error(500))
+
+    clock.now += 61
+    assert call(breaker, http_error(500)) is None
+
+    assert breaker.state(RESOURCE) == CircuitState.CLOSED
+
+
+def test_closes_after_successful_probes(clock: Clock):
+    breaker = CircuitBreaker(min_calls=4, open_duration=30.0, half_open_calls=2)
+    open_circuit(breaker)
+
+    clock.now += 29
+    with pytest.raises(CircuitOpenError) as e:
+        breaker.allow(RESOURCE)
+
+    assert e.value.retry_after == pytest.approx(1)
+
+    clock.now += 1
+    assert breaker.allow(RESOURCE) == CircuitState.HALF_OPEN
+    assert breaker.allow(RESOURCE) is None
+
+    # Probes are in flight
+    with pytest.raises(CircuitOpenError):
+        breaker.allow(RESOURCE)
+
+    assert breaker.record(RESOURCE, 0.1) is None
+    assert breaker.record(RESOURCE, 0.1) == CircuitState.CLOSED
+    assert call(breaker) is None
+
+
+def test_reopens_after_failed_probe(clock: Clock):
+    breaker = CircuitBreaker(min_calls=4, open_duration=30.0, half_open_calls=2)
+    open_circuit(breaker)
+
+    clock.now += 30
+    assert call(breaker, http_error(503)) == CircuitState.OPEN
+
+    with pytest.raises(CircuitOpenError):
+        breaker.allow(RESOURCE)
+
+
+def test_circuits_are_per_resource(clock: Clock):
+    breaker = CircuitBreaker(min_calls=4)
+    open_circuit(breaker)
+
+    assert breaker.allow("channels") is None
+    assert breaker.state("channels") == CircuitState.CLOSED
+
+
+def test_aborted_probe_does_not_close(clock: Clock):
+    breaker = CircuitBreaker(min_calls=4, open_duration=30.0, half_open_calls=1)
+    open_circuit(breaker)
+
+    clock.now += 30
+    assert breaker.allow(RESOURCE) == CircuitState.HALF_OPEN
+    breaker.cancel(RESOURCE)
+
+    assert breaker.state(RESOURCE) == CircuitState.HALF_OPEN
+
+    # The probe slot is free again, and a failed probe still reopens
+    assert call(breaker, http_error(503)) == CircuitState.OPEN
+
+
+def test_aborted_calls_are_not_recorded(clock: Clock):
+    breaker = CircuitBreaker(min_calls=4)
+
+    for _ in range(10):
+        breaker.allow(RESOURCE)
+        breaker.cancel(RESOURCE)
+
+    # Successes would have diluted the failure rate
+    for _ in range(3):
+        assert call(breaker, http_error(500)) is None
+
+    assert call(breaker, http_error(500)) == CircuitState.OPEN
+
+
+def test_executor_does_not_record_aborted_calls(clock: Clock):
+    breaker = CircuitBreaker(min_calls=4, open_duration=30.0, half_open_calls=1)
+    open_circuit(breaker)
+    clock.now += 30
+
+    class Client:
+        def videos(self):
+            return self
+
+        def list(self, **params):
+            return self
+
+        def execute(self, http=None, num_retries=0):
+            time.sleep(0.1)
+            raise TimeoutError()
+
+    executor = Executor(Client(), circuit_breaker=breaker)
+    request = ListVideosRequest.model_validate(
+        {"part": "snippet", "chart": "mostPopular"}
+    )
+
+    # The caller's deadline passed during the probe
+    with pytest.raises(DeadlineExceeded):
+        CancelScope(time.time() + 0.05).run(executor.list_videos, request)
+
+    assert breaker.state(RESOURCE) == CircuitState.HALF_OPEN
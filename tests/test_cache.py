@@ -0,0 +1,81 @@
+import sqlite3
+from pathlib import Path
+
+import pytest
+
+from restate_youtube import SQLiteResponseCache
+
+
+@pytest.fixture
+def path(tmp_path: Path) -> Path:
+    return tmp_path / "cache.db"
+
+
+def test_get_and_set(path: Path):
+    cache = SQLiteResponseCache(path, ttls={"videos": 60})
+
+    assert cache.get("videos", "a") is None
+
+    cache.set("videos", "a", b"content")
+    cache.set("channels", "b", b"content")
+
+    assert cache.get("videos", "a") == b"content"
+    # Resources without a TTL are not cached
+    assert cache.get("channels", "b") is None
+
+
+def test_hits_are_counted_without_writes(path: Path):
+    cache = SQLiteResponseCache(path)
+    cache.set("videos", "a", b"content")
+    changes = cache._db.total_changes
+
+    for _ in range(3):
+        cache.get("videos", "a")
+
+    assert cache._db.total_changes == changes
+    assert cache.hits("videos", "a") == 3
+
+    # Replacing the response resets its hits
+    cache.set("videos", "a", b"content")
+    assert cache.hits("videos", "a") == 0
+
+
+def test_hits_are_shared_once_flushed(path: Path):
+    cache = SQLiteResponseCache(path)
+    cache.hit_flush_interval = 0
+    cache.set("videos", "a", b"content")
+
+    cache.get("videos", "a")
+    cache.get("videos", "a")
+
+    assert SQLiteResponseCache(path).hits("videos", "a") == 2
+
+
+def test_locked_database_skips_stores(path: Path):
+    cache = SQLiteResponseCache(path)
+    cache.set("videos", "a", b"old")
+    cache._db.execute("PRAGMA busy_timeout = 10")
+
+    other = sqlite3.connect(path)
+    other.execute("BEGIN IMMEDIATE")
+    try:
+        cache.set("videos", "a", b"new")
+
+        # Reads don't wait for the writer
+        assert cache.get("videos", "a") == b"old"
+    finally:
+        other.rollback()
+        other.close()
+
+    cache.set("videos", "a", b"new")
+    assert cache.get("videos", "a") == b"new"
+
+
+def test_errors_are_misses(path: Path):
+    cache = SQLiteResponseCache(path)
+    cache.set("videos", "a", b"content")
+    cache._db.close()
+
+    assert cache.get("videos", "a") is None
+    assert cache.hits("videos", "a") == 0
+    cache.set("videos", "a", b"content")
@@ -0,0 +1,39 @@
+from typing import Any
+
+from restate_youtube import Executor, ListChartsRequest
+
+
+class Client:
+    """YouTube API client returning a single video per chart."""
+
+    def __init__(self):
+        self.calls: list[dict[str, Any]] = []
+
+    def videos(self):
+        return self
+
+    def list(self, **params: Any):
+        self.calls.append(params)
+
+        return self
+
+    def execute(self, http: Any = None, num_retries: int = 0) -> dict[str, Any]:
+        region_code = self.calls[-1]["regionCode"]
+
+        return {"items": [{"kind": "youtube#video", "id": f"video-{region_code}"}]}
+
+
+def test_list_charts_sends_enum_values():
+    client = Client()
+    request = ListChartsRequest.model_validate(
+        {"part": "snippet", "regionCodes": ["US", "HU"]}
+    )
+
+    response = Executor(client).list_charts(request)
+
+    assert [c.video_ids for c in response.charts] == [["video-US"], ["video-HU"]]
+    assert sorted(c["regionCode"] for c in client.calls) == ["HU", "US"]
+    for params in client.calls:
+        # The client formats values with str()
+        assert type(params["chart"]) is str
+        assert params["chart"] == "mostPopular"
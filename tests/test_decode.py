@@ -0,0 +1,173 @@
+import json
+from pathlib import Path
+from typing import Any
+
+import pytest
+from pydantic import BaseModel
+
+from restate_youtube import (
+    ListAllChannelsResponse,
+    ListAllCommentThreadsResponse,
+    ListAllPlaylistItemsResponse,
+    ListAllPlaylistsResponse,
+    ListAllVideosResponse,
+    ListChannelsResponse,
+    ListCommentThreadsResponse,
+    ListPlaylistItemsResponse,
+    ListPlaylistsResponse,
+    ListVideosResponse,
+)
+from restate_youtube.decode import Decoder, LazyDecoder, MsgspecDecoder, encode_json
+
+PAYLOADS = Path(__file__).parent / "payloads"
+
+RESPONSES = [
+    ("videos", ListVideosResponse),
+    ("videos", ListAllVideosResponse),
+    ("channels", ListChannelsResponse),
+    ("channels", ListAllChannelsResponse),
+    ("playlists", ListPlaylistsResponse),
+    ("playlists", ListAllPlaylistsResponse),
+    ("playlist_items", ListPlaylistItemsResponse),
+    ("playlist_items", ListAllPlaylistItemsResponse),
+    ("comment_threads", ListCommentThreadsResponse),
+    ("comment_threads", ListAllCommentThreadsResponse),
+]
+
+
+def load(name: str) -> Any:
+    return json.loads((PAYLOADS / f"{name}.json").read_bytes())
+
+
+def dump(response: Any) -> Any:
+    if isinstance(response, BaseModel):
+        return response.model_dump(mode="json", by_alias=True)
+
+    # Structs of the msgspec decoder
+    return json.loads(encode_json(response))
+
+
+def read_parts(response: Any):
+    """Read every part of lazy items, so they are validated like the others."""
+    for item in response.items:
+        for name in type(item).model_fields:
+            getattr(item, name)
+
+
+@pytest.fixture(params=["lazy", "msgspec"])
+def decoder(request) -> Decoder:
+    if request.param == "msgspec":
+        pytest.importorskip("msgspec")
+        return MsgspecDecoder()
+
+    return LazyDecoder()
+
+
+@pytest.mark.parametrize(("payload", "model"), RESPONSES)
+def test_output_parity(decoder: Decoder, payload: str, model: type[BaseModel]):
+    data = load(payload)
+    expected = Decoder().validate(model, data)
+
+    response = decoder.validate(model, decoder.loads(json.dumps(data).encode()))
+    if isinstance(decoder, LazyDecoder):
+        read_parts(response)
+
+    assert dump(response) == dump(expected)
+
+
+def test_lazy_decoder_returns_unread_parts_as_received():
+    data = load("videos")
+
+    response = LazyDecoder().validate(ListVideosResponse, data)
+
+    assert dump(response)["items"][0]["statistics"] == data["items"][0]["statistics"]
+
+
+@pytest.mark.parametrize("deep", [False, True])
+def test_lazy_copies_have_their_own_parts(deep: bool):
+    video = LazyDecoder().validate(ListVideosResponse, load("videos")).items[0]
+
+    copied = video.model_copy(deep=deep)
+    title = copied.snippet.title
+
+    assert video.snippet.title == title
+    assert dump(copied) == dump(video)
+
+
+def test_lazy_copies_replace_updated_parts():
+    video = LazyDecoder().validate(ListVideosResponse, load("videos")).items[0]
+
+    copied = video.model_copy(update={"statistics": None})
+
+    assert copied.model_dump()["statistics"] is None
+    assert video.model_dump()["statistics"] is not None
+
+
+def test_lazy_dumps_filter_unread_parts():
+    data = load("videos")
+    video = LazyDecoder().validate(ListVideosResponse, data).items[0]
+
+    assert "snippet" not in video.model_dump(exclude={"snippet"})
+    assert video.model_dump(include={"id"}) == {"id": data["items"][0]["id"]}
+    assert video.model_dump(include={"id": True, "snippet": {"title"}}) == {
+        "id": data["items"][0]["id"],
+        "snippet": {"title": data["items"][0]["snippet"]["title"]},
+    }
+
+    response = LazyDecoder().validate(ListVideosResponse, data)
+    dumped = response.model_dump(exclude={"items": {"__all__": {"statistics"}}})
+    assert all("statistics" not in item for item in dumped["items"])
+
+
+def durations(response: Any) -> list[int | None]:
+    return [
+        v.content_details.duration_seconds for v in response.items if v.content_details
+    ]
+
+
+def test_property_parity(decoder: Decoder):
+    data = load("videos")
+    expected = Decoder().validate(ListVideosResponse, data)
+
+    response = decoder.validate(ListVideosResponse, data)
+
+    assert durations(expected) == [253, 93784]
+    assert durations(response) == durations(expected)
+
+
+def test_structs_have_model_properties():
+    pytest.importorskip("msgspec")
+    decoder = MsgspecDecoder()
+
+    for _, model in RESPONSES:
+        decoder.struct(model)
+
+    # Every nested model was mirrored by generating the response Structs
+    for model, struct in decoder._structs.items():
+        properties = {
+            name
+            for cls in model.__mro__
+            for name, attr in vars(cls).items()
+            if isinstance(attr, property)
+            and issubclass(cls, BaseModel)
+            and cls is not BaseModel
+        }
+        assert all(hasattr(struct, name) for name in properties), model.__name__
+
+
+def test_msgspec_results_use_struct_aware_serde():
+    pytest.importorskip("msgspec")
+    from restate.serde import PydanticJsonSerde
+
+    from restate_youtube import Executor
+    from restate_youtube.restate import _serdes
+
+    decoder = MsgspecDecoder()
+    serde, journal_serde = _serdes(
+        Executor(None, decoder=decoder), PydanticJsonSerde, None
+    )
+    response = decoder.validate(ListVideosResponse, load("videos"))
+
+    for s in (serde, journal_serde):
+        buf = s(ListVideosResponse).serialize(response)
+        assert json.loads(buf) == dump(response)
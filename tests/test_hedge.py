@@ -0,0 +1,68 @@
+import threading
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from typing import Any
+
+from restate_youtube import Executor, Hedger, ListVideosRequest
+from restate_youtube.observer import Invocation, Observer
+
+
+class Client:
+    """YouTube API client answering calls after the given delays, in order."""
+
+    def __init__(self, delays: list[float]):
+        self.delays = delays
+        self._lock = threading.Lock()
+
+    def videos(self):
+        return self
+
+    def list(self, **params: Any):
+        return self
+
+    def execute(self, http: Any = None, num_retries: int = 0) -> dict[str, Any]:
+        with self._lock:
+            delay = self.delays.pop(0)
+
+        time.sleep(delay)
+
+        return {"items": []}
+
+
+class Invocations(Observer):
+    def __init__(self):
+        self.invocations: list[Invocation] = []
+
+    @contextmanager
+    def invocation(self, invocation: Invocation) -> Iterator[None]:
+        self.invocations.append(invocation)
+        yield
+
+
+def test_lost_attempts_are_kept_without_their_time():
+    observer = Invocations()
+    executor = Executor(
+        # The first call is a sample, then the primary attempt is slow
+        Client([0.0, 0.5, 0.0]),
+        observer=observer,
+        hedger=Hedger(min_samples=1, budget=1, min_delay=0.01),
+    )
+    request = ListVideosRequest.model_validate(
+        {"part": "snippet", "chart": "mostPopular"}
+    )
+
+    executor.list_videos(request)
+    executor.list_videos(request)
+
+    invocation = observer.invocations[1]
+    # The primary attempt finishes in the background
+    deadline = time.monotonic() + 5
+    while len(invocation.calls) < 2 and time.monotonic() < deadline:
+        time.sleep(0.01)
+
+    primary, hedge = sorted(invocation.calls, key=lambda call: call.hedge)
+    assert hedge.hedge and not hedge.lost
+    assert primary.lost
+    assert primary.network_time >= 0.5
+    assert invocation.network_time == hedge.network_time
@@ -0,0 +1,98 @@
+from typing import Any
+
+from restate_youtube.model_playlist_diff import PlaylistIndex
+from restate_youtube.playlist_diff import PlaylistDiffer, _increasing
+
+
+def item(item_id: str, etag: str | None = None) -> dict[str, Any]:
+    return {
+        "id": item_id,
+        "etag": etag or f"etag-{item_id}",
+        "contentDetails": {"videoId": f"video-{item_id}"},
+    }
+
+
+def diff(
+    index: PlaylistIndex | None,
+    pages: list[list[dict[str, Any]]],
+    etags: list[str] | None = None,
+):
+    differ = PlaylistDiffer(index)
+    for i, page in enumerate(pages):
+        differ.page(etags[i] if etags else None, page)
+
+    return differ.result()
+
+
+def baseline(*item_ids: str) -> PlaylistIndex:
+    return diff(None, [[item(i) for i in item_ids]]).index
+
+
+def changes(entries) -> list[tuple[str, int, int | None]]:
+    return [(c.item_id, c.position, c.previous_position) for c in entries]
+
+
+def test_baseline():
+    result = diff(None, [[item("a"), item("b")], [item("c")]], ["p1", "p2"])
+
+    assert result.diff.baseline
+    assert result.diff.item_count == 3
+    assert result.diff.pages == 2
+    assert not result.diff.added
+    assert result.index.item_ids == ["a", "b", "c"]
+    assert result.index.video_ids == ["video-a", "video-b", "video-c"]
+    assert result.index.page_etags == ["p1", "p2"]
+
+
+def test_added_and_removed():
+    result = diff(baseline("a", "b", "c"), [[item("a"), item("d"), item("c")]])
+
+    assert not result.diff.baseline
+    assert changes(result.diff.added) == [("d", 1, None)]
+    assert changes(result.diff.removed) == [("b", 1, None)]
+    assert result.diff.removed[0].video_id == "video-b"
+    # Inserting or removing an item doesn't move the ones after it
+    assert not result.diff.moved
+
+
+def test_moved():
+    result = diff(
+        baseline("a", "b", "c", "d"),
+        [[item("b"), item("c"), item("d"), item("a")]],
+    )
+
+    # Moving a single item is fewer moves than moving the others around it
+    assert changes(result.diff.moved) == [("a", 3, 0)]
+    assert not result.diff.added
+    assert not result.diff.removed
+
+
+def test_updated():
+    result = diff(baseline("a", "b"), [[item("a"), item("b", etag="changed")]])
+
+    assert changes(result.diff.updated) == [("b", 1, 1)]
+    assert not result.diff.moved
+
+
+def test_unchanged_pages_are_taken_from_the_index():
+    index = diff(None, [[item("a"), item("b")], [item("c")]], ["p1", "p2"]).index
+
+    # The first page is proven unchanged by its etag: its items aren't diffed
+    result = diff(
+        index,
+        [[item("a", etag="x"), item("b", etag="x")], [item("c"), item("d")]],
+        ["p1", "p2-changed"],
+    )
+
+    assert result.diff.unchanged_pages == 1
+    assert result.index.item_ids == ["a", "b", "c", "d"]
+    assert changes(result.diff.added) == [("d", 3, None)]
+    assert not result.diff.removed
+    assert not result.diff.updated
+
+
+def test_increasing():
+    assert list(_increasing([])) == []
+    assert list(_increasing([0, 1, 2])) == [1, 1, 1]
+    assert list(_increasing([1, 2, 3, 0])) == [1, 1, 1, 0]
+    assert sum(_increasing([3, 0, 4, 1, 2])) == 3
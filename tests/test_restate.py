@@ -0,0 +1,54 @@
+import asyncio
+
+import pytest
+import restate
+
+from restate_youtube import NotConfiguredError, NotFoundError
+from restate_youtube.deadline import DeadlineExceeded
+from restate_youtube.restate import _run
+
+
+class Request:
+    def __init__(self):
+        self.headers: dict[str, str] = {}
+        self.attempt_finished_event = asyncio.Event()
+
+
+class Context:
+    """Restate context running actions in place."""
+
+    def __init__(self):
+        self._request = Request()
+
+    def request(self):
+        return self._request
+
+    async def run_typed(self, name, action, options, **kwargs):
+        return action(**kwargs)
+
+
+@pytest.mark.parametrize(
+    ("error", "status_code"),
+    [
+        (NotFoundError("Channel not found: UC"), 404),
+        (NotConfiguredError("Prefetching requires a response cache"), 501),
+        (DeadlineExceeded("Deadline passed"), 504),
+    ],
+)
+def test_non_retryable_errors_are_terminal(error: Exception, status_code: int):
+    def action(request):
+        raise error
+
+    with pytest.raises(restate.TerminalError) as e:
+        asyncio.run(_run(Context(), "action", action, None, None))
+
+    assert e.value.status_code == status_code
+    assert str(error) in str(e.value)
+
+
+def test_other_errors_are_retried():
+    def action(request):
+        raise TimeoutError()
+
+    with pytest.raises(TimeoutError):
+        asyncio.run(_run(Context(), "action", action, None, None))
@@ -0,0 +1,174 @@
+import threading
+import time
+
+import pytest
+
+from restate_youtube.deadline import Cancelled, CancelScope, DeadlineExceeded
+from restate_youtube.scheduler import FairScheduler, TenantPolicy
+
+
+def wait_for(condition, timeout: float = 5.0):
+    end = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < end, "timed out"
+        time.sleep(0.001)
+
+
+def start(
+    scheduler: FairScheduler, tenant: str, granted: list[str]
+) -> threading.Thread:
+    """Queue a call of a tenant that records when it is granted a slot."""
+
+    def run():
+        with scheduler.slot(tenant):
+            granted.append(tenant)
+
+    queued = len(scheduler._waiting)
+    thread = threading.Thread(target=run)
+    thread.start()
+    wait_for(lambda: len(scheduler._waiting) > queued)
+
+    return thread
+
+
+def grant_order(scheduler: FairScheduler, tenants: list[str]) -> list[str]:
+    """Queue calls in order behind a held slot and return the order they run in."""
+    granted: list[str] = []
+
+    # Hold the only slot, so every call queues
+    scheduler.acquire("blocker")
+    threads = [start(scheduler, tenant, granted) for tenant in tenants]
+    scheduler.release("blocker")
+
+    for thread in threads:
+        thread.join(5)
+
+    return granted
+
+
+def test_other_tenants_do_not_queue_behind_a_crawl():
+    scheduler = FairScheduler(max_concurrency=1)
+
+    order = grant_order(scheduler, ["crawler"] * 4 + ["user"])
+
+    assert order == ["crawler", "user", "crawler", "crawler", "crawler"]
+
+
+def test_slots_are_shared_by_weight():
+    scheduler = FairScheduler(
+        max_concurrency=1,
+        policies={"a": TenantPolicy.model_validate({"weight": 2})},
+    )
+
+    order = grant_order(scheduler, ["a"] * 4 + ["b"] * 4)
+
+    assert order == ["a", "b", "a", "a", "b", "a", "b", "b"]
+
+
+def test_tenant_concurrency_is_capped():
+    scheduler = FairScheduler(
+        max_concurrency=2,
+        policies={"a": TenantPolicy.model_validate({"maxConcurrency": 1})},
+    )
+    granted: list[str] = []
+
+    scheduler.acquire("a")
+    waiting = start(scheduler, "a", granted)
+
+    # The free slot goes to another tenant
+    with scheduler.slot("b"):
+        assert granted == []
+
+    scheduler.release("a")
+    waiting.join(5)
+
+    assert granted == ["a"]
+
+
+def test_quota_rate_is_capped():
+    scheduler = FairScheduler(
+        policies={"a": TenantPolicy.model_validate({"quotaRate": 20, "quotaBurst": 1})},
+    )
+
+    began = time.monotonic()
+    for _ in range(3):
+        with scheduler.slot("a"):
+            pass
+
+    # The burst covers a single call: the others wait for 1/20 s each
+    assert time.monotonic() - began >= 0.09
+
+
+def test_queued_call_leaves_at_deadline():
+    scheduler = FairScheduler(max_concurrency=1)
+    scheduler.acquire("a")
+
+    with pytest.raises(DeadlineExceeded):
+        scheduler.acquire("b", scope=CancelScope(time.time() + 0.05))
+
+    assert scheduler._waiting == []
+
+    # The queue still works
+    granted: list[str] = []
+    waiting = start(scheduler, "c", granted)
+    scheduler.release("a")
+    waiting.join(5)
+
+    assert granted == ["c"]
+
+
+def test_queued_call_leaves_when_cancelled():
+    scheduler = FairScheduler(max_concurrency=1)
+    scope = CancelScope()
+    errors: list[BaseException] = []
+
+    def run():
+        try:
+            scheduler.acquire("b", scope=scope)
+        except Cancelled as e:
+            errors.append(e)
+
+    scheduler.acquire("a")
+    thread = threading.Thread(target=run)
+    thread.start()
+    wait_for(lambda: len(scheduler._waiting) == 1)
+
+    scope.cancel()
+    thread.join(5)
+
+    assert len(errors) == 1
+    assert scheduler._waiting == []
+    scheduler.release("a")
+
+
+def test_idle_tenants_without_policy_are_forgotten():
+    scheduler = FairScheduler(policies={"a": TenantPolicy()})
+
+    for tenant in ["a", "b", "c"]:
+        with scheduler.slot(tenant):
+            pass
+
+    assert set(scheduler._tenants) == {"a"}
+
+
+def test_tenants_are_kept_until_their_quota_refills():
+    scheduler = FairScheduler(
+        default_policy=TenantPolicy.model_validate({"quotaRate": 20, "quotaBurst": 1})
+    )
+
+    with scheduler.slot("a"):
+        pass
+
+    assert set(scheduler._tenants) == {"a"}
+
+    # Forgetting it would grant a full bucket: the next call still waits
+    began = time.monotonic()
+    with scheduler.slot("a"):
+        pass
+
+    assert time.monotonic() - began >= 0.04
+
+    time.sleep(0.06)
+    scheduler._sweep()
+
+    assert scheduler._tenants == {}
@@ -0,0 +1,119 @@
+import base64
+import random
+
+import pytest
+
+from restate_youtube.seen import SeenIds, pack_video_id
+
+VIDEO_IDS = ["dQw4w9WgXcQ", "9bZkp7q5F-U", "jfKfPfyJRdk"]
+OTHER_IDS = [
+    "UC_x5XG1OV2P6uZZ5FSM9Ttw",
+    "PLBCF2DAC6FFB574DE",
+    "Ugzge340dBgB75hWBm54AaABAg",
+]
+
+
+def video_ids(count: int) -> list[str]:
+    """Return random video IDs, encoded the way YouTube does."""
+    rng = random.Random(count)
+
+    return [
+        base64.urlsafe_b64encode(rng.getrandbits(64).to_bytes(8, "big")).decode()[:11]
+        for _ in range(count)
+    ]
+
+
+def test_pack_video_id():
+    assert pack_video_id("AAAAAAAAAAE") == 1
+    assert pack_video_id("dQw4w9WgXcQ") is not None
+    # The last character only holds 4 bits
+    assert pack_video_id("dQw4w9WgXcR") is None
+    assert pack_video_id("UC_x5XG1OV2P6uZZ5FSM9Ttw") is None
+
+
+def test_membership():
+    seen = SeenIds(VIDEO_IDS + OTHER_IDS)
+
+    for id in VIDEO_IDS + OTHER_IDS:
+        assert id in seen
+
+    assert "aaaaaaaaaaa" not in seen
+    assert "dQw4w9WgXcR" not in seen
+    assert "UC_other" not in seen
+    assert 1 not in seen
+
+
+def test_duplicates_are_counted_once():
+    seen = SeenIds(VIDEO_IDS + OTHER_IDS)
+    seen.update(VIDEO_IDS + OTHER_IDS)
+
+    assert len(seen) == len(VIDEO_IDS) + len(OTHER_IDS)
+
+
+def test_merged_ids(monkeypatch):
+    monkeypatch.setattr(SeenIds, "merge_threshold", 8)
+    ids = video_ids(1000)
+
+    seen = SeenIds(ids)
+
+    assert len(seen._packed) > 0
+    assert all(id in seen for id in ids)
+    assert len(seen) == len(set(ids))
+    assert sorted(seen) == sorted(set(ids))
+
+
+def test_round_trip():
+    ids = video_ids(100) + OTHER_IDS
+    seen = SeenIds(ids)
+
+    decoded = SeenIds.decode(seen.encode())
+
+    assert sorted(decoded) == sorted(ids)
+    assert all(id in decoded for id in ids)
+    assert decoded.to_bytes() == seen.to_bytes()
+
+
+def test_round_trip_empty():
+    decoded = SeenIds.decode(SeenIds().encode())
+
+    assert len(decoded) == 0
+    assert list(decoded) == []
+
+
+def test_encoding_is_independent_of_insertion_order():
+    ids = video_ids(50) + OTHER_IDS
+
+    assert SeenIds(ids).encode() == SeenIds(reversed(ids)).encode()
+
+
+def test_copy_is_independent():
+    seen = SeenIds(VIDEO_IDS)
+    copy = seen.copy()
+    copy.add("UC_x5XG1OV2P6uZZ5FSM9Ttw")
+    copy.add("AAAAAAAAAAE")
+
+    assert "UC_x5XG1OV2P6uZZ5FSM9Ttw" not in seen
+    assert "AAAAAAAAAAE" not in seen
+    assert len(copy) == len(seen) + 2
+
+
+@pytest.mark.parametrize(
+    "token",
+    [
+        "not base64!",
+        "",
+        # Wrong version
+        base64.urlsafe_b64encode(b"\x02\x00\x00\x00\x00").decode(),
+        # Fewer IDs than the count
+        base64.urlsafe_b64encode(b"\x01\x02\x00\x00\x00" + bytes(8)).decode(),
+        # Unsorted IDs
+        base64.urlsafe_b64encode(
+            b"\x01\x02\x00\x00\x00"
+            + (2).to_bytes(8, "little")
+            + (1).to_bytes(8, "little")
+        ).decode(),
+    ],
+)
+def test_decode_invalid(token: str):
+    with pytest.raises(ValueError, match="Invalid seen IDs"):
+        SeenIds.decode(token)
@@ -0,0 +1,54 @@
+import pytest
+
+pytest.importorskip("opentelemetry.sdk")
+
+from opentelemetry.sdk.metrics import MeterProvider
+from opentelemetry.sdk.metrics.export import InMemoryMetricReader
+
+from restate_youtube import ListVideosRequest
+from restate_youtube.observer import Invocation, UpstreamCall
+from restate_youtube.telemetry import TelemetryObserver
+
+
+def tenants(reader: InMemoryMetricReader, name: str) -> set[str]:
+    data = reader.get_metrics_data()
+
+    return {
+        point.attributes["youtube.tenant"]
+        for resource_metrics in data.resource_metrics
+        for scope_metrics in resource_metrics.scope_metrics
+        for metric in scope_metrics.metrics
+        if metric.name == name
+        for point in metric.data.data_points
+    }
+
+
+def test_only_known_tenants_are_labeled():
+    reader = InMemoryMetricReader()
+    observer = TelemetryObserver(
+        meter_provider=MeterProvider(metric_readers=[reader]),
+        tenants=["crawler"],
+    )
+
+    request = ListVideosRequest.model_validate(
+        {"part": "snippet", "chart": "mostPopular"}
+    )
+
+    for tenant in ["crawler", "default", "caller-1", "caller-2"]:
+        invocation = Invocation(name="list_videos", request=request, tenant=tenant)
+        with (
+            observer.invocation(invocation),
+            observer.upstream_call(invocation, UpstreamCall(resource="videos")),
+        ):
+            pass
+
+    assert tenants(reader, "youtube.upstream.duration") == {
+        "crawler",
+        "default",
+        "other",
+    }
+    assert tenants(reader, "youtube.invocation.phase.duration") == {
+        "crawler",
+        "default",
+        "other",
+    }